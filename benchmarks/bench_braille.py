@@ -0,0 +1,70 @@
+"""
+Benchmark Braille chart rasterization.
+
+Usage:
+  python benchmarks/bench_braille.py [--width 200] [--height 40] [--series 3]
+
+Fills HistoryBuffers with twice the chart width in samples (one per dot
+column) and times BrailleChart.rasterize() reading them in place, plus a
+full render through an in-memory Rich Console for comparison.
+"""
+
+from __future__ import annotations
+
+import argparse
+import io
+import math
+import time
+
+from rich.console import Console
+
+from neonhud.ui.braille import BrailleChart
+from neonhud.utils.history import HistoryBuffer
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--width", type=int, default=200)
+    ap.add_argument("--height", type=int, default=40)
+    ap.add_argument("--series", type=int, default=3)
+    ap.add_argument("--frames", type=int, default=500)
+    args = ap.parse_args()
+
+    n = 2 * args.width
+    buffers = []
+    for s in range(args.series):
+        buf = HistoryBuffer(maxlen=n)
+        for i in range(n + 17):  # wrapped, so view() returns two halves
+            buf.push(50.0 + 45.0 * math.sin(i / (8.0 + 5 * s) + s))
+        buffers.append(buf)
+    styles = ["green", "magenta", "cyan", "yellow", "red"]
+    chart = BrailleChart(
+        [(b, styles[i % len(styles)]) for i, b in enumerate(buffers)],
+        height=args.height,
+        peak=100.0,
+    )
+
+    t0 = time.perf_counter()
+    for _ in range(args.frames):
+        chart.rasterize(args.width)
+    raster_us = (time.perf_counter() - t0) / args.frames * 1e6
+
+    console = Console(
+        file=io.StringIO(),
+        width=args.width,
+        force_terminal=True,
+        color_system="truecolor",
+    )
+    frames = max(1, args.frames // 10)
+    t0 = time.perf_counter()
+    for _ in range(frames):
+        console.print(chart)
+    render_us = (time.perf_counter() - t0) / frames * 1e6
+
+    print(f"{args.width}x{args.height} cells, {args.series} series of {n} samples")
+    print(f"  rasterize       {raster_us:9.1f} µs/frame")
+    print(f"  console.print   {render_us:9.1f} µs/frame")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,109 @@
+"""
+Benchmark the Gorilla codec (utils.gorilla) on typical NeonHud series.
+
+Usage:
+  python benchmarks/bench_gorilla.py [--points 3600] [--rounds 5] [--recording FILE]
+
+For synthetic CPU %, memory %, memory bytes and network rate series (1 Hz,
+with occasional timestamp jitter), prints the compression ratio against raw
+float64 timestamp + value pairs and encode/decode throughput in points/s.
+With --recording, also compacts that file and reports bytes per frame.
+"""
+
+from __future__ import annotations
+
+import argparse
+import math
+import os
+import random
+import statistics
+import tempfile
+import time
+from typing import Dict, List, Optional, Tuple
+
+from neonhud.models.recording import compact, open_recording
+from neonhud.services import recorder
+from neonhud.utils import gorilla
+
+
+def _series(n: int, seed: int = 7) -> Dict[str, Tuple[List[float], Optional[int]]]:
+    rng = random.Random(seed)
+    cpu = [
+        round(min(100.0, max(0.0, 18 + 12 * math.sin(i / 90) + rng.gauss(0, 3))), 1)
+        for i in range(n)
+    ]
+    mem_pct = [
+        round(41.0 + (i // 120) * 0.1 + rng.choice((0, 0, 0, 0.1)), 1) for i in range(n)
+    ]
+    mem_used = [
+        float(3_400_000_000 + (i // 15) * 4096 * rng.randint(0, 3)) for i in range(n)
+    ]
+    net = [
+        0.0 if rng.random() < 0.55 else float(rng.randint(60, 90_000)) for _ in range(n)
+    ]
+    return {
+        "cpu %": (cpu, 1),
+        "mem %": (mem_pct, 1),
+        "mem bytes": (mem_used, 0),
+        "net B/s": (net, 0),
+    }
+
+
+def _timestamps(n: int) -> List[int]:
+    rng = random.Random(1)
+    base = 1_760_000_000_000
+    return [
+        base + i * 1000 + (rng.randint(-4, 4) if i % 7 == 0 else 0) for i in range(n)
+    ]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--points", type=int, default=3600)
+    parser.add_argument("--rounds", type=int, default=5)
+    parser.add_argument("--recording", type=str, default=None)
+    args = parser.parse_args()
+
+    ts = _timestamps(args.points)
+    for name, (values, decimals) in _series(args.points).items():
+        enc: List[float] = []
+        dec: List[float] = []
+        block = gorilla.encode_block(ts, values, decimals)
+        for _ in range(args.rounds):
+            t0 = time.perf_counter()
+            block = gorilla.encode_block(ts, values, decimals)
+            t1 = time.perf_counter()
+            block.decode()
+            t2 = time.perf_counter()
+            enc.append(t1 - t0)
+            dec.append(t2 - t1)
+        ratio = 16 * len(ts) / block.nbytes
+        print(
+            f"{name:<10} {ratio:5.1f}x  {8 * block.nbytes / len(ts):5.1f} bits/pt   "
+            f"encode {len(ts) / statistics.mean(enc) / 1e3:7.0f} kpt/s   "
+            f"decode {len(ts) / statistics.mean(dec) / 1e3:7.0f} kpt/s"
+        )
+
+    if args.recording:
+        with open_recording(args.recording) as rec:
+            cols = rec.columns
+        fd, out = tempfile.mkstemp(suffix=".nhz")
+        os.close(fd)
+        try:
+            t0 = time.perf_counter()
+            frames, size = compact(
+                args.recording, out, decimals=recorder.decimals(cols)
+            )
+            took = time.perf_counter() - t0
+            raw = os.path.getsize(args.recording)
+            print(
+                f"recording  {frames} frames: {raw / max(1, frames):.1f} -> "
+                f"{size / max(1, frames):.1f} bytes/frame ({raw / size:.1f}x) "
+                f"in {took:.2f}s"
+            )
+        finally:
+            os.unlink(out)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,52 @@
+"""
+Benchmark the process collector backends (psutil vs /proc fast path).
+
+Usage:
+  python benchmarks/bench_procs.py [--rounds 20] [--limit 15]
+
+Prints mean/min milliseconds per sample() call for each backend, plus the
+number of processes visible on this host.
+"""
+
+from __future__ import annotations
+
+import argparse
+import statistics
+import time
+
+from neonhud.collectors import procfs, procs
+
+
+def _bench(backend: procs.Backend, rounds: int, limit: int) -> list[float]:
+    procs.sample(limit=limit, backend=backend)  # warm-up / prime CPU deltas
+    timings: list[float] = []
+    for _ in range(rounds):
+        t0 = time.perf_counter()
+        procs.sample(limit=limit, backend=backend)
+        timings.append((time.perf_counter() - t0) * 1000.0)
+    return timings
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--rounds", type=int, default=20)
+    parser.add_argument("--limit", type=int, default=15)
+    args = parser.parse_args()
+
+    backends: list[procs.Backend] = ["psutil"]
+    if procfs.available():
+        backends.append("procfs")
+    else:
+        print("procfs backend unavailable on this host; benchmarking psutil only")
+
+    print(f"processes: {len(procfs.pids()) if procfs.available() else '?'}")
+    for backend in backends:
+        ms = _bench(backend, args.rounds, args.limit)
+        print(
+            f"{backend:<8} mean {statistics.mean(ms):8.2f} ms   "
+            f"min {min(ms):8.2f} ms   ({args.rounds} rounds)"
+        )
+
+
+if __name__ == "__main__":
+    main()
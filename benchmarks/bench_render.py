@@ -0,0 +1,94 @@
+"""
+Benchmark building and rendering the process table and dashboards.
+
+Usage:
+  python benchmarks/bench_render.py [--rows 200] [--frames 50] [--width 160]
+
+Renders into an in-memory Console (no terminal I/O) and prints ms/frame
+for: the process table with theme.styles (what build_table does), the
+same table with per-cell style strings (the previous behaviour, kept here
+as the baseline), and the full `dash` and `pro` layouts.
+"""
+
+from __future__ import annotations
+
+import argparse
+import io
+import statistics
+import time
+from typing import Any, Callable, Dict, List
+
+from rich.console import Console, RenderableType
+from rich.table import Table
+from rich.text import Text
+
+from neonhud.ui import dashboard, pro_dash, process_table
+from neonhud.ui.theme import Theme, get_theme
+
+
+def _rows(n: int) -> List[Dict[str, Any]]:
+    return [
+        {
+            "pid": 1000 + i,
+            "name": f"worker-{i}",
+            "cmdline": f"/usr/bin/worker --id {i} --queue jobs",
+            "cpu_percent": float((i * 37) % 100),
+            "rss_bytes": (i + 1) * 1_048_576,
+        }
+        for i in range(n)
+    ]
+
+
+def _string_styles_table(rows: List[Dict[str, Any]], th: Theme) -> Table:
+    """build_table as it was: every cell re-resolves a style string."""
+    table = Table(show_lines=False, expand=True, header_style=th.primary)
+    for name in ("PID", "NAME", "CMDLINE", "CPU%", "RSS"):
+        table.add_column(name, header_style=th.primary)
+    for r in rows:
+        style = th.warning if r["cpu_percent"] >= 80.0 else th.accent
+        table.add_row(
+            Text(str(r["pid"]), style=style),
+            Text(r["name"], style=style),
+            Text(r["cmdline"], style=style),
+            Text(f"{r['cpu_percent']:5.1f}", style=style),
+            Text(str(r["rss_bytes"]), style=style),
+        )
+    return table
+
+
+def _bench(console: Console, build: Callable[[], RenderableType], frames: int) -> float:
+    times: List[float] = []
+    for _ in range(frames):
+        t0 = time.perf_counter()
+        console.print(build())
+        times.append(time.perf_counter() - t0)
+        console.file = io.StringIO()
+    return 1e3 * statistics.median(times)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--rows", type=int, default=200)
+    parser.add_argument("--frames", type=int, default=50)
+    parser.add_argument("--width", type=int, default=160)
+    args = parser.parse_args()
+
+    th = get_theme("cyberpunk")
+    rows = _rows(args.rows)
+    console = Console(file=io.StringIO(), width=args.width, force_terminal=True)
+    cases: Dict[str, Callable[[], RenderableType]] = {
+        f"process table ({args.rows} rows), compiled": lambda: process_table.build_table(
+            rows, theme=th
+        ),
+        f"process table ({args.rows} rows), strings": lambda: _string_styles_table(
+            rows, th
+        ),
+        "dash": lambda: dashboard.build_dashboard(theme=th),
+        "pro": lambda: pro_dash.build_top(theme=th),
+    }
+    for name, build in cases.items():
+        print(f"{name:<40} {_bench(console, build, args.frames):7.2f} ms/frame")
+
+
+if __name__ == "__main__":
+    main()
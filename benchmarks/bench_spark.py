@@ -0,0 +1,81 @@
+"""
+Benchmark sparkline rendering on long histories.
+
+Usage:
+  python benchmarks/bench_spark.py [--points 3600] [--width 120] [--frames 200]
+
+Compares, per frame: the previous per-point loop (kept here as the
+baseline), sparkline() on the full window, sparkline() fitted to a
+terminal width, and SparkCache with one new sample per frame.
+"""
+
+from __future__ import annotations
+
+import argparse
+import math
+import random
+import time
+from typing import Callable, Sequence
+
+from neonhud.utils.history import HistoryBuffer
+from neonhud.utils.spark import DEFAULT_CHARS, SparkCache, clamp, sparkline
+
+
+def _baseline(values: Sequence[float], peak: float) -> str:
+    # The loop sparkline() used before the threshold table
+    levels = len(DEFAULT_CHARS) - 1
+    out = []
+    for v in values:
+        if math.isnan(v):
+            out.append(" ")
+            continue
+        idx = int(round(clamp(v / peak, 0.0, 1.0) * levels))
+        out.append(DEFAULT_CHARS[idx])
+    return "".join(out)
+
+
+def _time(fn: Callable[[], object], frames: int) -> float:
+    t0 = time.perf_counter()
+    for _ in range(frames):
+        fn()
+    return (time.perf_counter() - t0) / frames * 1e6
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--points", type=int, default=3600)
+    ap.add_argument("--width", type=int, default=120)
+    ap.add_argument("--frames", type=int, default=200)
+    args = ap.parse_args()
+
+    rng = random.Random(1)
+    buf = HistoryBuffer(maxlen=args.points)
+    buf.push(100.0)
+    for _ in range(args.points):
+        buf.push(rng.uniform(0.0, 90.0))
+    w = buf.window()
+    assert _baseline(w.values, w.max) == sparkline(w.values, peak=w.max)
+
+    cache = SparkCache()
+    cache.render("s", w)
+
+    def cached() -> None:
+        buf.push(rng.uniform(0.0, 90.0))
+        cache.render("s", buf.window())
+
+    rows = [
+        ("baseline loop", _time(lambda: _baseline(w.values, w.max), args.frames)),
+        ("sparkline", _time(lambda: sparkline(w.values, peak=w.max), args.frames)),
+        (
+            f"sparkline width={args.width}",
+            _time(lambda: sparkline(w.values, width=args.width), args.frames),
+        ),
+        ("SparkCache +1 sample", _time(cached, args.frames)),
+    ]
+    print(f"{args.points} points, {args.frames} frames")
+    for label, us in rows:
+        print(f"  {label:<24} {us:9.1f} µs/frame")
+
+
+if __name__ == "__main__":
+    main()
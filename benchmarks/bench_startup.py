@@ -0,0 +1,61 @@
+"""
+Benchmark `neonhud report` cold start.
+
+Usage:
+  python benchmarks/bench_startup.py [--runs 20] [--top 10]
+
+Runs `python -m neonhud.cli report` in fresh interpreters and prints the
+median and p90 wall time, then the slowest imports of one run
+(`python -X importtime`), which is where cold-start regressions show up.
+"""
+
+from __future__ import annotations
+
+import argparse
+import statistics
+import subprocess
+import sys
+import time
+from typing import List, Tuple
+
+
+def _importtime(top: int) -> List[Tuple[int, str]]:
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-m", "neonhud.cli", "report"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    rows: List[Tuple[int, str]] = []
+    for line in proc.stderr.splitlines():
+        if line.startswith("import time:") and "cumulative" not in line:
+            _, cumulative, name = line.split("|")
+            rows.append((int(cumulative), name.rstrip()))
+    return sorted(rows, reverse=True)[:top]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--runs", type=int, default=20)
+    parser.add_argument("--top", type=int, default=10)
+    args = parser.parse_args()
+
+    cmd = [sys.executable, "-m", "neonhud.cli", "report"]
+    times: List[float] = []
+    for _ in range(args.runs):
+        t0 = time.perf_counter()
+        subprocess.run(cmd, capture_output=True, check=True)
+        times.append(time.perf_counter() - t0)
+    times.sort()
+    p90 = times[min(len(times) - 1, int(0.9 * len(times)))]
+    print(
+        f"report cold start: median {1e3 * statistics.median(times):.1f} ms, "
+        f"p90 {1e3 * p90:.1f} ms over {args.runs} runs"
+    )
+    print("slowest imports (cumulative):")
+    for us, name in _importtime(args.top):
+        print(f"  {us / 1e3:7.1f} ms {name}")
+
+
+if __name__ == "__main__":
+    main()
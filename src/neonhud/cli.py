@@ -1,28 +1,307 @@
 """
 NeonHud CLI entrypoint.
+
+Imports are scoped to the subcommand that needs them: `report` runs from
+cron across a fleet and only needs the collectors and json, so Rich and
+the UI modules are loaded by the interactive views alone (see
+tests/test_startup.py for the import budget).
 """
 
 from __future__ import annotations
 
 import argparse
 import json
+import os
+import signal
 import sys
+import threading
 import time
-
-from rich.console import Console
-from rich.live import Live
+from typing import IO, TYPE_CHECKING, Any, Callable, Mapping, Optional
 
 from neonhud.core import config as core_config
 from neonhud.core.logging import get_logger
-from neonhud.models import snapshot
-from neonhud.collectors import procs
-from neonhud.ui.theme import get_theme
-from neonhud.ui import process_table, dashboard
-import neonhud.ui.pro_dash as pro_dash  # pro (gtop-style) view
+
+if TYPE_CHECKING:
+    from rich.console import Console, RenderableType
+
+    from neonhud.services.sampler import Frame, Sampler
+    from neonhud.ui.theme import Theme
+
+# Terminal size is polled this often between frames (resize -> re-render)
+RESIZE_POLL = 0.25
 
 log = get_logger()
 
 
+def _cadence(cfg: Mapping[str, Any]) -> Mapping[str, Any]:
+    """Per-collector periods from the optional `[cadence]` config table."""
+    table = cfg.get("cadence", {})
+    return table if isinstance(table, Mapping) else {}
+
+
+def _renderer(args: argparse.Namespace, cfg: Mapping[str, Any]) -> str:
+    """Live backend: --renderer, else config `renderer`, else "rich"."""
+    name = args.renderer or str(cfg.get("renderer", "rich")).lower()
+    return name if name in ("rich", "ansi") else "rich"
+
+
+def _frame_budget(cfg: Mapping[str, Any], interval: float) -> float:
+    """
+    Per-frame collection budget in seconds (config `frame_budget`, default
+    a quarter of the refresh interval, at most 0.5s).
+    """
+    try:
+        budget = float(cfg.get("frame_budget", 0.0))
+    except (TypeError, ValueError):
+        budget = 0.0
+    return budget if budget > 0.0 else min(0.5, interval / 4)
+
+
+class _LiveSettings:
+    """
+    Interval, theme and process limit of a running view. refresh() picks
+    up config file edits (the cached view changes identity); values given
+    on the command line stay fixed.
+    """
+
+    def __init__(self, args: argparse.Namespace) -> None:
+        self._args = args
+        self._cfg: Optional[Mapping[str, Any]] = None
+        self.interval = 2.0
+        self.limit = 15
+        self.theme_name = "classic"
+        self.theme: Theme
+        self.refresh()
+
+    @property
+    def cfg(self) -> Mapping[str, Any]:
+        assert self._cfg is not None
+        return self._cfg
+
+    def refresh(self) -> bool:
+        """Re-read settings if the config changed; True if anything did."""
+        from neonhud.ui.theme import get_theme
+
+        cfg = core_config.get_config()
+        if cfg is self._cfg:
+            return False
+        self._cfg = cfg
+        args = self._args
+        before = (self.interval, self.limit, self.theme_name)
+        if getattr(args, "interval", None) is not None:
+            self.interval = args.interval
+        else:
+            try:
+                self.interval = float(cfg.get("refresh_interval", 2.0))
+            except (TypeError, ValueError):
+                pass
+        if getattr(args, "limit", None) is not None:
+            self.limit = args.limit
+        else:
+            try:
+                self.limit = int(cfg.get("process_limit", 15))
+            except (TypeError, ValueError):
+                pass
+        if getattr(args, "theme", None) is not None:
+            self.theme_name = args.theme
+        else:
+            self.theme_name = str(cfg.get("theme", "classic"))
+        self.theme = get_theme(self.theme_name)
+        return (self.interval, self.limit, self.theme_name) != before
+
+
+def _run_live(
+    console: Console,
+    sampler: Sampler,
+    render: Callable[[Frame], RenderableType],
+    label: str,
+    screen: bool = False,
+    until: Optional[Callable[[], bool]] = None,
+    settings: Optional[_LiveSettings] = None,
+    renderer: str = "rich",
+) -> None:
+    """
+    Drive a Live view from a background Sampler: collectors run on the
+    sampler thread at a fixed cadence, this loop only renders the latest
+    published frame. Returns once `until()` is true (e.g. replay finished).
+    With `settings`, config file edits are applied between frames (the
+    check is a cached stat, at most once per second).
+
+    Rendering is event-driven (auto_refresh off): the screen is redrawn
+    once per new frame and when the terminal is resized, never on a timer.
+    `renderer="ansi"` swaps Rich's Live for ui.ansi.AnsiScreen, which sends
+    only the changed cells (always full-screen).
+    """
+    from rich.live import Live
+
+    from neonhud.ui.ansi import AnsiScreen, CountingWriter
+
+    display: Any
+    counter: Any
+    if renderer == "ansi":
+        display = counter = AnsiScreen(console)
+    else:
+        counter = CountingWriter(console.file)
+        console.file = counter  # type: ignore[assignment]
+        display = Live(console=console, auto_refresh=False, screen=screen)
+    renders = resizes = 0
+
+    def _log_stats() -> None:
+        log.info("Sampler stats: %s", sampler.stats().summary())
+        log.info(
+            "Output (%s): %d renders (%d after resize), %.0f bytes/render",
+            renderer,
+            renders,
+            resizes,
+            counter.bytes / renders if renders else 0.0,
+        )
+
+    try:
+        with sampler, display as live:
+            seq = 0
+            size = console.size
+            while True:
+                frame = sampler.wait(seq, timeout=RESIZE_POLL)
+                if frame is None:
+                    if console.size != size:
+                        size = console.size
+                        live.refresh()
+                        renders += 1
+                        resizes += 1
+                    continue
+                seq = frame.seq
+                if settings is not None and settings.refresh():
+                    sampler.interval = max(0.01, settings.interval)
+                    log.info(
+                        "Config reloaded: interval=%.2fs limit=%d theme=%s",
+                        settings.interval,
+                        settings.limit,
+                        settings.theme_name,
+                    )
+                live.update(render(frame), refresh=True)
+                renders += 1
+                size = console.size
+                if until is not None and until():
+                    _log_stats()
+                    return
+    except KeyboardInterrupt:
+        # After the with: the alternate screen is gone, so the message stays
+        console.print(f"\n[bold cyan]Exiting NeonHud {label}...[/]")
+        _log_stats()
+        log.info("Exiting %s view", label)
+        sys.exit(0)
+
+
+def _run_record(
+    path: str,
+    interval: float,
+    fsync_interval: float,
+    duration: Optional[float] = None,
+) -> int:
+    """
+    Append one binary row per sampler frame to `path` until SIGINT/SIGTERM
+    (or `duration` seconds). Memory stays flat: rows go straight to the
+    buffered writer. Returns the number of rows written.
+    """
+    import psutil
+
+    from neonhud.models import snapshot
+    from neonhud.models.recording import RecordWriter
+    from neonhud.services import recorder
+    from neonhud.services.sampler import Sampler
+    from neonhud.utils import now_utc_iso
+
+    ncpu = psutil.cpu_count(logical=True) or 1
+    meta = {"host": snapshot._platform_host(), "started": now_utc_iso()}
+    stop = threading.Event()
+
+    def _on_signal(signum: int, _frame: object) -> None:
+        log.info("Received signal %d; finishing recording", signum)
+        stop.set()
+
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        signal.signal(sig, _on_signal)
+
+    deadline = time.monotonic() + duration if duration else None
+    sampler = Sampler(recorder.collectors(), interval)
+    written = 0
+    with (
+        RecordWriter(
+            path, recorder.columns(ncpu), interval, meta, fsync_interval
+        ) as out,
+        sampler,
+    ):
+        log.info("Recording to %s (%d rows already present)", path, out.frames)
+        seq = 0
+        while not stop.is_set():
+            if deadline is not None and time.monotonic() >= deadline:
+                break
+            frame = sampler.wait(seq, timeout=0.5)
+            if frame is None:
+                continue
+            seq = frame.seq
+            out.write(frame.wall, recorder.to_row(frame.values, ncpu))
+            written += 1
+    log.info("Recorded %d rows to %s", written, path)
+    log.info("Sampler stats: %s", sampler.stats().summary())
+    return written
+
+
+def _stdout_writer() -> IO[bytes]:
+    """Binary, buffered stdout (one write syscall per flush)."""
+    buf = getattr(sys.stdout, "buffer", None)
+    if buf is not None:
+        return buf  # type: ignore[no-any-return]
+    return os.fdopen(os.dup(sys.stdout.fileno()), "wb", buffering=64 * 1024)
+
+
+def _run_report_stream(
+    interval: float, count: Optional[int] = None, keyframe_every: int = 60
+) -> int:
+    """
+    Emit one delta-encoded JSON line per `interval` (models.stream) until
+    SIGINT/SIGTERM, a closed pipe, or `count` lines. The first build only
+    primes the counters, so every emitted line carries real rates. Ticks
+    are scheduled on a fixed monotonic grid, so collection time does not
+    make the cadence drift. Returns the number of lines written.
+    """
+    from neonhud.models import snapshot
+    from neonhud.models.stream import DeltaEncoder
+
+    stop = threading.Event()
+
+    def _on_signal(signum: int, _frame: object) -> None:
+        log.info("Received signal %d; stopping stream", signum)
+        stop.set()
+
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        signal.signal(sig, _on_signal)
+
+    builder = snapshot.SnapshotBuilder()
+    encoder = DeltaEncoder(keyframe_every)
+    out = _stdout_writer()
+    builder.build()
+    deadline = time.monotonic()
+    written = 0
+    while count is None or written < count:
+        deadline += interval
+        if stop.wait(max(0.0, deadline - time.monotonic())):
+            break
+        line = encoder.encode(builder.build())
+        try:
+            out.write(json.dumps(line, separators=(",", ":")).encode() + b"\n")
+            out.flush()
+        except BrokenPipeError:
+            # Reader went away (e.g. `| head`); silence the flush at exit
+            devnull = os.open(os.devnull, os.O_WRONLY)
+            os.dup2(devnull, sys.stdout.fileno())
+            log.info("Stream reader closed the pipe")
+            break
+        written += 1
+    log.info("Streamed %d report lines", written)
+    return written
+
+
 def run(argv: list[str] | None = None) -> None:
     """
     Main CLI dispatcher (wrapped by error-handling in __main__).
@@ -40,6 +319,102 @@ def run(argv: list[str] | None = None) -> None:
     report_parser.add_argument(
         "--pretty", action="store_true", help="Pretty-print JSON with indentation"
     )
+    report_parser.add_argument(
+        "--window",
+        type=float,
+        default=None,
+        help="Measure CPU, disk/net and process rates over this many seconds",
+    )
+    report_parser.add_argument(
+        "--stream",
+        action="store_true",
+        help="Keep running and emit one delta-encoded JSON line per interval",
+    )
+    report_parser.add_argument(
+        "--interval",
+        type=float,
+        default=None,
+        help="Stream interval in seconds (overrides config)",
+    )
+    report_parser.add_argument(
+        "--count",
+        type=int,
+        default=None,
+        help="Stop streaming after this many lines (default: until interrupted)",
+    )
+    report_parser.add_argument(
+        "--keyframe",
+        type=int,
+        default=60,
+        help="Emit a full snapshot every N stream lines (default: 60)",
+    )
+
+    # `neonhud record`
+    record_parser = subparsers.add_parser(
+        "record", help="Record metrics to a compact binary file"
+    )
+    record_parser.add_argument("output", help="Recording file (appended if it exists)")
+    record_parser.add_argument(
+        "--interval",
+        type=float,
+        default=None,
+        help="Sampling interval in seconds (overrides config)",
+    )
+    record_parser.add_argument(
+        "--fsync",
+        type=float,
+        default=10.0,
+        help="Seconds between flush+fsync of buffered rows (default: 10)",
+    )
+    record_parser.add_argument(
+        "--duration",
+        type=float,
+        default=None,
+        help="Stop after this many seconds (default: until interrupted)",
+    )
+
+    # `neonhud replay`
+    replay_parser = subparsers.add_parser(
+        "replay", help="Play a recording back through dash or pro"
+    )
+    replay_parser.add_argument("recording", help="File written by `neonhud record`")
+    replay_parser.add_argument(
+        "--view",
+        choices=("dash", "pro"),
+        default="pro",
+        help="Renderer to drive (default: pro)",
+    )
+    replay_parser.add_argument(
+        "--speed",
+        type=str,
+        default="1",
+        help='Playback speed: 1, 10, ... or "max" (default: 1)',
+    )
+    replay_parser.add_argument(
+        "--start",
+        type=str,
+        default=None,
+        help='Seek to "+SECONDS" from the start, an epoch time, or ISO-8601',
+    )
+    replay_parser.add_argument(
+        "--theme",
+        type=str,
+        default=None,
+        help="Theme name (overrides config)",
+    )
+
+    # `neonhud compact`
+    compact_parser = subparsers.add_parser(
+        "compact", help="Compress a recording (Gorilla encoding) for archiving"
+    )
+    compact_parser.add_argument("recording", help="File written by `neonhud record`")
+    compact_parser.add_argument("output", help="Compressed file (replayable)")
+    compact_parser.add_argument(
+        "--block-size",
+        type=int,
+        default=1024,
+        help="Frames per independently decodable block (default: 1024)",
+    )
 
     # `neonhud top`
     top_parser = subparsers.add_parser("top", help="Interactive Rich TUI of processes")
@@ -61,6 +436,12 @@ def run(argv: list[str] | None = None) -> None:
         default=None,
         help="Theme name (overrides config)",
     )
+    top_parser.add_argument(
+        "--renderer",
+        choices=("rich", "ansi"),
+        default=None,
+        help="rich (default) or ansi: send only changed cells (slow links)",
+    )
 
     # `neonhud dash`
     dash_parser = subparsers.add_parser(
@@ -78,6 +459,12 @@ def run(argv: list[str] | None = None) -> None:
         default=None,
         help="Theme name (overrides config)",
     )
+    dash_parser.add_argument(
+        "--renderer",
+        choices=("rich", "ansi"),
+        default=None,
+        help="rich (default) or ansi: send only changed cells (slow links)",
+    )
 
     # `neonhud pro` (gtop-style full dashboard)
     pro_parser = subparsers.add_parser(
@@ -95,12 +482,32 @@ def run(argv: list[str] | None = None) -> None:
         default=None,
         help="Theme name (overrides config)",
     )
+    pro_parser.add_argument(
+        "--renderer",
+        choices=("rich", "ansi"),
+        default=None,
+        help="rich (default) or ansi: send only changed cells (slow links)",
+    )
 
     args = parser.parse_args(argv)
 
     if args.command == "report":
         log.info("Running report subcommand")
-        snap = snapshot.build()
+        if args.stream:
+            cfg = core_config.get_config()
+            interval = (
+                args.interval
+                if args.interval is not None
+                else float(cfg.get("refresh_interval", 2.0))
+            )
+            log.info(
+                "Streaming report interval=%.2fs keyframe=%d", interval, args.keyframe
+            )
+            _run_report_stream(interval, args.count, args.keyframe)
+            return
+        from neonhud.models import snapshot
+
+        snap = snapshot.build(window=args.window)
         if args.pretty:
             print(json.dumps(snap, indent=2))
         else:
@@ -108,101 +515,192 @@ def run(argv: list[str] | None = None) -> None:
         log.info("Report complete")
         return
 
-    if args.command == "top":
-        cfg = core_config.load_config()
+    if args.command == "record":
+        cfg = core_config.get_config()
         interval = (
             args.interval
             if args.interval is not None
             else float(cfg.get("refresh_interval", 2.0))
         )
-        limit = (
-            args.limit if args.limit is not None else int(cfg.get("process_limit", 15))
-        )
+        log.info("Running record subcommand interval=%.2fs", interval)
+        _run_record(args.output, interval, args.fsync, args.duration)
+        return
+
+    if args.command == "replay":
+        from rich.console import Console
+
+        from neonhud.models.recording import open_recording
+        from neonhud.services.replay import ReplaySource, parse_speed, parse_start
+        from neonhud.services.sampler import Sampler
+        from neonhud.ui import dashboard
+        from neonhud.ui import pro_dash
+        from neonhud.ui.theme import get_theme
+
+        cfg = core_config.get_config()
         theme_name = (
             args.theme if args.theme is not None else str(cfg.get("theme", "classic"))
         )
         theme = get_theme(theme_name)
 
+        with open_recording(args.recording) as rec:
+            start = parse_start(args.start, rec) if args.start else None
+            source = ReplaySource(rec, parse_speed(args.speed), start)
+            log.info(
+                "Replaying %s (%d frames) view=%s speed=%s",
+                args.recording,
+                len(rec),
+                args.view,
+                args.speed,
+            )
+            console = Console()
+            if args.view == "dash":
+                sampler = Sampler(dashboard.collectors(source), source.interval)
+                _run_live(
+                    console,
+                    sampler,
+                    lambda f: dashboard.build_dashboard(theme=theme, values=f.values),
+                    "replay",
+                    until=lambda: source.done,
+                )
+            else:
+                sampler = Sampler(pro_dash.collectors(source), source.interval)
+                _run_live(
+                    console,
+                    sampler,
+                    lambda f: pro_dash.build_top(theme=theme, values=f.values),
+                    "replay",
+                    screen=True,
+                    until=lambda: source.done,
+                )
+        log.info("Replay complete")
+        return
+
+    if args.command == "compact":
+        from neonhud.models.recording import compact, open_recording
+        from neonhud.services import recorder
+
+        with open_recording(args.recording) as rec:
+            cols = rec.columns
+        frames, size = compact(
+            args.recording,
+            args.output,
+            block_size=args.block_size,
+            decimals=recorder.decimals(cols),
+        )
+        log.info(
+            "Compacted %d frames into %s (%d bytes, %.1f bytes/frame)",
+            frames,
+            args.output,
+            size,
+            size / frames if frames else 0.0,
+        )
+        return
+
+    if args.command == "top":
+        from rich.console import Console
+
+        from neonhud.collectors import procs
+        from neonhud.services.sampler import Collector, Sampler, apply_cadence
+        from neonhud.ui import process_table
+
+        settings = _LiveSettings(args)
         console = Console()
         log.info(
             "Starting live process view (top) interval=%.2fs limit=%d theme=%s",
-            interval,
-            limit,
-            theme_name,
+            settings.interval,
+            settings.limit,
+            settings.theme_name,
+        )
+        # The process scan is the whole view here, so it is never deferred
+        specs = {
+            "procs": Collector(
+                lambda: procs.sample(limit=settings.limit, sort_by="cpu"),
+                critical=True,
+            )
+        }
+        sampler = Sampler(
+            apply_cadence(specs, _cadence(settings.cfg)), settings.interval
+        )
+        _run_live(
+            console,
+            sampler,
+            lambda f: process_table.build_table(
+                f.values["procs"], theme=settings.theme
+            ),
+            "top",
+            settings=settings,
+            renderer=_renderer(args, settings.cfg),
         )
-        with Live(console=console, refresh_per_second=8) as live:
-            try:
-                while True:
-                    rows = procs.sample(limit=limit, sort_by="cpu")
-                    table = process_table.build_table(rows, theme=theme)
-                    live.update(table)
-                    time.sleep(interval)
-            except KeyboardInterrupt:
-                console.print("\n[bold cyan]Exiting NeonHud top...[/]")
-                log.info("Exiting process view")
-                sys.exit(0)
-
         return
 
     if args.command == "dash":
-        cfg = core_config.load_config()
-        interval = (
-            args.interval
-            if args.interval is not None
-            else float(cfg.get("refresh_interval", 2.0))
-        )
-        theme_name = (
-            args.theme if args.theme is not None else str(cfg.get("theme", "classic"))
-        )
-        theme = get_theme(theme_name)
+        from rich.console import Console
+
+        from neonhud.services.sampler import Sampler, apply_cadence
+        from neonhud.ui import dashboard
+        from neonhud.ui.cache import PanelCache
 
+        settings = _LiveSettings(args)
+        cache = PanelCache()
         console = Console()
         log.info(
-            "Starting live dashboard view interval=%.2fs theme=%s", interval, theme_name
+            "Starting live dashboard view interval=%.2fs theme=%s",
+            settings.interval,
+            settings.theme_name,
+        )
+        sampler = Sampler(
+            apply_cadence(dashboard.collectors(), _cadence(settings.cfg)),
+            settings.interval,
+        )
+        _run_live(
+            console,
+            sampler,
+            lambda f: dashboard.build_dashboard(
+                theme=settings.theme, values=f.values, updated=f.updated, cache=cache
+            ),
+            "dashboard",
+            settings=settings,
+            renderer=_renderer(args, settings.cfg),
         )
-        with Live(console=console, refresh_per_second=8) as live:
-            try:
-                while True:
-                    live.update(dashboard.build_dashboard(theme=theme))
-                    time.sleep(interval)
-            except KeyboardInterrupt:
-                console.print("\n[bold cyan]Exiting NeonHud dashboard...[/]")
-                log.info("Exiting dashboard view")
-                sys.exit(0)
-
         return
 
     if args.command == "pro":
-        cfg = core_config.load_config()
-        interval = (
-            args.interval
-            if args.interval is not None
-            else float(cfg.get("refresh_interval", 2.0))
-        )
-        theme_name = (
-            args.theme if args.theme is not None else str(cfg.get("theme", "classic"))
-        )
-        theme = get_theme(theme_name)
+        from rich.console import Console
 
+        from neonhud.services.sampler import Sampler, apply_cadence
+        from neonhud.ui import pro_dash  # pro (gtop-style) view
+        from neonhud.ui.cache import PanelCache
+
+        settings = _LiveSettings(args)
+        cache = PanelCache()
         console = Console()
         log.info(
             "Starting pro (gtop-style) dashboard interval=%.2fs theme=%s",
-            interval,
-            theme_name,
+            settings.interval,
+            settings.theme_name,
         )
 
-        # Full-screen from the start, with an initial renderable
-        initial = pro_dash.build_top(theme=theme)
-        with Live(initial, console=console, refresh_per_second=8, screen=True) as live:
-            try:
-                while True:
-                    time.sleep(interval)
-                    live.update(pro_dash.build_top(theme=theme))
-            except KeyboardInterrupt:
-                console.print("\n[bold cyan]Exiting NeonHud pro...[/]")
-                log.info("Exiting pro dashboard view")
-                sys.exit(0)
-
+        # Full-screen from the start; a slow collector only delays its own data
+        sampler = Sampler(
+            apply_cadence(pro_dash.collectors(), _cadence(settings.cfg)),
+            settings.interval,
+            frame_budget=_frame_budget(settings.cfg, settings.interval),
+        )
+        _run_live(
+            console,
+            sampler,
+            lambda f: pro_dash.build_top(
+                theme=settings.theme,
+                values=f.values,
+                stale=f.stale,
+                updated=f.updated,
+                cache=cache,
+            ),
+            "pro",
+            screen=True,
+            settings=settings,
+            renderer=_renderer(args, settings.cfg),
+        )
         return
 
     # Fallback (should never happen with required=True)
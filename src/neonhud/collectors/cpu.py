@@ -3,32 +3,172 @@ CPU metrics collector.
 Returns:
 {
     "percent_total": float,  # 0.0–100.0
-    "per_cpu": [float, ...]  # one entry per logical CPU
+    "per_cpu": [float, ...], # one entry per logical CPU
+    "breakdown": {           # aggregate split, 0.0–100.0 each
+        "user": float, "system": float, "iowait": float,
+        "steal": float, "irq": float
+    }
 }
+
+On Linux the counters come from a single read of /proc/stat per tick; the
+jiffies of all CPUs are kept in one flat array ([1 + ncpu] rows x FIELDS,
+row 0 = aggregate) and the whole matrix is differenced in one pass; each
+output column is then one comprehension over strided slices of that delta.
+Elsewhere the same matrix is filled from psutil.cpu_times().
+
+State lives in a CpuSampler instance rather than inside psutil, so each
+owner gets deltas against its own previous sample. The module-level
+sample() uses a shared default sampler.
 """
 
 from __future__ import annotations
 
-from typing import Dict, List
+import threading
+from array import array
+from operator import mul
+from typing import Dict, List, NamedTuple, Optional
 
 import psutil
 from neonhud.core.logging import get_logger
 
 log = get_logger()
 
+PROC_STAT = "/proc/stat"
 
-def sample() -> Dict[str, object]:
+# Column order of the jiffies matrix (matches /proc/stat; guest time is
+# already included in user/nice by the kernel, so it is not counted again).
+FIELDS = ("user", "nice", "system", "idle", "iowait", "irq", "softirq", "steal")
+NFIELDS = len(FIELDS)
+_USER, _NICE, _SYSTEM, _IDLE, _IOWAIT, _IRQ, _SOFTIRQ, _STEAL = range(NFIELDS)
+
+
+class CpuBreakdown(NamedTuple):
+    """
+    Percentages for one tick. Row 0 of each array is the aggregate, rows
+    1..n are the logical CPUs in `cpu_ids` order.
+    """
+
+    cpu_ids: List[int]
+    busy: array
+    user: array
+    system: array
+    iowait: array
+    steal: array
+    irq: array
+
+
+def _read_proc_stat() -> Optional[tuple[List[int], array]]:
+    """Parse the cpu/cpuN lines of /proc/stat into (cpu_ids, flat jiffies)."""
+    try:
+        with open(PROC_STAT, "rb") as f:
+            data = f.read()
+    except OSError:
+        return None
+
+    ids: List[int] = []
+    values: List[int] = []
+    for line in data.splitlines():
+        if not line.startswith(b"cpu"):
+            break  # cpu lines come first
+        parts = line.split()
+        if parts[0] != b"cpu":
+            ids.append(int(parts[0][3:]))
+        row = parts[1 : 1 + NFIELDS]
+        values.extend(map(int, row))
+        values.extend([0] * (NFIELDS - len(row)))  # very old kernels
+    if not ids:
+        return None
+    return ids, array("d", values)
+
+
+def _read_psutil() -> tuple[List[int], array]:
+    """Fallback: the same matrix built from psutil.cpu_times()."""
+    rows = [psutil.cpu_times(percpu=False)] + list(psutil.cpu_times(percpu=True))
+    values = array("d")
+    for t in rows:
+        values.extend(float(getattr(t, name, 0.0)) for name in FIELDS)
+    return list(range(len(rows) - 1)), values
+
+
+class CpuSampler:
     """
-    Take a non-blocking snapshot of CPU load.
-    Uses psutil instantaneous counters (interval=0.0).
+    Owns the previous jiffies matrix and turns each new read into
+    per-CPU percentages. The first sample is measured since boot.
     """
-    log.debug("Collecting CPU metrics via psutil.cpu_percent")
-    per_cpu: List[float] = psutil.cpu_percent(interval=0.0, percpu=True)
-    total: float = psutil.cpu_percent(interval=0.0, percpu=False)
 
-    per_cpu = [round(v, 1) for v in per_cpu]
-    total = round(total, 1)
+    def __init__(self) -> None:
+        self._use_proc = True
+        self._prev: Optional[array] = None
+        self._lock = threading.Lock()
+
+    def _read(self) -> tuple[List[int], array]:
+        if self._use_proc:
+            got = _read_proc_stat()
+            if got is not None:
+                return got
+            log.debug("%s unavailable; using psutil.cpu_times", PROC_STAT)
+            self._use_proc = False
+        return _read_psutil()
+
+    def sample_breakdown(self) -> CpuBreakdown:
+        with self._lock:
+            ids, curr = self._read()
+            prev = self._prev
+            if prev is None or len(prev) != len(curr):
+                prev = array("d", bytes(8 * len(curr)))  # CPU hotplug: restart
+            self._prev = curr
+
+        # One delta over the whole [1 + ncpu] x NFIELDS matrix
+        delta = [c - p if c > p else 0.0 for c, p in zip(curr, prev)]
+
+        def col(k: int) -> List[float]:
+            return delta[k::NFIELDS]
+
+        # Each output is one comprehension over columns of the delta
+        totals = list(map(sum, zip(*map(col, range(NFIELDS)))))
+        scale = [100.0 / t if t > 0.0 else 0.0 for t in totals]
+        iow = col(_IOWAIT)
+        busy = array(
+            "d",
+            [(t - i - w) * k for t, i, w, k in zip(totals, col(_IDLE), iow, scale)],
+        )
+        user = array(
+            "d", [(a + b) * k for a, b, k in zip(col(_USER), col(_NICE), scale)]
+        )
+        system = array("d", map(mul, col(_SYSTEM), scale))
+        iowait = array("d", map(mul, iow, scale))
+        steal = array("d", map(mul, col(_STEAL), scale))
+        irq = array(
+            "d", [(a + b) * k for a, b, k in zip(col(_IRQ), col(_SOFTIRQ), scale)]
+        )
+
+        return CpuBreakdown(ids, busy, user, system, iowait, steal, irq)
 
-    data: Dict[str, object] = {"percent_total": total, "per_cpu": per_cpu}
-    log.debug("CPU sample: total=%.1f, per_cpu=%s", total, per_cpu)
+    def sample(self) -> Dict[str, object]:
+        b = self.sample_breakdown()
+        total = round(b.busy[0], 1)
+        per_cpu = [round(v, 1) for v in b.busy[1:]]
+        breakdown = {
+            "user": round(b.user[0], 1),
+            "system": round(b.system[0], 1),
+            "iowait": round(b.iowait[0], 1),
+            "steal": round(b.steal[0], 1),
+            "irq": round(b.irq[0], 1),
+        }
+        return {"percent_total": total, "per_cpu": per_cpu, "breakdown": breakdown}
+
+
+_DEFAULT = CpuSampler()
+
+
+def sample() -> Dict[str, object]:
+    """
+    Take a non-blocking snapshot of CPU load since the previous call
+    (since boot on the first call).
+    """
+    log.debug("Collecting CPU metrics via %s", PROC_STAT)
+    data = _DEFAULT.sample()
+    log.debug(
+        "CPU sample: total=%.1f, per_cpu=%s", data["percent_total"], data["per_cpu"]
+    )
     return data
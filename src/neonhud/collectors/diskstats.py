@@ -0,0 +1,271 @@
+"""
+Per-device I/O statistics from /proc/diskstats (what iostat -x shows).
+
+Each tick is one read of /proc/diskstats. Partitions are dropped with a
+cached lookup of /sys/block (whole devices only; the listing is re-read
+only when a device name not seen before appears), and devices that never
+completed an I/O (unused loop/ram/zram) are skipped. The counters of all
+remaining devices go into one flat array (devices x FIELDS), differenced
+against the previous tick in one pass; each derived rate is then one
+comprehension over a column of that delta.
+
+Elsewhere the same matrix is filled from psutil.disk_io_counters(perdisk=True)
+(no in-flight count or weighted time there).
+
+State lives in a DiskStatsSampler, like collectors.cpu.CpuSampler, so each
+owner gets rates against its own previous sample. The first sample is
+measured since boot.
+
+Returns {device: DiskStat} with:
+  read_iops, write_iops     completed requests/s
+  read_bps, write_bps       bytes/s
+  read_await, write_await   ms per completed request (queue + service)
+  queue                     average requests outstanding (iostat aqu-sz)
+  in_flight                 requests outstanding right now
+  util                      % of the interval with I/O in progress
+"""
+
+from __future__ import annotations
+
+import os
+import threading
+import time
+from array import array
+from operator import itemgetter
+from typing import Dict, FrozenSet, List, NamedTuple, Optional, Tuple
+
+import psutil
+from neonhud.core.logging import get_logger
+
+log = get_logger()
+
+PROC_DISKSTATS = "/proc/diskstats"
+PROC_UPTIME = "/proc/uptime"
+SYS_BLOCK = "/sys/block"
+
+SECTOR = 512  # /proc/diskstats counts 512-byte sectors whatever the device
+
+# Columns of the counter matrix
+FIELDS = (
+    "reads",
+    "read_sectors",
+    "read_ms",
+    "writes",
+    "write_sectors",
+    "write_ms",
+    "in_flight",
+    "io_ms",
+    "weighted_ms",
+)
+NFIELDS = len(FIELDS)
+_READS, _RSECT, _RMS, _WRITES, _WSECT, _WMS, _INFLIGHT, _IOMS, _WEIGHTED = range(
+    NFIELDS
+)
+
+# The same columns picked out of a split /proc/diskstats line
+_PICK = itemgetter(3, 5, 6, 7, 9, 10, 11, 12, 13)
+
+
+class DiskStat(NamedTuple):
+    read_iops: float
+    write_iops: float
+    read_bps: float
+    write_bps: float
+    read_await: float  # ms
+    write_await: float  # ms
+    queue: float
+    in_flight: int
+    util: float  # 0.0–100.0
+
+
+class _Counters(NamedTuple):
+    names: List[str]
+    values: array  # len(names) x NFIELDS, row-major
+
+
+class _BlockDevices:
+    """
+    Whole-device check against /sys/block. Answers are cached per name;
+    the directory is listed at most once per tick, and only when a name
+    not seen before appears.
+    """
+
+    def __init__(self) -> None:
+        self._names: Optional[FrozenSet[bytes]] = None
+        self._fresh = False
+        self._seen: Dict[bytes, bool] = {}
+
+    def new_tick(self) -> None:
+        self._fresh = False
+
+    def is_whole(self, name: bytes) -> bool:
+        known = self._seen.get(name)
+        if known is not None:
+            return known
+        if not self._fresh:
+            try:
+                # sysfs spells "/" in device names (cciss/c0d0) as "!"
+                listing = os.listdir(SYS_BLOCK.encode())
+                self._names = frozenset(n.replace(b"!", b"/") for n in listing)
+            except OSError:
+                self._names = None
+            self._fresh = True
+        # Without sysfs, keep everything rather than guess from the name
+        whole = self._names is None or name in self._names
+        self._seen[name] = whole
+        return whole
+
+
+def _read_proc(block: _BlockDevices) -> Optional[_Counters]:
+    try:
+        with open(PROC_DISKSTATS, "rb") as f:
+            data = f.read()
+    except OSError:
+        return None
+    block.new_tick()
+    names: List[str] = []
+    values: List[int] = []
+    for line in data.splitlines():
+        parts = line.split()
+        if len(parts) < 14 or not block.is_whole(parts[2]):
+            continue
+        row = _PICK(parts)
+        if row[_READS] == b"0" and row[_WRITES] == b"0":
+            continue  # never used
+        names.append(parts[2].decode("ascii", "replace"))
+        values.extend(map(int, row))
+    return _Counters(names, array("d", values))
+
+
+def _read_psutil() -> _Counters:
+    per = psutil.disk_io_counters(perdisk=True) or {}
+    names: List[str] = []
+    values = array("d")
+    for name, io in per.items():
+        if not (io.read_count or io.write_count):
+            continue
+        names.append(name)
+        values.extend(
+            (
+                io.read_count,
+                io.read_bytes / SECTOR,
+                io.read_time,
+                io.write_count,
+                io.write_bytes / SECTOR,
+                io.write_time,
+                0,
+                getattr(io, "busy_time", 0),
+                0,
+            )
+        )
+    return _Counters(names, values)
+
+
+def _uptime() -> float:
+    try:
+        with open(PROC_UPTIME, "rb") as f:
+            return float(f.read().split()[0])
+    except (OSError, ValueError, IndexError):
+        return max(1.0, time.time() - psutil.boot_time())
+
+
+class DiskStatsSampler:
+    """
+    Owns the previous counter matrix and turns each new read into
+    DiskStat rows. Devices that appear or vanish between ticks are
+    realigned by name; a new device is measured since boot.
+    """
+
+    def __init__(self) -> None:
+        self._use_proc = True
+        self._block = _BlockDevices()
+        self._prev: Optional[Tuple[float, _Counters]] = None
+        self._lock = threading.Lock()
+
+    def _read(self) -> _Counters:
+        if self._use_proc:
+            got = _read_proc(self._block)
+            if got is not None:
+                return got
+            log.debug("%s unavailable; using psutil.disk_io_counters", PROC_DISKSTATS)
+            self._use_proc = False
+        return _read_psutil()
+
+    def _aligned(self, prev: _Counters, names: List[str]) -> array:
+        """prev.values reordered to `names` (zeros for new devices)."""
+        if prev.names == names:
+            return prev.values
+        rows = {n: i for i, n in enumerate(prev.names)}
+        out = array("d", bytes(8 * NFIELDS * len(names)))
+        for j, n in enumerate(names):
+            i = rows.get(n)
+            if i is not None:
+                out[j * NFIELDS : (j + 1) * NFIELDS] = prev.values[
+                    i * NFIELDS : (i + 1) * NFIELDS
+                ]
+        return out
+
+    def sample(self, now: Optional[float] = None) -> Dict[str, DiskStat]:
+        """
+        Statistics since the previous sample. `now` (time.monotonic()) lets
+        a caller share one timestamp across several collectors.
+        """
+        with self._lock:
+            if now is None:
+                now = time.monotonic()
+            curr = self._read()
+            prev = self._prev
+            self._prev = (now, curr)
+        if prev is None:
+            dt = _uptime()
+            base = array("d", bytes(8 * len(curr.values)))
+        else:
+            dt = now - prev[0]
+            base = self._aligned(prev[1], curr.names)
+        if dt <= 0.0:
+            dt = 1.0
+
+        # One delta over the whole devices x NFIELDS matrix
+        delta = [c - p if c > p else 0.0 for c, p in zip(curr.values, base)]
+
+        def col(k: int) -> List[float]:
+            return delta[k::NFIELDS]
+
+        reads, writes = col(_READS), col(_WRITES)
+        rms, wms = col(_RMS), col(_WMS)
+        per_s = 1.0 / dt
+        per_ms = 1.0 / (dt * 1000.0)
+
+        rows = zip(
+            [r * per_s for r in reads],
+            [w * per_s for w in writes],
+            [s * SECTOR * per_s for s in col(_RSECT)],
+            [s * SECTOR * per_s for s in col(_WSECT)],
+            [t / n if n else 0.0 for t, n in zip(rms, reads)],
+            [t / n if n else 0.0 for t, n in zip(wms, writes)],
+            [t * per_ms for t in col(_WEIGHTED)],
+            map(int, curr.values[_INFLIGHT::NFIELDS]),
+            [min(100.0, t * per_ms * 100.0) for t in col(_IOMS)],
+        )
+        return {name: DiskStat(*row) for name, row in zip(curr.names, rows)}
+
+
+_DEFAULT = DiskStatsSampler()
+
+
+def sample() -> Dict[str, DiskStat]:
+    """
+    Per-device statistics since the previous call (since boot on the
+    first call).
+    """
+    return _DEFAULT.sample()
+
+
+def as_dict(
+    stats: Dict[str, DiskStat], ndigits: int = 1
+) -> Dict[str, Dict[str, float]]:
+    """JSON-friendly {device: {field: value}} with rounded rates."""
+    return {
+        name: {k: round(v, ndigits) for k, v in st._asdict().items()}
+        for name, st in stats.items()
+    }
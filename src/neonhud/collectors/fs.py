@@ -0,0 +1,313 @@
+"""
+Filesystem usage collector (per mount), safe against hung mounts.
+
+- The mount table is parsed from /proc/self/mountinfo and re-read only when
+  the kernel signals a change (POLLPRI on the open file); elsewhere it falls
+  back to psutil.disk_partitions() refreshed every TTL.
+- statvfs() runs on daemon threads with a per-mount timeout, so a hung
+  NFS/FUSE mount can neither block the caller nor process exit. A call
+  never waits behind a hung one: when every thread is busy a new one is
+  started (up to a cap), and surplus threads exit once idle.
+  A mount whose call is still outstanding after the timeout is reported as
+  "unresponsive" and is not queried again until that call returns.
+- Results are cached per mount for `ttl` seconds.
+
+Returns a list of FsUsage rows:
+  (mount, fstype, used, total, percent, status)  # status: ok | unresponsive | error
+"""
+
+from __future__ import annotations
+
+import os
+import re
+import select
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future, wait
+from typing import Deque, Dict, List, NamedTuple, Optional, Set, Tuple
+
+from neonhud.core.logging import get_logger
+
+try:
+    import psutil as _psutil
+except Exception:  # pragma: no cover
+    _psutil = None  # type: ignore[assignment]
+
+log = get_logger()
+
+MOUNTINFO = "/proc/self/mountinfo"
+PROC_FILESYSTEMS = "/proc/filesystems"
+
+# Network/FUSE filesystems are listed too: they are the ones that hang.
+NETWORK_FSTYPES = frozenset({"nfs", "nfs4", "cifs", "smb3", "smbfs", "ceph"})
+
+_OCTAL_ESCAPE = re.compile(r"\\([0-7]{3})")
+
+
+class FsUsage(NamedTuple):
+    mount: str
+    fstype: str
+    used: int  # bytes
+    total: int  # bytes
+    percent: float  # used / total, 0.0–100.0
+    status: str  # "ok", "unresponsive" or "error"
+
+
+# ----- Mount table -------------------------------------------------------------
+
+
+def _unescape(field: str) -> str:
+    # mountinfo escapes space, tab, newline and backslash as \ooo
+    return _OCTAL_ESCAPE.sub(lambda m: chr(int(m.group(1), 8)), field)
+
+
+def _physical_fstypes() -> Set[str]:
+    """Filesystem types backed by a device (not flagged "nodev")."""
+    out: Set[str] = set()
+    try:
+        with open(PROC_FILESYSTEMS) as f:
+            for line in f:
+                if not line.startswith("nodev"):
+                    out.add(line.strip())
+    except OSError:
+        pass
+    return out
+
+
+def parse_mountinfo(text: str, fstypes: Set[str]) -> List[Tuple[str, str]]:
+    """
+    (mountpoint, fstype) for device-backed, network and FUSE mounts, in
+    mount table order. Format: "id parent maj:min root mountpoint opts ...
+    - fstype source superopts".
+    """
+    out: List[Tuple[str, str]] = []
+    for line in text.splitlines():
+        pre, sep, post = line.partition(" - ")
+        if not sep:
+            continue
+        fields = pre.split()
+        tail = post.split()
+        if len(fields) < 5 or not tail:
+            continue
+        fstype = tail[0]
+        if fstype in fstypes or fstype in NETWORK_FSTYPES or fstype.startswith("fuse."):
+            out.append((_unescape(fields[4]), fstype))
+    return out
+
+
+class _MountTable:
+    """Caches the mount list; re-reads it only when it changes."""
+
+    def __init__(self, ttl: float) -> None:
+        self.ttl = ttl
+        self._mounts: Optional[List[Tuple[str, str]]] = None
+        self._read_at = 0.0
+        self._file = None
+        self._poll: Optional[select.poll] = None
+        self._fstypes = _physical_fstypes()
+        try:
+            self._file = open(MOUNTINFO, "rb")
+            poller = select.poll()
+            poller.register(self._file.fileno(), select.POLLPRI | select.POLLERR)
+            self._poll = poller
+        except (OSError, AttributeError):
+            self._file = None  # not Linux: psutil + TTL
+
+    def _changed(self) -> bool:
+        if self._mounts is None:
+            return True
+        if self._poll is not None:
+            return bool(self._poll.poll(0))
+        return time.monotonic() - self._read_at >= self.ttl
+
+    def mounts(self) -> List[Tuple[str, str]]:
+        if not self._changed() and self._mounts is not None:
+            return self._mounts
+        if self._file is not None:
+            # Reading the file to the end re-arms the change notification
+            self._file.seek(0)
+            text = self._file.read().decode("utf-8", "replace")
+            self._mounts = parse_mountinfo(text, self._fstypes)
+        elif _psutil is not None:
+            self._mounts = [
+                (p.mountpoint, p.fstype or "?")
+                for p in _psutil.disk_partitions(all=False)
+            ]
+        else:
+            self._mounts = []
+        self._read_at = time.monotonic()
+        log.debug("Mount table (re)read: %d mounts", len(self._mounts))
+        return self._mounts
+
+
+# ----- statvfs pool ------------------------------------------------------------
+
+
+def _statvfs_usage(mount: str) -> Tuple[int, int]:
+    st = os.statvfs(mount)
+    total = st.f_blocks * st.f_frsize
+    used = (st.f_blocks - st.f_bfree) * st.f_frsize
+    return used, total
+
+
+class _StatvfsPool:
+    """
+    Daemon threads running statvfs() (ThreadPoolExecutor workers are joined
+    at interpreter exit, which would hang on a dead NFS server).
+
+    A thread stuck in a dead mount stays stuck, so a call goes to an idle
+    thread when there is one and otherwise to a new thread, up to
+    `max_threads`; threads beyond `workers` exit after IDLE_EXIT seconds
+    without work. Hung mounts therefore never queue healthy ones behind
+    them until `max_threads` calls are stuck at once.
+    """
+
+    IDLE_EXIT = 30.0
+
+    def __init__(self, workers: int, max_threads: int = 32) -> None:
+        self._workers = max(1, workers)
+        self._max = max(self._workers, max_threads)
+        self._jobs: Deque[Tuple[str, "Future[Tuple[int, int]]"]] = deque()
+        self._cond = threading.Condition()
+        self._threads = 0
+        self._idle = 0  # threads waiting for a job
+        self._started = 0
+
+    def submit(self, mount: str) -> "Future[Tuple[int, int]]":
+        fut: "Future[Tuple[int, int]]" = Future()
+        with self._cond:
+            self._jobs.append((mount, fut))
+            if len(self._jobs) > self._idle and self._threads < self._max:
+                self._threads += 1
+                self._started += 1
+                threading.Thread(
+                    target=self._work,
+                    name=f"neonhud-statvfs-{self._started}",
+                    daemon=True,
+                ).start()
+            else:
+                self._cond.notify()
+        return fut
+
+    def _next(self) -> Optional[Tuple[str, "Future[Tuple[int, int]]"]]:
+        """The next job, or None when this surplus thread should exit."""
+        with self._cond:
+            self._idle += 1
+            try:
+                while not self._jobs:
+                    woken = self._cond.wait(self.IDLE_EXIT)
+                    if not woken and not self._jobs and self._threads > self._workers:
+                        self._threads -= 1
+                        return None
+                return self._jobs.popleft()
+            finally:
+                self._idle -= 1
+
+    def _work(self) -> None:
+        while True:
+            job = self._next()
+            if job is None:
+                return
+            mount, fut = job
+            if not fut.set_running_or_notify_cancel():
+                continue
+            try:
+                fut.set_result(_statvfs_usage(mount))
+            except BaseException as e:
+                fut.set_exception(e)
+
+
+# ----- Collector ---------------------------------------------------------------
+
+
+class _MountState:
+    __slots__ = ("fstype", "usage", "fetched_at", "future", "submitted_at", "status")
+
+    def __init__(self, fstype: str) -> None:
+        self.fstype = fstype
+        self.usage: Optional[Tuple[int, int]] = None
+        self.fetched_at = 0.0
+        self.future: Optional["Future[Tuple[int, int]]"] = None
+        self.submitted_at = 0.0
+        self.status = "ok"
+
+
+class FilesystemCollector:
+    def __init__(
+        self,
+        timeout: float = 1.0,
+        ttl: float = 30.0,
+        workers: int = 4,
+        max_threads: int = 32,
+    ):
+        self.timeout = timeout
+        self.ttl = ttl
+        self._table = _MountTable(ttl)
+        self._pool = _StatvfsPool(workers, max_threads)
+        self._state: Dict[str, _MountState] = {}
+        self._lock = threading.Lock()
+
+    def _absorb(self, st: _MountState, now: float) -> None:
+        fut = st.future
+        if fut is None or not fut.done():
+            return
+        st.future = None
+        try:
+            st.usage = fut.result()
+            st.status = "ok"
+        except Exception as e:
+            log.debug("statvfs failed: %s", e)
+            st.usage = None
+            st.status = "error"
+        st.fetched_at = now
+
+    def sample(self) -> List[FsUsage]:
+        """
+        Usage for every mount; waits at most `timeout` for fresh statvfs
+        results and serves cached values otherwise.
+        """
+        with self._lock:
+            mounts = self._table.mounts()
+            now = time.monotonic()
+
+            # Drop state for unmounted paths, add new mounts
+            state = {m: self._state.get(m) or _MountState(t) for m, t in mounts}
+            self._state = state
+
+            submitted: List["Future[Tuple[int, int]]"] = []
+            for mount, st in state.items():
+                self._absorb(st, now)
+                if st.future is not None:
+                    continue  # still outstanding from an earlier call
+                if st.usage is None or now - st.fetched_at >= self.ttl:
+                    st.future = self._pool.submit(mount)
+                    st.submitted_at = now
+                    submitted.append(st.future)
+
+            if submitted:
+                wait(submitted, timeout=self.timeout)
+
+            now = time.monotonic()
+            rows: List[FsUsage] = []
+            for mount, st in state.items():
+                self._absorb(st, now)
+                if st.future is not None and now - st.submitted_at >= self.timeout:
+                    st.status = "unresponsive"
+                used, total = st.usage if st.usage is not None else (0, 0)
+                pct = (used / total * 100.0) if total > 0 else 0.0
+                rows.append(FsUsage(mount, st.fstype, used, total, pct, st.status))
+            return rows
+
+
+_DEFAULT: Optional[FilesystemCollector] = None
+
+
+def sample() -> List[FsUsage]:
+    """Filesystem usage via a shared FilesystemCollector."""
+    global _DEFAULT
+    if _DEFAULT is None:
+        _DEFAULT = FilesystemCollector()
+    rows = _DEFAULT.sample()
+    log.debug("Filesystem usage: %d mounts", len(rows))
+    return rows
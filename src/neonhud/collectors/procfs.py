@@ -0,0 +1,131 @@
+"""
+Low-level Linux /proc readers used by the process collector fast path.
+
+These helpers read /proc/<pid>/stat, /proc/<pid>/statm, /proc/<pid>/comm and
+/proc/<pid>/cmdline with a single os.read() each and do the minimum parsing
+needed to fill a ProcessRow. Every reader returns None (or an empty value)
+when the process has exited or is not readable, so callers can simply skip it.
+"""
+
+from __future__ import annotations
+
+import os
+from typing import List, NamedTuple, Optional
+
+PROC_ROOT = "/proc"
+
+# One read is enough: stat/statm are short, and cmdline is trimmed for display.
+_READ_SIZE = 4096
+
+
+def _sysconf(name: str, default: int) -> int:
+    try:
+        value = int(os.sysconf(name))
+    except (AttributeError, ValueError, OSError):
+        return default
+    return value if value > 0 else default
+
+
+CLK_TCK = _sysconf("SC_CLK_TCK", 100)
+PAGE_SIZE = _sysconf("SC_PAGE_SIZE", 4096)
+
+
+class StatFields(NamedTuple):
+    cpu_ticks: int  # utime + stime, in clock ticks
+    start_ticks: int  # starttime since boot, in clock ticks
+
+
+def available() -> bool:
+    """True when /proc looks like a Linux procfs we can parse."""
+    return os.path.isfile(os.path.join(PROC_ROOT, "self", "stat"))
+
+
+def _read(pid: int, leaf: str) -> Optional[bytes]:
+    try:
+        fd = os.open(f"{PROC_ROOT}/{pid}/{leaf}", os.O_RDONLY)
+    except OSError:
+        return None
+    try:
+        return os.read(fd, _READ_SIZE)
+    except OSError:
+        return None
+    finally:
+        os.close(fd)
+
+
+def pids() -> List[int]:
+    """All numeric entries under /proc (may race with process exit)."""
+    return [int(n) for n in os.listdir(PROC_ROOT) if n.isdigit()]
+
+
+def uptime() -> float:
+    """Seconds since boot from /proc/uptime (same clock as starttime)."""
+    with open(f"{PROC_ROOT}/uptime", "rb") as f:
+        return float(f.read().split()[0])
+
+
+def read_stat(pid: int) -> Optional[StatFields]:
+    """
+    Parse /proc/<pid>/stat.
+
+    comm may contain spaces and parentheses, so split on the *last* ')'
+    and never decode it here (see read_comm). Fields after it start at
+    field 3 (state); utime/stime are fields 14/15 and starttime is field 22.
+    """
+    data = _read(pid, "stat")
+    if not data:
+        return None
+    rpar = data.rfind(b")")
+    if rpar < 0:
+        return None
+    rest = data[rpar + 2 :].split()
+    try:
+        ticks = int(rest[11]) + int(rest[12])
+        start = int(rest[19])
+    except (IndexError, ValueError):
+        return None
+    return StatFields(cpu_ticks=ticks, start_ticks=start)
+
+
+def read_comm(pid: int) -> Optional[str]:
+    """Process name from /proc/<pid>/comm (kernel-truncated to 15 chars)."""
+    data = _read(pid, "comm")
+    if data is None:
+        return None
+    return data.rstrip(b"\n").decode("utf-8", "replace")
+
+
+def read_rss(pid: int) -> Optional[int]:
+    """Resident set size in bytes from /proc/<pid>/statm (second field)."""
+    data = _read(pid, "statm")
+    if not data:
+        return None
+    parts = data.split(None, 2)
+    try:
+        return int(parts[1]) * PAGE_SIZE
+    except (IndexError, ValueError):
+        return None
+
+
+def read_cmdline(pid: int) -> List[str]:
+    """argv tokens from /proc/<pid>/cmdline ([] for kernel threads/zombies)."""
+    data = _read(pid, "cmdline")
+    if not data:
+        return []
+    return data.rstrip(b"\0").decode("utf-8", "replace").split("\0")
+
+
+def read_uid(pid: int) -> Optional[int]:
+    """Owner uid of /proc/<pid> (the process's effective uid)."""
+    try:
+        return os.stat(f"{PROC_ROOT}/{pid}").st_uid
+    except OSError:
+        return None
+
+
+def read_exe(pid: int) -> str:
+    """Executable path from the /proc/<pid>/exe link ('' if not permitted)."""
+    try:
+        return os.readlink(f"{PROC_ROOT}/{pid}/exe")
+    except OSError:
+        return ""
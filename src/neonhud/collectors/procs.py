@@ -12,18 +12,44 @@ Returns a list of typed dicts (top-N by CPU% by default):
   },
   ...
 ]
+
+Backends (config key `process_backend`):
+- "psutil": portable, one psutil.Process per PID
+- "procfs": Linux fast path reading /proc/<pid>/{stat,statm,cmdline} directly
+- "auto" (default): procfs when available, otherwise psutil
+
+State lives in a shared ProcessTable (see shared_table()), so per-process
+CPU% is computed from CPU-time deltas between calls rather than relying on
+psutil's per-object caches.
 """
 
 from __future__ import annotations
 
-from typing import List, Literal, Optional, TypedDict, Any
+import heapq
+import threading
+import time
+from operator import attrgetter
+from typing import (
+    Any,
+    Dict,
+    Iterator,
+    List,
+    Literal,
+    NamedTuple,
+    Optional,
+    Tuple,
+    TypedDict,
+)
 
 import psutil
+from neonhud.collectors import procfs
+from neonhud.core import config as core_config
 from neonhud.core.logging import get_logger
 
 log = get_logger()
 
 SortKey = Literal["cpu", "rss"]
+Backend = Literal["auto", "psutil", "procfs"]
 
 
 class ProcessRow(TypedDict):
@@ -48,73 +74,289 @@ def _flatten_cmdline(cmdline: Optional[List[str]], name: str) -> str:
     return text
 
 
-def sample(limit: int = 50, sort_by: SortKey = "cpu") -> List[ProcessRow]:
+def _clamp_pct(pct: float) -> float:
+    if pct < 0.0:
+        return 0.0
+    if pct > 100.0:
+        return 100.0
+    return pct
+
+
+def _resolve_backend(backend: Optional[str]) -> str:
     """
-    Collect a snapshot of running processes.
+    Pick the concrete backend ("psutil" or "procfs").
+    Falls back to psutil when /proc is not usable or the name is unknown.
+    """
+    name = backend
+    if name is None:
+        name = str(core_config.get_config().get("process_backend", "auto"))
+    name = name.lower()
+    if name in ("auto", "procfs"):
+        if procfs.available():
+            return "procfs"
+        if name == "procfs":
+            log.debug("procfs backend unavailable; falling back to psutil")
+    return "psutil"
 
-    - Uses psutil.process_iter with attribute prefetch to be efficient.
-    - Handles AccessDenied/Zombie/NoSuchProcess gracefully (skips).
-    - Normalizes per-process CPU% to a 0–100 scale across logical CPUs.
+
+class ProcessIdentity(NamedTuple):
+    """Fields that never change during a process lifetime (read once)."""
+
+    name: str
+    cmdline: str
+    uid: int  # -1 when not readable
+    exe: str  # "" when not readable
+
+
+class _Entry:
+    """Per-process state kept across ticks, keyed by (pid, start)."""
+
+    __slots__ = ("pid", "start", "cpu_s", "cpu_percent", "rss", "ident", "handle")
+
+    def __init__(self, pid: int, start: float, handle: Any) -> None:
+        self.pid = pid
+        self.start = start  # start ticks (procfs) or create_time (psutil)
+        self.cpu_s = 0.0  # cumulative user+system CPU seconds
+        self.cpu_percent = 0.0
+        self.rss = 0
+        self.ident: Optional[ProcessIdentity] = None
+        self.handle = handle  # psutil.Process for the psutil backend
+
+
+# One pass-1 record: (pid, start key, cpu seconds, rss bytes, age seconds, handle)
+_Scan = Tuple[int, float, float, int, float, Any]
+
+_CPU_KEY = attrgetter("cpu_percent", "rss")
+_RSS_KEY = attrgetter("rss")
+
+
+# ----- Backend scanners ---------------------------------------------------------
+
+
+def _scan_psutil() -> Iterator[_Scan]:
+    """Pass 1 via psutil: create_time + cpu_times + memory_info only."""
+    now = time.time()
+    for p in psutil.process_iter(attrs=["create_time", "cpu_times", "memory_info"]):
+        info: dict[str, Any] = p.info  # type: ignore[assignment]
+        created = info.get("create_time")
+        if not isinstance(created, (int, float)):
+            continue
+        times = info.get("cpu_times")
+        cpu_s = float(times.user + times.system) if times is not None else 0.0
+        rss = int(getattr(info.get("memory_info"), "rss", 0) or 0)
+        yield (int(p.pid), float(created), cpu_s, rss, now - created, p)
+
+
+def _scan_procfs() -> Iterator[_Scan]:
+    """Pass 1 via /proc: stat + statm per PID, no string decoding."""
+    hz = float(procfs.CLK_TCK)
+    up = procfs.uptime()
+    for pid in procfs.pids():
+        st = procfs.read_stat(pid)
+        if st is None:
+            continue
+        rss = procfs.read_rss(pid)
+        if rss is None:
+            continue
+        start = float(st.start_ticks)
+        yield (pid, start, st.cpu_ticks / hz, rss, up - start / hz, None)
+
+
+def _identity_psutil(entry: _Entry) -> Optional[ProcessIdentity]:
+    proc: psutil.Process = entry.handle
+    name = f"pid:{entry.pid}"
+    cmdline: Optional[List[str]] = None
+    uid = -1
+    exe = ""
+    try:
+        with proc.oneshot():
+            try:
+                name = proc.name() or name
+                cmdline = proc.cmdline()
+                uid = int(proc.uids().real)
+                exe = proc.exe()
+            except psutil.AccessDenied:
+                pass
+    except (psutil.NoSuchProcess, psutil.ZombieProcess):
+        return None
+    return ProcessIdentity(name, _flatten_cmdline(cmdline, name), uid, exe)
+
+
+def _identity_procfs(entry: _Entry) -> Optional[ProcessIdentity]:
+    name = procfs.read_comm(entry.pid)
+    if name is None:
+        return None  # exited between passes
+    uid = procfs.read_uid(entry.pid)
+    return ProcessIdentity(
+        name,
+        _flatten_cmdline(procfs.read_cmdline(entry.pid), name),
+        uid if uid is not None else -1,
+        procfs.read_exe(entry.pid),
+    )
+
+
+# ----- Process table -----------------------------------------------------------
+
+
+class ProcessTable:
     """
-    log.debug("Collecting process metrics (limit=%d, sort_by=%s)", limit, sort_by)
+    Persistent process table shared across ticks.
 
-    attrs = ["pid", "name", "cmdline", "cpu_percent", "memory_info"]
-    rows: List[ProcessRow] = []
+    - Entries are keyed by (pid, start time) so PID reuse starts fresh.
+    - CPU% is computed here from cumulative CPU-time deltas between updates;
+      a newly seen process is measured over its own lifetime instead of
+      reading 0.0.
+    - name/cmdline/uid/exe are read once per process lifetime, and only
+      for processes that are actually shown.
+    - Entries for exited processes are dropped on the next update.
+    """
 
-    ncpu = psutil.cpu_count(logical=True) or 1
-    ncpu_f = float(ncpu)
+    def __init__(self, backend: Backend | None = None) -> None:
+        self.backend = _resolve_backend(backend)
+        self._entries: Dict[int, _Entry] = {}
+        self._ts: Optional[float] = None
+        self._ncpu = float(psutil.cpu_count(logical=True) or 1)
+        self._lock = threading.Lock()
 
-    for p in psutil.process_iter(attrs=attrs):
-        try:
-            info: dict[str, Any] = p.info  # type: ignore[assignment]
+    def __len__(self) -> int:
+        return len(self._entries)
 
-            pid_obj = info.get("pid", p.pid)
-            pid = int(pid_obj) if isinstance(pid_obj, (int, float)) else int(p.pid)
+    def _scan(self) -> Iterator[_Scan]:
+        if self.backend == "procfs":
+            return _scan_procfs()
+        return _scan_psutil()
 
-            name_obj = info.get("name")
-            name = str(name_obj) if isinstance(name_obj, str) else f"pid:{pid}"
+    def update(self, now: Optional[float] = None) -> None:
+        """
+        Pass 1 for every process: refresh CPU%, RSS and evict exited PIDs.
+        `now` (time.monotonic()) lets a caller share one timestamp with
+        other collectors read in the same tick.
+        """
+        with self._lock:
+            try:
+                records = list(self._scan())
+            except OSError as e:
+                log.debug("procfs scan failed (%s); falling back to psutil", e)
+                self.backend = "psutil"
+                self._entries = {}
+                records = list(self._scan())
 
-            cmdline_obj = info.get("cmdline")
-            cmdline_list: Optional[List[str]] = (
-                cmdline_obj if isinstance(cmdline_obj, list) else None
-            )
+            if now is None:
+                now = time.monotonic()
+            dt = now - self._ts if self._ts is not None else 0.0
+            # CPU seconds per wall second -> percent normalized across CPUs
+            scale = 100.0 / self._ncpu
 
-            cpu_obj = info.get("cpu_percent")
-            raw_cpu_pct = float(cpu_obj) if isinstance(cpu_obj, (int, float)) else 0.0
+            old = self._entries
+            fresh: Dict[int, _Entry] = {}
+            for pid, start, cpu_s, rss, age, handle in records:
+                entry = old.get(pid)
+                if entry is not None and entry.start == start:
+                    window = dt
+                    used = cpu_s - entry.cpu_s
+                else:
+                    # New to the table (just started, or missed by an
+                    # earlier scan): cpu_s is its lifetime total
+                    entry = _Entry(pid, start, handle)
+                    window = age
+                    used = cpu_s
+                entry.cpu_percent = (
+                    _clamp_pct(used / window * scale) if window > 0.0 else 0.0
+                )
+                entry.cpu_s = cpu_s
+                entry.rss = rss
+                fresh[pid] = entry
 
-            # Normalize to 0–100 across CPUs and clamp
-            cpu_pct = raw_cpu_pct / ncpu_f
-            if cpu_pct < 0.0:
-                cpu_pct = 0.0
-            if cpu_pct > 100.0:
-                cpu_pct = 100.0
+            self._entries = fresh
+            self._ts = now
 
-            meminfo = info.get("memory_info")
-            rss = int(getattr(meminfo, "rss", 0) or 0)
+    def top(self, limit: int = 50, sort_by: SortKey = "cpu") -> List[ProcessRow]:
+        """
+        Partial selection of the top `limit` entries (heapq, O(n log limit));
+        limit <= 0 means "everything, sorted". Identity fields are loaded
+        only for the selected entries that do not have them yet.
+        """
+        key = _RSS_KEY if sort_by == "rss" else _CPU_KEY
+        load = _identity_procfs if self.backend == "procfs" else _identity_psutil
+        with self._lock:
+            entries = self._entries.values()
+            if limit > 0:
+                winners = heapq.nlargest(limit, entries, key=key)
+            else:
+                winners = sorted(entries, key=key, reverse=True)
 
-            rows.append(
-                ProcessRow(
-                    pid=pid,
-                    name=name,
-                    cmdline=_flatten_cmdline(cmdline_list, name),
-                    cpu_percent=round(cpu_pct, 1),
-                    rss_bytes=rss,
+            rows: List[ProcessRow] = []
+            for e in winners:
+                if e.ident is None:
+                    e.ident = load(e)
+                    if e.ident is None:
+                        continue
+                rows.append(
+                    ProcessRow(
+                        pid=e.pid,
+                        name=e.ident.name,
+                        cmdline=e.ident.cmdline,
+                        cpu_percent=round(e.cpu_percent, 1),
+                        rss_bytes=e.rss,
+                    )
                 )
-            )
-        except (psutil.AccessDenied, psutil.NoSuchProcess, psutil.ZombieProcess):
-            continue
+            return rows
 
-    if not rows:
-        log.debug("Processes collected: 0 rows")
-        return []
+    def identity(self, pid: int) -> Optional[ProcessIdentity]:
+        """Cached identity for `pid` (loaded on demand if still running)."""
+        load = _identity_procfs if self.backend == "procfs" else _identity_psutil
+        with self._lock:
+            entry = self._entries.get(pid)
+            if entry is None:
+                return None
+            if entry.ident is None:
+                entry.ident = load(entry)
+            return entry.ident
 
-    if sort_by == "rss":
-        rows.sort(key=lambda r: r["rss_bytes"], reverse=True)
-    else:
-        rows.sort(key=lambda r: (r["cpu_percent"], r["rss_bytes"]), reverse=True)
+    def sample(self, limit: int = 50, sort_by: SortKey = "cpu") -> List[ProcessRow]:
+        self.update()
+        return self.top(limit=limit, sort_by=sort_by)
 
-    if limit > 0:
-        rows = rows[:limit]
 
+_TABLES: Dict[str, ProcessTable] = {}
+_TABLES_LOCK = threading.Lock()
+
+
+def shared_table(backend: Backend | None = None) -> ProcessTable:
+    """
+    Process-wide ProcessTable for the resolved backend, shared by `top`,
+    `pro` and anything else calling sample().
+    """
+    name = _resolve_backend(backend)
+    with _TABLES_LOCK:
+        table = _TABLES.get(name)
+        if table is None:
+            table = _TABLES[name] = ProcessTable(name)  # type: ignore[arg-type]
+        return table
+
+
+# ----- Public API --------------------------------------------------------------
+
+
+def sample(
+    limit: int = 50, sort_by: SortKey = "cpu", backend: Backend | None = None
+) -> List[ProcessRow]:
+    """
+    Collect a snapshot of running processes (top-N by `sort_by`).
+
+    - backend: "psutil", "procfs" or "auto"; None reads `process_backend`
+      from config (default "auto").
+    - Uses the shared ProcessTable, so CPU% is measured since the previous
+      call and name/cmdline are only read for newly shown processes.
+    - Normalizes per-process CPU% to a 0–100 scale across logical CPUs.
+    """
+    table = shared_table(backend)
+    log.debug(
+        "Collecting process metrics (limit=%d, sort_by=%s, backend=%s)",
+        limit,
+        sort_by,
+        table.backend,
+    )
+    rows = table.sample(limit=limit, sort_by=sort_by)
     log.debug("Processes collected: %d rows", len(rows))
     return rows
@@ -0,0 +1,242 @@
+"""
+CPU socket / NUMA node topology and per-node aggregation.
+
+The layout is read once from sysfs and cached:
+  /sys/devices/system/cpu/online                       → logical CPUs
+  /sys/devices/system/cpu/cpuN/topology/physical_package_id → socket
+  /sys/devices/system/node/nodeN/cpulist               → NUMA node
+
+Every group carries the positions of its CPUs in the `per_cpu` list of
+collectors.cpu (online CPUs in ascending order), so a tick aggregates load
+by indexing, with no id lookups. Per-node memory comes from one read of
+nodeN/meminfo per node. A CPU count that no longer matches the cached
+layout (hotplug) triggers one re-read.
+
+Where sysfs is unavailable everything is reported as one node and one
+socket, with memory from psutil.
+
+Returns (sample()):
+{
+    "nodes": [{"node": int, "cpus": int, "cpu_percent": float,
+               "mem_total": int, "mem_used": int, "mem_percent": float}, ...],
+    "sockets": [{"socket": int, "cpus": int, "cpu_percent": float}, ...]
+}
+mem_used excludes page cache and reclaimable slab, like mem.sample()["used"].
+"""
+
+from __future__ import annotations
+
+import os
+import threading
+from typing import Dict, List, NamedTuple, Optional, Sequence, Tuple
+
+import psutil
+from neonhud.collectors import cpu as cpu_col
+from neonhud.core.logging import get_logger
+
+log = get_logger()
+
+SYS_CPU = "/sys/devices/system/cpu"
+SYS_NODE = "/sys/devices/system/node"
+
+# nodeN/meminfo fields used (kB)
+_MEM_FIELDS = (b"MemTotal:", b"MemFree:", b"FilePages:", b"SReclaimable:")
+
+
+class CpuGroup(NamedTuple):
+    id: int
+    cpus: Tuple[int, ...]  # logical CPU ids
+    pos: Tuple[int, ...]  # positions of those CPUs in per_cpu
+
+
+class Topology(NamedTuple):
+    cpu_ids: Tuple[int, ...]  # online CPUs, ascending (per_cpu order)
+    nodes: Tuple[CpuGroup, ...]
+    sockets: Tuple[CpuGroup, ...]
+    from_sysfs: bool
+
+
+def parse_cpulist(text: str) -> List[int]:
+    """Expand a sysfs CPU list such as "0-3,8,10-11"."""
+    out: List[int] = []
+    for part in text.strip().split(","):
+        if not part:
+            continue
+        lo, _, hi = part.partition("-")
+        out.extend(range(int(lo), int(hi or lo) + 1))
+    return out
+
+
+def _read_text(path: str) -> Optional[str]:
+    try:
+        with open(path, "r", encoding="ascii") as f:
+            return f.read()
+    except (OSError, ValueError):
+        return None
+
+
+def _groups(members: Dict[int, List[int]], pos: Dict[int, int]) -> Tuple[CpuGroup, ...]:
+    return tuple(
+        CpuGroup(gid, tuple(cpus), tuple(pos[c] for c in cpus if c in pos))
+        for gid, cpus in sorted(members.items())
+    )
+
+
+def read_topology() -> Topology:
+    """Read the current layout from sysfs (uncached)."""
+    online = _read_text(os.path.join(SYS_CPU, "online"))
+    if online is None:
+        n = psutil.cpu_count() or 1
+        every = (CpuGroup(0, tuple(range(n)), tuple(range(n))),)
+        return Topology(tuple(range(n)), every, every, False)
+
+    cpu_ids = tuple(parse_cpulist(online))
+    pos = {c: i for i, c in enumerate(cpu_ids)}
+
+    sockets: Dict[int, List[int]] = {}
+    for c in cpu_ids:
+        pkg = _read_text(
+            os.path.join(SYS_CPU, f"cpu{c}", "topology", "physical_package_id")
+        )
+        sid = int(pkg) if pkg and pkg.strip().lstrip("-").isdigit() else 0
+        sockets.setdefault(max(0, sid), []).append(c)
+
+    nodes: Dict[int, List[int]] = {}
+    try:
+        entries = os.listdir(SYS_NODE)
+    except OSError:
+        entries = []
+    for name in entries:
+        if not (name.startswith("node") and name[4:].isdigit()):
+            continue
+        cpulist = _read_text(os.path.join(SYS_NODE, name, "cpulist"))
+        nodes[int(name[4:])] = [c for c in parse_cpulist(cpulist or "") if c in pos]
+    if not nodes:
+        nodes = {0: list(cpu_ids)}
+
+    return Topology(cpu_ids, _groups(nodes, pos), _groups(sockets, pos), True)
+
+
+_LOCK = threading.Lock()
+_CACHED: Optional[Topology] = None
+
+
+def topology(ncpu: Optional[int] = None) -> Topology:
+    """
+    The cached layout; read on first use, and again if `ncpu` (the length
+    of a per_cpu list about to be aggregated) no longer matches it.
+    """
+    global _CACHED
+    with _LOCK:
+        topo = _CACHED
+        if topo is None or (ncpu is not None and ncpu != len(topo.cpu_ids)):
+            topo = read_topology()
+            log.debug(
+                "Topology: %d CPUs, %d node(s), %d socket(s)",
+                len(topo.cpu_ids),
+                len(topo.nodes),
+                len(topo.sockets),
+            )
+            _CACHED = topo
+        return topo
+
+
+def cpu_groups(
+    topo: Optional[Topology] = None, ncpu: Optional[int] = None
+) -> List[Tuple[str, Sequence[int]]]:
+    """
+    (label, per_cpu positions) per NUMA node ("N0", ...), else per socket
+    ("S0", ...). Empty on single-node, single-socket hosts, and when
+    `ncpu` says the per_cpu list is not from this layout (e.g. a replay).
+    """
+    t = topo or topology()
+    if ncpu is not None and ncpu != len(t.cpu_ids):
+        return []
+    if len(t.nodes) > 1:
+        return [(f"N{g.id}", g.pos) for g in t.nodes]
+    if len(t.sockets) > 1:
+        return [(f"S{g.id}", g.pos) for g in t.sockets]
+    return []
+
+
+def aggregate(per_cpu: Sequence[float], groups: Sequence[CpuGroup]) -> List[float]:
+    """Mean load of each group's CPUs (0.0 for a group with none)."""
+    out: List[float] = []
+    n = len(per_cpu)
+    for g in groups:
+        idx = g.pos
+        if idx and idx[-1] >= n:  # per_cpu shorter than the layout
+            idx = tuple(i for i in idx if i < n)
+        out.append(sum(map(per_cpu.__getitem__, idx)) / len(idx) if idx else 0.0)
+    return out
+
+
+def _node_memory(node: int) -> Optional[Tuple[int, int]]:
+    """(total, used) bytes of one node, from nodeN/meminfo."""
+    try:
+        with open(os.path.join(SYS_NODE, f"node{node}", "meminfo"), "rb") as f:
+            data = f.read()
+    except OSError:
+        return None
+    kb: Dict[bytes, int] = {}
+    for line in data.splitlines():
+        parts = line.split()  # Node 0 MemTotal: 123 kB
+        if len(parts) >= 4 and parts[2] in _MEM_FIELDS:
+            kb[parts[2]] = int(parts[3])
+    total, free, files, slab = (kb.get(k, 0) * 1024 for k in _MEM_FIELDS)
+    return total, max(0, total - free - files - slab)
+
+
+def _pct(part: float, whole: float) -> float:
+    return round(part / whole * 100.0, 1) if whole > 0 else 0.0
+
+
+class TopologySampler:
+    """
+    Per-node and per-socket aggregation for one consumer. Load comes from
+    the caller's per_cpu list, or from this sampler's own CpuSampler so its
+    deltas do not disturb other consumers of collectors.cpu.
+    """
+
+    def __init__(self) -> None:
+        self._cpu = cpu_col.CpuSampler()
+
+    def sample(self, per_cpu: Optional[Sequence[float]] = None) -> Dict[str, object]:
+        if per_cpu is None:
+            per_cpu = self._cpu.sample_breakdown().busy[1:]
+        topo = topology(len(per_cpu))
+
+        node_load = aggregate(per_cpu, topo.nodes)
+        nodes: List[Dict[str, object]] = []
+        for g, load in zip(topo.nodes, node_load):
+            mem = _node_memory(g.id) if topo.from_sysfs else None
+            if mem is None and len(topo.nodes) == 1:
+                vm = psutil.virtual_memory()
+                mem = int(vm.total), int(vm.used)
+            total, used = mem or (0, 0)
+            nodes.append(
+                {
+                    "node": g.id,
+                    "cpus": len(g.cpus),
+                    "cpu_percent": round(load, 1),
+                    "mem_total": total,
+                    "mem_used": used,
+                    "mem_percent": _pct(used, total),
+                }
+            )
+        sockets = [
+            {"socket": g.id, "cpus": len(g.cpus), "cpu_percent": round(load, 1)}
+            for g, load in zip(topo.sockets, aggregate(per_cpu, topo.sockets))
+        ]
+        return {"nodes": nodes, "sockets": sockets}
+
+
+_DEFAULT = TopologySampler()
+
+
+def sample(per_cpu: Optional[Sequence[float]] = None) -> Dict[str, object]:
+    """
+    Per-node CPU load and memory plus per-socket load. Without `per_cpu`,
+    load is measured since the previous call (since boot on the first).
+    """
+    return _DEFAULT.sample(per_cpu)
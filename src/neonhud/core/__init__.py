@@ -1,3 +1,3 @@
-from .config import load_config, DEFAULT_CONFIG
+from .config import get_config, load_config, DEFAULT_CONFIG
 
-__all__ = ["load_config", "DEFAULT_CONFIG"]
+__all__ = ["get_config", "load_config", "DEFAULT_CONFIG"]
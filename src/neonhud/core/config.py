@@ -5,14 +5,22 @@ Search order:
 2. OS default config dir (~/.config/neonhud/config.toml on Linux/Mac,
    %APPDATA%/NeonHud/config.toml on Windows)
 3. Built-in defaults
+
+The file is parsed once and cached as a read-only view. get_config()
+re-stats the file at most once per `max_age` seconds and re-parses it only
+when its (mtime, size, inode) changed, so renderers can call it per frame
+without touching the disk; a running view picks up edits the same way.
+load_config() returns a private mutable copy for callers that want one.
 """
 
 from __future__ import annotations
+import copy
 import os
-import tomllib
+import threading
+import time
 from pathlib import Path
-from typing import Any, Dict
-
+from types import MappingProxyType
+from typing import Any, Dict, Mapping, NamedTuple, Optional, Tuple
 
 DEFAULT_CONFIG: Dict[str, Any] = {
     "theme": "classic",
@@ -20,6 +28,23 @@ DEFAULT_CONFIG: Dict[str, Any] = {
     "process_limit": 15,
 }
 
+# Seconds between stat() calls on the config file for get_config()
+RECHECK_INTERVAL = 1.0
+
+_FileKey = Optional[Tuple[int, int, int]]  # (mtime_ns, size, inode); None = no file
+
+
+class _Cached(NamedTuple):
+    path: str
+    key: _FileKey
+    data: Dict[str, Any]
+    view: Mapping[str, Any]
+    checked: float  # time.monotonic() of the last stat
+
+
+_CACHE: Optional[_Cached] = None
+_LOCK = threading.Lock()
+
 
 def _default_config_path() -> Path:
     if os.name == "nt":  # Windows
@@ -30,22 +55,76 @@ def _default_config_path() -> Path:
         return Path(base) / "neonhud" / "config.toml"
 
 
-def load_config() -> Dict[str, Any]:
-    """Load config dict, falling back to defaults if missing/invalid."""
-    path = None
+def _config_path() -> Path:
     env_path = os.environ.get("NEONHUD_CONFIG")
-    if env_path:
-        path = Path(env_path)
-    else:
-        path = _default_config_path()
-
-    if path and path.is_file():
-        try:
-            with open(path, "rb") as f:
-                data = tomllib.load(f)
-            merged = {**DEFAULT_CONFIG, **data}
-            return merged
-        except Exception:
-            return dict(DEFAULT_CONFIG)
-    else:
+    return Path(env_path) if env_path else _default_config_path()
+
+
+def _file_key(path: Path) -> _FileKey:
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    if not os.path.isfile(path):
+        return None
+    return (st.st_mtime_ns, st.st_size, st.st_ino)
+
+
+def _parse(path: Path, key: _FileKey) -> Dict[str, Any]:
+    """Defaults merged with the file, or defaults alone if missing/invalid."""
+    if key is None:
+        return dict(DEFAULT_CONFIG)
+    import tomllib  # only when there is a file to parse (report cold start)
+
+    try:
+        with open(path, "rb") as f:
+            data = tomllib.load(f)
+        return {**DEFAULT_CONFIG, **data}
+    except Exception:
         return dict(DEFAULT_CONFIG)
+
+
+def _freeze(value: Any) -> Any:
+    if isinstance(value, dict):
+        return MappingProxyType({k: _freeze(v) for k, v in value.items()})
+    if isinstance(value, list):
+        return tuple(_freeze(v) for v in value)
+    return value
+
+
+def _refresh(max_age: float) -> _Cached:
+    global _CACHE
+    path = _config_path()
+    now = time.monotonic()
+    cached = _CACHE
+    if (
+        cached is not None
+        and cached.path == str(path)
+        and now - cached.checked < max_age
+    ):
+        return cached
+    with _LOCK:
+        key = _file_key(path)
+        cached = _CACHE
+        if cached is not None and cached.path == str(path) and cached.key == key:
+            cached = cached._replace(checked=now)
+        else:
+            data = _parse(path, key)
+            cached = _Cached(str(path), key, data, _freeze(data), now)
+        _CACHE = cached
+        return cached
+
+
+def get_config(max_age: Optional[float] = None) -> Mapping[str, Any]:
+    """
+    Read-only config view (nested tables are read-only mappings too).
+    The same object is returned until the file changes, so `is` tells a
+    caller whether anything needs re-applying. The file is re-checked at
+    most every `max_age` seconds (default RECHECK_INTERVAL).
+    """
+    return _refresh(RECHECK_INTERVAL if max_age is None else max_age).view
+
+
+def load_config() -> Dict[str, Any]:
+    """Load config dict, falling back to defaults if missing/invalid."""
+    return copy.deepcopy(_refresh(0.0).data)
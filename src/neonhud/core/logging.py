@@ -1,7 +1,10 @@
 """
 Logging setup for NeonHud.
 
-Provides a configured logger with RichHandler if available.
+Provides a configured logger with RichHandler if available and STDERR is
+a terminal; otherwise (cron, systemd, pipes) a plain StreamHandler with a
+timestamped one-line format, which also keeps Rich out of the import path
+of non-interactive runs. NEONHUD_LOG_RICH=1/0 forces either way.
 Log level can be set via:
 - Config file (key: log_level)
 - Env var NEONHUD_LOG_LEVEL
@@ -22,15 +25,7 @@ from typing import Optional
 
 from neonhud.core import config as core_config
 
-try:
-    from rich.console import Console
-    from rich.logging import RichHandler
-
-    _HAS_RICH = True
-except Exception:
-    Console = None  # type: ignore
-    RichHandler = None  # type: ignore
-    _HAS_RICH = False
+_PLAIN_FORMAT = "%(asctime)s %(levelname)-8s %(message)s"
 
 _LOGGER: Optional[logging.Logger] = None
 _CONFIGURED = False
@@ -41,35 +36,53 @@ def _configure_once() -> None:
     if _CONFIGURED:
         return
 
-    cfg = core_config.load_config()
+    cfg = core_config.get_config()
     cfg_level = str(cfg.get("log_level", "")).upper()
     env_level = os.environ.get("NEONHUD_LOG_LEVEL", "").upper()
 
     level_str = env_level or cfg_level or "INFO"
     level = getattr(logging, level_str, logging.INFO)
 
-    handlers: list[logging.Handler] = []
-    if _HAS_RICH and RichHandler is not None and Console is not None:
-        handlers.append(
-            RichHandler(
-                console=Console(stderr=True),  # send logs to STDERR
-                markup=True,
-                rich_tracebacks=True,
-                log_time_format="%H:%M:%S",
-            )
-        )
-    else:
-        handlers.append(logging.StreamHandler(stream=sys.stderr))
+    handler = _rich_handler() if _want_rich() else None
+    if handler is None:
+        handler = logging.StreamHandler(stream=sys.stderr)
+        handler.setFormatter(logging.Formatter(_PLAIN_FORMAT, "%H:%M:%S"))
 
     # Configure root logger once
     logging.basicConfig(
         level=level,
-        handlers=handlers,
+        handlers=[handler],
         format="%(message)s",
     )
     _CONFIGURED = True
 
 
+def _want_rich() -> bool:
+    forced = os.environ.get("NEONHUD_LOG_RICH", "").strip().lower()
+    if forced in ("1", "true", "yes"):
+        return True
+    if forced in ("0", "false", "no"):
+        return False
+    try:
+        return sys.stderr.isatty()
+    except (AttributeError, ValueError):
+        return False
+
+
+def _rich_handler() -> Optional[logging.Handler]:
+    try:
+        from rich.console import Console
+        from rich.logging import RichHandler
+    except Exception:
+        return None
+    return RichHandler(
+        console=Console(stderr=True),  # send logs to STDERR
+        markup=True,
+        rich_tracebacks=True,
+        log_time_format="%H:%M:%S",
+    )
+
+
 def get_logger() -> logging.Logger:
     """
     Return the global NeonHud logger (singleton).
@@ -0,0 +1,440 @@
+"""
+Binary recording format for `neonhud record`.
+
+Layout (little-endian):
+  MAGIC                 8 bytes  b"NHREC\\x00\\x01\\x00"
+  header length         uint32
+  header                JSON, space-padded so frames start 8-byte aligned:
+                        {"schema": "neonhud.record.v1", "columns": [...],
+                         "frame": "<dNf", "interval": 1.0, "host": {...},
+                         "started": "<UTC ISO8601>"}
+  frames                fixed width: float64 wall-clock timestamp followed by
+                        one float32 per column, in header order
+
+Fixed-width frames keep a file seekable by arithmetic (frame i lives at
+data_offset + i * frame_size) and cost 8 + 4 * len(columns) bytes each.
+A writer that crashes mid-frame leaves a partial tail, which readers ignore
+and RecordWriter truncates before appending.
+
+Recording maps a file read-only with mmap: opening costs one header read
+regardless of size, and frames are unpacked on demand. Because frames are
+fixed width and appended in time order, the timestamps themselves form the
+time index: seek() bisects them in O(log n) page touches.
+
+compact() rewrites a recording with the Gorilla codec (utils.gorilla):
+same header plus "codec"/"block_size", then column-wise encoded blocks
+  uint32 count, then per stream (timestamps, each column): uint32 length + bytes
+and a block index footer
+  per block: int64 first ts (ms), uint64 offset, uint32 count
+  trailer:   uint64 index offset, uint32 block count, b"NHZI"
+CompressedRecording reads the footer, bisects it, and decodes only the
+block it needs; open_recording() picks the right reader.
+"""
+
+from __future__ import annotations
+
+import bisect
+import functools
+import json
+import mmap
+import os
+import struct
+import time
+from typing import (
+    Any,
+    BinaryIO,
+    Dict,
+    Iterator,
+    List,
+    Mapping,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Tuple,
+)
+
+from neonhud.utils import gorilla
+
+MAGIC = b"NHREC\x00\x01\x00"
+SCHEMA = "neonhud.record.v1"
+
+_LEN = struct.Struct("<I")
+_PREFIX = len(MAGIC) + _LEN.size
+
+
+class Header(NamedTuple):
+    columns: List[str]
+    interval: float
+    meta: Dict[str, Any]  # everything else from the JSON header
+    data_offset: int  # byte offset of frame 0
+    frame: struct.Struct  # packs (ts, *columns)
+
+
+def frame_struct(ncolumns: int) -> struct.Struct:
+    return struct.Struct(f"<d{ncolumns}f")
+
+
+def encode_header(
+    columns: Sequence[str], interval: float, meta: Dict[str, Any]
+) -> bytes:
+    doc = dict(meta)
+    doc.update(
+        schema=SCHEMA,
+        columns=list(columns),
+        frame=frame_struct(len(columns)).format,
+        interval=float(interval),
+    )
+    body = json.dumps(doc, separators=(",", ":")).encode("utf-8")
+    body += b" " * (-(_PREFIX + len(body)) % 8)
+    return MAGIC + _LEN.pack(len(body)) + body
+
+
+def read_header(f: BinaryIO) -> Header:
+    """Parse the header at the start of `f`; raises ValueError if invalid."""
+    prefix = f.read(_PREFIX)
+    if len(prefix) != _PREFIX or not prefix.startswith(MAGIC):
+        raise ValueError("not a NeonHud recording")
+    (size,) = _LEN.unpack(prefix[len(MAGIC) :])
+    body = f.read(size)
+    if len(body) != size:
+        raise ValueError("truncated recording header")
+    doc = json.loads(body.decode("utf-8"))
+    if doc.get("schema") != SCHEMA:
+        raise ValueError(f"unsupported recording schema: {doc.get('schema')!r}")
+    columns = [str(c) for c in doc.pop("columns")]
+    interval = float(doc.pop("interval", 0.0))
+    doc.pop("frame", None)
+    return Header(columns, interval, doc, _PREFIX + size, frame_struct(len(columns)))
+
+
+def iter_frames(path: str) -> Iterator[Tuple[float, ...]]:
+    """Sequentially yield (ts, *values) for every complete frame."""
+    with open(path, "rb") as f:
+        hdr = read_header(f)
+        size = hdr.frame.size
+        while True:
+            chunk = f.read(size * 256)
+            whole = len(chunk) - len(chunk) % size
+            yield from hdr.frame.iter_unpack(chunk[:whole])
+            if len(chunk) < size * 256:
+                return
+
+
+class RecordWriter:
+    """
+    Appends frames through a buffered file, flushing and fsync()ing at most
+    every `fsync_interval` seconds. Appending to an existing recording is
+    allowed when its columns and interval match (e.g. after a service
+    restart); compacted recordings are never appended to.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        columns: Sequence[str],
+        interval: float,
+        meta: Dict[str, Any],
+        fsync_interval: float = 10.0,
+        buffer_size: int = 64 * 1024,
+    ) -> None:
+        self.path = path
+        self.columns = list(columns)
+        self.fsync_interval = fsync_interval
+        self._frame = frame_struct(len(self.columns))
+        self.frames = 0
+        self._f = self._open(interval, meta, buffer_size)
+        self._synced_at = time.monotonic()
+
+    def _open(
+        self, interval: float, meta: Dict[str, Any], buffer_size: int
+    ) -> BinaryIO:
+        if os.path.exists(self.path) and os.path.getsize(self.path) > 0:
+            with open(self.path, "rb") as f:
+                hdr = read_header(f)
+            if hdr.meta.get("codec"):
+                raise ValueError(
+                    f"{self.path} is a compacted recording and cannot be "
+                    "appended to; choose a new file"
+                )
+            if hdr.columns != self.columns:
+                raise ValueError(
+                    f"{self.path} was recorded with different columns; "
+                    "choose a new file"
+                )
+            if hdr.interval != float(interval):
+                raise ValueError(
+                    f"{self.path} was recorded every {hdr.interval:g}s, not "
+                    f"{float(interval):g}s; choose a new file"
+                )
+            # Drop a partial frame left by a crash, then append
+            size = os.path.getsize(self.path)
+            whole = size - (size - hdr.data_offset) % self._frame.size
+            f_append = open(self.path, "r+b", buffering=buffer_size)
+            f_append.truncate(whole)
+            f_append.seek(whole)
+            self.frames = (whole - hdr.data_offset) // self._frame.size
+            return f_append
+        f_new = open(self.path, "wb", buffering=buffer_size)
+        f_new.write(encode_header(self.columns, interval, meta))
+        return f_new
+
+    def write(self, ts: float, values: Sequence[float]) -> None:
+        self._f.write(self._frame.pack(ts, *values))
+        self.frames += 1
+        now = time.monotonic()
+        if now - self._synced_at >= self.fsync_interval:
+            self.sync()
+            self._synced_at = now
+
+    def sync(self) -> None:
+        self._f.flush()
+        os.fsync(self._f.fileno())
+
+    def close(self) -> None:
+        if not self._f.closed:
+            self.sync()
+            self._f.close()
+
+    def __enter__(self) -> "RecordWriter":
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.close()
+
+
+class _Timestamps(Sequence[float]):
+    """Lazy view of frame timestamps for bisect (reads 8 bytes per probe)."""
+
+    def __init__(self, rec: "Recording") -> None:
+        self._rec = rec
+
+    def __len__(self) -> int:
+        return len(self._rec)
+
+    def __getitem__(self, i: Any) -> Any:
+        return self._rec.ts(i)
+
+
+class Recording:
+    """
+    Read-only, memory-mapped access to a recording.
+
+    Usage:
+        with Recording("metrics.nhr") as rec:
+            i = rec.seek(rec.start + 3600)
+            ts, *values = rec.frame(i)
+    """
+
+    def __init__(self, path: str) -> None:
+        size = self._open(path)
+        if self.header.meta.get("codec"):
+            self.close()
+            raise ValueError(f"{path} is compressed; use open_recording()")
+        self._frame = self.header.frame
+        self._count = max(0, size - self.header.data_offset) // self._frame.size
+        self._ts = struct.Struct("<d")
+
+    def _open(self, path: str) -> int:
+        """Read the header and map the file; returns the file size."""
+        self.path = path
+        self._f = open(path, "rb")
+        try:
+            self.header = read_header(self._f)
+            size = os.fstat(self._f.fileno()).st_size
+            self._mm: Optional[mmap.mmap] = (
+                mmap.mmap(self._f.fileno(), 0, access=mmap.ACCESS_READ)
+                if size > self.header.data_offset
+                else None
+            )
+        except Exception:
+            self._f.close()
+            raise
+        self._index = {name: i + 1 for i, name in enumerate(self.header.columns)}
+        return size
+
+    @property
+    def columns(self) -> List[str]:
+        return self.header.columns
+
+    def __len__(self) -> int:
+        return self._count
+
+    def _offset(self, i: int) -> int:
+        if not 0 <= i < self._count:
+            raise IndexError(i)
+        return self.header.data_offset + i * self._frame.size
+
+    def ts(self, i: int) -> float:
+        assert self._mm is not None
+        return self._ts.unpack_from(self._mm, self._offset(i))[0]
+
+    def frame(self, i: int) -> Tuple[float, ...]:
+        """(ts, *values) of frame i."""
+        assert self._mm is not None
+        return self._frame.unpack_from(self._mm, self._offset(i))
+
+    def values(self, i: int) -> Dict[str, float]:
+        """Frame i as {column: value} (plus "ts")."""
+        row = self.frame(i)
+        out = {name: row[j] for name, j in self._index.items()}
+        out["ts"] = row[0]
+        return out
+
+    @property
+    def start(self) -> float:
+        return self.ts(0) if self._count else 0.0
+
+    @property
+    def end(self) -> float:
+        return self.ts(self._count - 1) if self._count else 0.0
+
+    def seek(self, ts: float) -> int:
+        """Index of the last frame at or before `ts` (0 if ts is earlier)."""
+        if not self._count:
+            return 0
+        i = bisect.bisect_right(_Timestamps(self), ts) - 1
+        return max(0, i)
+
+    def close(self) -> None:
+        if self._mm is not None:
+            self._mm.close()
+            self._mm = None
+        self._f.close()
+
+    def __enter__(self) -> "Recording":
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.close()
+
+
+# ----- Compressed recordings -----------------------------------------------------
+
+CODEC = "gorilla"
+_U32 = struct.Struct("<I")
+_INDEX = struct.Struct("<qQI")
+_TRAILER = struct.Struct("<QI4s")
+_TRAILER_MAGIC = b"NHZI"
+
+
+def compact(
+    src: str,
+    dst: str,
+    block_size: int = 1024,
+    decimals: Optional[Mapping[str, Optional[int]]] = None,
+) -> Tuple[int, int]:
+    """
+    Rewrite recording `src` as a Gorilla-compressed file at `dst`.
+    `decimals` maps column -> precision kept (missing/None = exact).
+    Returns (frames, bytes written).
+    """
+    decimals = decimals or {}
+    with Recording(src) as rec:
+        cols = rec.columns
+        meta = dict(rec.header.meta, codec=CODEC, block_size=block_size)
+        meta["decimals"] = {k: v for k, v in decimals.items() if v is not None}
+        index: List[Tuple[int, int, int]] = []
+        with open(dst, "wb") as out:
+            out.write(encode_header(cols, rec.header.interval, meta))
+            for b0 in range(0, len(rec), block_size):
+                rows = [rec.frame(i) for i in range(b0, min(len(rec), b0 + block_size))]
+                ts_ms = [gorilla.to_ms(r[0]) for r in rows]
+                streams = [gorilla.encode_timestamps(ts_ms)]
+                for j, name in enumerate(cols, start=1):
+                    streams.append(
+                        gorilla.encode_values([r[j] for r in rows], decimals.get(name))
+                    )
+                index.append((ts_ms[0], out.tell(), len(rows)))
+                out.write(_U32.pack(len(rows)))
+                for data in streams:
+                    out.write(_U32.pack(len(data)))
+                    out.write(data)
+            index_at = out.tell()
+            for entry in index:
+                out.write(_INDEX.pack(*entry))
+            out.write(_TRAILER.pack(index_at, len(index), _TRAILER_MAGIC))
+            written = out.tell()
+        return len(rec), written
+
+
+class CompressedRecording(Recording):
+    """Recording API over a compact()ed file; decodes one block at a time."""
+
+    def __init__(self, path: str) -> None:
+        size = self._open(path)
+        meta = self.header.meta
+        if meta.get("codec") != CODEC or self._mm is None:
+            self.close()
+            raise ValueError(f"{path} is not a {CODEC} recording")
+        self._decimals: Dict[str, Optional[int]] = meta.get("decimals") or {}
+        index_at, nblocks, magic = _TRAILER.unpack_from(self._mm, size - _TRAILER.size)
+        if magic != _TRAILER_MAGIC:
+            self.close()
+            raise ValueError(f"{path}: missing block index (incomplete compact?)")
+        self._first_ms: List[int] = []
+        self._offsets: List[int] = []
+        self._starts: List[int] = []  # index of each block's first frame
+        total = 0
+        for k in range(nblocks):
+            first, offset, count = _INDEX.unpack_from(
+                self._mm, index_at + k * _INDEX.size
+            )
+            self._first_ms.append(first)
+            self._offsets.append(offset)
+            self._starts.append(total)
+            total += count
+        self._count = total
+        self._block = functools.lru_cache(maxsize=2)(self._decode_block)
+
+    def _streams(self, b: int) -> Tuple[int, List[bytes]]:
+        assert self._mm is not None
+        pos = self._offsets[b]
+        (count,) = _U32.unpack_from(self._mm, pos)
+        pos += _U32.size
+        out: List[bytes] = []
+        for _ in range(1 + len(self.columns)):
+            (n,) = _U32.unpack_from(self._mm, pos)
+            pos += _U32.size
+            out.append(self._mm[pos : pos + n])
+            pos += n
+        return count, out
+
+    def _decode_block(self, b: int) -> List[Tuple[float, ...]]:
+        count, streams = self._streams(b)
+        ts = [t / 1000.0 for t in gorilla.decode_timestamps(streams[0], count)]
+        cols = [
+            gorilla.decode_values(data, count, self._decimals.get(name))
+            for name, data in zip(self.columns, streams[1:])
+        ]
+        return list(zip(ts, *cols))
+
+    def _locate(self, i: int) -> Tuple[int, int]:
+        if not 0 <= i < self._count:
+            raise IndexError(i)
+        b = bisect.bisect_right(self._starts, i) - 1
+        return b, i - self._starts[b]
+
+    def ts(self, i: int) -> float:
+        return self.frame(i)[0]
+
+    def frame(self, i: int) -> Tuple[float, ...]:
+        b, k = self._locate(i)
+        return self._block(b)[k]
+
+    def seek(self, ts: float) -> int:
+        if not self._count:
+            return 0
+        b = max(0, bisect.bisect_right(self._first_ms, gorilla.to_ms(ts)) - 1)
+        rows = self._block(b)
+        k = (
+            bisect.bisect_right([gorilla.to_ms(r[0]) for r in rows], gorilla.to_ms(ts))
+            - 1
+        )
+        return max(0, self._starts[b] + k)
+
+
+def open_recording(path: str) -> Recording:
+    """Open a plain or compressed recording with the matching reader."""
+    with open(path, "rb") as f:
+        codec = read_header(f).meta.get("codec")
+    return CompressedRecording(path) if codec else Recording(path)
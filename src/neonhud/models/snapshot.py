@@ -9,20 +9,44 @@ Shape:
   "cpu": {...},        # from collectors.cpu.sample()
   "memory": {...},     # from collectors.mem.sample()
   "disk_io": {...},    # from collectors.disk.sample_counters()
-  "net_io": {...}      # from collectors.net.sample_counters()
+  "net_io": {...},     # from collectors.net.sample_counters()
+  "topology": {...},   # from collectors.topology.sample(), per node/socket
+  "disk_stats": {...}  # from collectors.diskstats, {device: {read_iops,
+                       # write_iops, read_bps, write_bps, read_await,
+                       # write_await, queue, in_flight, util}}
 }
+
+Without a builder, disk_stats are averages since the previous build() in
+this process (since boot on the first, like iostat's first report).
+
+SnapshotBuilder.build() returns the same shape plus a "rates" block
+computed against its previous call:
+
+  "rates": {"interval": s, "disk_read_bps": f, "disk_write_bps": f,
+            "net_rx_bps": f, "net_tx_bps": f,
+            "processes": [ProcessRow, ...]}  # only with processes > 0
+
+build(window=S) brackets one S-second sleep with two builder reads, so
+CPU, disk, net and per-process CPU are all measured over that window.
 """
 
 from __future__ import annotations
 
-from typing import Any, Dict
+from typing import Any, Dict, Optional, Tuple
 import platform
+import time
 
 from neonhud.utils import now_utc_iso
 from neonhud.collectors import cpu as cpu_col
 from neonhud.collectors import mem as mem_col
 from neonhud.collectors import disk as disk_col
+from neonhud.collectors import diskstats as diskstats_col
 from neonhud.collectors import net as net_col
+from neonhud.collectors import procs as procs_col
+from neonhud.collectors import topology as topo_col
+
+# Top processes by CPU listed in the rates block
+RATE_PROCESSES = 10
 
 
 def _platform_host() -> Dict[str, str]:
@@ -45,15 +69,28 @@ def _platform_host() -> Dict[str, str]:
     return {"hostname": hostname, "os": os_name, "kernel": kernel}
 
 
-def build() -> Dict[str, Any]:
+def build(window: Optional[float] = None) -> Dict[str, Any]:
     """
     Build a single snapshot dict with stable top-level keys.
+
+    Without `window`, CPU load is relative to the previous call in this
+    process (since boot on the first) and disk/net are raw counters. With
+    `window`, the snapshot is measured over that many seconds and carries
+    a "rates" block (see SnapshotBuilder).
     """
+    if window is not None:
+        builder = SnapshotBuilder(processes=RATE_PROCESSES)
+        builder.build()
+        time.sleep(max(0.0, window))
+        return builder.build()
+
     host = _platform_host()
     cpu = cpu_col.sample()
     memory = mem_col.sample()
     disk_io = disk_col.sample_counters()
     net_io = net_col.sample_counters()
+    topology = topo_col.sample(cpu["per_cpu"])  # type: ignore[arg-type]
+    disk_stats = diskstats_col.as_dict(diskstats_col.sample())
 
     return {
         "schema": "neonhud.report.v1",
@@ -63,4 +100,76 @@ def build() -> Dict[str, Any]:
         "memory": memory,
         "disk_io": disk_io,
         "net_io": net_io,
+        "topology": topology,
+        "disk_stats": disk_stats,
     }
+
+
+class SnapshotBuilder:
+    """
+    Repeated snapshots for long-running consumers (`report --stream`).
+
+    Keeps its own CpuSampler, DiskStatsSampler and the previous disk/net
+    counters, so every build() after the first reports CPU load, byte rates
+    and per-device disk statistics over the time since the previous
+    build() rather than since boot.
+
+    All counters of one build() share a single monotonic timestamp, so the
+    rates of two builds are measured over exactly the same interval. With
+    `processes` > 0 the top processes by CPU over that interval are
+    listed too (a ProcessTable is kept for it).
+    """
+
+    def __init__(self, processes: int = 0) -> None:
+        self._host = _platform_host()
+        self._cpu = cpu_col.CpuSampler()
+        self._disks = diskstats_col.DiskStatsSampler()
+        self._processes = processes
+        self._procs = procs_col.ProcessTable() if processes > 0 else None
+        self._prev: Optional[Tuple[float, Dict[str, Any], Dict[str, Any]]] = None
+
+    def build(self) -> Dict[str, Any]:
+        now = time.monotonic()
+        cpu = self._cpu.sample()
+        memory = mem_col.sample()
+        disk_io: Dict[str, Any] = dict(disk_col.sample_counters())
+        net_io: Dict[str, Any] = dict(net_col.sample_counters())
+        topology = topo_col.sample(cpu["per_cpu"])  # type: ignore[arg-type]
+        disk_stats = diskstats_col.as_dict(self._disks.sample(now))
+        if self._procs is not None:
+            self._procs.update(now)
+
+        prev, self._prev = self._prev, (now, disk_io, net_io)
+        dt = now - prev[0] if prev is not None else 0.0
+
+        def _rate(curr: Dict[str, Any], old: Dict[str, Any], key: str) -> float:
+            if dt <= 0.0:
+                return 0.0
+            return round(max(0, int(curr[key]) - int(old[key])) / dt, 1)
+
+        p_disk = prev[1] if prev is not None else disk_io
+        p_net = prev[2] if prev is not None else net_io
+        rates: Dict[str, Any] = {
+            "interval": round(dt, 3),
+            "disk_read_bps": _rate(disk_io, p_disk, "read_bytes"),
+            "disk_write_bps": _rate(disk_io, p_disk, "write_bytes"),
+            "net_rx_bps": _rate(net_io, p_net, "bytes_recv"),
+            "net_tx_bps": _rate(net_io, p_net, "bytes_sent"),
+        }
+        if self._procs is not None:
+            rates["processes"] = [
+                dict(row)
+                for row in self._procs.top(limit=self._processes, sort_by="cpu")
+            ]
+        return {
+            "schema": "neonhud.report.v1",
+            "timestamp": now_utc_iso(),
+            "host": self._host,
+            "cpu": cpu,
+            "memory": memory,
+            "disk_io": disk_io,
+            "net_io": net_io,
+            "topology": topology,
+            "disk_stats": disk_stats,
+            "rates": rates,
+        }
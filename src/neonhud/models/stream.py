@@ -0,0 +1,78 @@
+"""
+Delta-encoded JSON Lines for `neonhud report --stream`.
+
+Every `keyframe_every` lines (and always first) a line is a full snapshot;
+the lines in between carry only the fields that changed since the previous
+line, nested the same way. Lists are replaced whole, a removed key is sent
+as null. Every line has "seq" and "key" (true on keyframes):
+
+  {"seq": 1, "key": true, "schema": "neonhud.report.v1", "cpu": {...}, ...}
+  {"seq": 2, "key": false, "timestamp": "...", "cpu": {"percent_total": 7.5}}
+
+A consumer rebuilds the current snapshot with apply(state, line), starting
+from any keyframe.
+"""
+
+from __future__ import annotations
+
+from typing import Any, Dict, Mapping, Optional
+
+_META = ("seq", "key")
+
+
+def diff(prev: Mapping[str, Any], curr: Mapping[str, Any]) -> Dict[str, Any]:
+    """Fields of `curr` that differ from `prev` (removed keys -> None)."""
+    out: Dict[str, Any] = {}
+    for k, v in curr.items():
+        if k not in prev:
+            out[k] = v
+            continue
+        old = prev[k]
+        if isinstance(v, Mapping) and isinstance(old, Mapping):
+            sub = diff(old, v)
+            if sub:
+                out[k] = sub
+        elif v != old or type(v) is not type(old):
+            out[k] = v
+    for k in prev:
+        if k not in curr:
+            out[k] = None
+    return out
+
+
+def apply(state: Mapping[str, Any], line: Mapping[str, Any]) -> Dict[str, Any]:
+    """Snapshot after `line` (a keyframe replaces `state`)."""
+    if line.get("key"):
+        return {k: v for k, v in line.items() if k not in _META}
+    return _merge(state, {k: v for k, v in line.items() if k not in _META})
+
+
+def _merge(base: Mapping[str, Any], delta: Mapping[str, Any]) -> Dict[str, Any]:
+    out = dict(base)
+    for k, v in delta.items():
+        if v is None:
+            out.pop(k, None)
+        elif isinstance(v, Mapping) and isinstance(out.get(k), Mapping):
+            out[k] = _merge(out[k], v)
+        else:
+            out[k] = v
+    return out
+
+
+class DeltaEncoder:
+    def __init__(self, keyframe_every: int = 60) -> None:
+        self.keyframe_every = max(1, int(keyframe_every))
+        self._seq = 0
+        self._prev: Optional[Mapping[str, Any]] = None
+
+    def encode(self, snap: Mapping[str, Any]) -> Dict[str, Any]:
+        """The next line for `snap` (a dict ready for json.dumps)."""
+        key = self._prev is None or self._seq % self.keyframe_every == 0
+        self._seq += 1
+        line: Dict[str, Any] = {"seq": self._seq, "key": key}
+        if key or self._prev is None:
+            line.update(snap)
+        else:
+            line.update(diff(self._prev, snap))
+        self._prev = snap
+        return line
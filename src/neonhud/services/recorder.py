@@ -0,0 +1,112 @@
+"""
+Collectors and row mapping for `neonhud record`.
+
+One Sampler runs these collectors for the lifetime of the recording; each
+published Frame becomes one fixed-width row (see models.recording). Rates
+are computed here against the previous counters, so a row is
+self-contained and replay needs no history to render it.
+"""
+
+from __future__ import annotations
+
+import time
+from typing import Any, Callable, Dict, List, Mapping, Optional, Tuple
+
+from neonhud.collectors import cpu as cpu_col
+from neonhud.collectors import disk as disk_col
+from neonhud.collectors import mem as mem_col
+from neonhud.collectors import net as net_col
+from neonhud.services.sampler import Collector
+
+# Fixed columns; per-CPU busy % follows as cpu0..cpuN-1
+BASE_COLUMNS = (
+    "cpu_total",
+    "cpu_user",
+    "cpu_system",
+    "cpu_iowait",
+    "cpu_steal",
+    "mem_percent",
+    "mem_used",
+    "mem_available",
+    "mem_total",
+    "disk_read_bps",
+    "disk_write_bps",
+    "net_rx_bps",
+    "net_tx_bps",
+)
+
+
+class _Rates:
+    """Bytes/sec of two cumulative counters between consecutive calls."""
+
+    def __init__(self, read: Callable[[], Tuple[int, int]]) -> None:
+        self._read = read
+        self._prev: Optional[Tuple[float, int, int]] = None
+
+    def __call__(self) -> Tuple[float, float]:
+        now = time.monotonic()
+        a, b = self._read()
+        prev, self._prev = self._prev, (now, a, b)
+        if prev is None or now <= prev[0]:
+            return 0.0, 0.0
+        dt = now - prev[0]
+        return max(0, a - prev[1]) / dt, max(0, b - prev[2]) / dt
+
+
+def _disk_bytes() -> Tuple[int, int]:
+    c = disk_col.sample_counters()
+    return c["read_bytes"], c["write_bytes"]
+
+
+def _net_bytes() -> Tuple[int, int]:
+    c = net_col.sample_counters()
+    return c["bytes_recv"], c["bytes_sent"]
+
+
+def columns(ncpu: int) -> List[str]:
+    return list(BASE_COLUMNS) + [f"cpu{i}" for i in range(ncpu)]
+
+
+def decimals(cols: List[str]) -> Dict[str, Optional[int]]:
+    """
+    Precision kept per column when compacting: percentages to 0.1 (what
+    the collectors report), byte counts and rates to whole bytes.
+    """
+    return {c: 1 if c.startswith("cpu") or c == "mem_percent" else 0 for c in cols}
+
+
+def collectors() -> Dict[str, Collector]:
+    """All critical: a recording row is only as good as its weakest column."""
+    cpu_sampler = cpu_col.CpuSampler()
+    return {
+        "cpu": Collector(cpu_sampler.sample, critical=True),
+        "mem": Collector(mem_col.sample, critical=True),
+        "disk": Collector(_Rates(_disk_bytes), critical=True),
+        "net": Collector(_Rates(_net_bytes), critical=True),
+    }
+
+
+def to_row(values: Mapping[str, Any], ncpu: int) -> List[float]:
+    """Flatten one Frame's values into column order (missing -> 0.0)."""
+    cpu = values.get("cpu") or {}
+    mem = values.get("mem") or {}
+    brk = cpu.get("breakdown") or {}
+    disk = values.get("disk") or (0.0, 0.0)
+    net = values.get("net") or (0.0, 0.0)
+    per_cpu = list(cpu.get("per_cpu") or [])[:ncpu]
+    per_cpu += [0.0] * (ncpu - len(per_cpu))
+    return [
+        float(cpu.get("percent_total", 0.0)),
+        float(brk.get("user", 0.0)),
+        float(brk.get("system", 0.0)),
+        float(brk.get("iowait", 0.0)),
+        float(brk.get("steal", 0.0)),
+        float(mem.get("percent", 0.0)),
+        float(mem.get("used", 0)),
+        float(mem.get("available", 0)),
+        float(mem.get("total", 0)),
+        float(disk[0]),
+        float(disk[1]),
+        float(net[0]),
+        float(net[1]),
+    ] + [float(v) for v in per_cpu]
@@ -0,0 +1,127 @@
+"""
+Replay source for `neonhud replay`.
+
+A ReplaySource stands in for the live collectors: it exposes the same
+shapes (cpu.sample(), mem.sample(), disk/net rates) read from a Recording
+instead of the system, so dashboard.collectors(source=...) and
+pro_dash.collectors(source=...) render a file exactly like live data.
+
+Playback runs on a virtual clock: recording time advances `speed` times
+faster than real time from the seek position, and every collector call
+reads the frame at the current virtual time. Nothing is buffered, so
+memory stays constant for any recording size.
+"""
+
+from __future__ import annotations
+
+import time
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
+
+from neonhud.models.recording import Recording
+
+# Sampler ticks cannot be closer than this, so "max" means one frame per tick
+MIN_TICK = 0.01
+
+
+def parse_speed(value: str) -> Optional[float]:
+    """ "1", "10x", "max" -> playback speed (None for as fast as possible)."""
+    v = value.strip().lower()
+    if v in ("max", "fast", "0"):
+        return None
+    speed = float(v[:-1] if v.endswith("x") else v)
+    if speed <= 0.0:
+        raise ValueError(f"invalid speed: {value!r}")
+    return speed
+
+
+def parse_start(value: str, rec: Recording) -> float:
+    """
+    Seek target as recording time: "+90" (seconds from the start),
+    an epoch timestamp, or an ISO-8601 datetime.
+    """
+    v = value.strip()
+    if v.startswith("+"):
+        return rec.start + float(v[1:])
+    try:
+        return float(v)
+    except ValueError:
+        pass
+    dt = datetime.fromisoformat(v.replace("Z", "+00:00"))
+    return dt.timestamp()
+
+
+class ReplaySource:
+    def __init__(
+        self,
+        rec: Recording,
+        speed: Optional[float] = 1.0,
+        start: Optional[float] = None,
+    ) -> None:
+        self.rec = rec
+        step = rec.header.interval or 1.0
+        # None = as fast as possible: one recorded interval per MIN_TICK
+        self.speed = speed if speed is not None else step / MIN_TICK
+        self.interval = max(MIN_TICK, step / self.speed)
+        self._origin = rec.start
+        if start is not None and len(rec):
+            self._origin = rec.ts(rec.seek(start))
+        self._t0: Optional[float] = None
+        self._ncpu = sum(
+            1 for c in rec.columns if c.startswith("cpu") and c[3:].isdigit()
+        )
+
+    # ----- clock -------------------------------------------------------------
+
+    def clock(self) -> float:
+        """Current position in recording (wall-clock) time."""
+        now = time.monotonic()
+        if self._t0 is None:
+            self._t0 = now
+        return self._origin + (now - self._t0) * self.speed
+
+    @property
+    def done(self) -> bool:
+        return not len(self.rec) or (
+            self._t0 is not None and self.clock() > self.rec.end
+        )
+
+    def _row(self) -> Dict[str, float]:
+        if not len(self.rec):
+            return {}
+        return self.rec.values(self.rec.seek(self.clock()))
+
+    # ----- collector-shaped readers --------------------------------------------
+
+    def cpu(self) -> Dict[str, Any]:
+        r = self._row()
+        per_cpu: List[float] = [
+            round(r.get(f"cpu{i}", 0.0), 1) for i in range(self._ncpu)
+        ]
+        breakdown = {
+            k: round(r.get(f"cpu_{k}", 0.0), 1)
+            for k in ("user", "system", "iowait", "steal")
+        }
+        breakdown["irq"] = 0.0  # not recorded
+        return {
+            "percent_total": round(r.get("cpu_total", 0.0), 1),
+            "per_cpu": per_cpu,
+            "breakdown": breakdown,
+        }
+
+    def mem(self) -> Dict[str, Any]:
+        r = self._row()
+        return {
+            "total": int(r.get("mem_total", 0)),
+            "used": int(r.get("mem_used", 0)),
+            "available": int(r.get("mem_available", 0)),
+            "percent": round(r.get("mem_percent", 0.0), 1),
+        }
+
+    def disk_rates(self) -> Tuple[float, float]:
+        r = self._row()
+        return r.get("disk_read_bps", 0.0), r.get("disk_write_bps", 0.0)
+
+    def net_rates(self) -> Tuple[float, float]:
+        r = self._row()
+        return r.get("net_rx_bps", 0.0), r.get("net_tx_bps", 0.0)
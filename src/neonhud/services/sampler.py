@@ -0,0 +1,387 @@
+"""
+Background sampling engine.
+
+Runs a set of named collectors on a dedicated thread and publishes
+immutable Frames. The render loop never calls collectors itself; it only
+renders the latest published Frame.
+
+Design:
+- Each collector declares its own period (and optionally a cost budget);
+  collectors without one run at the sampler's base interval, ONCE runs a
+  single time. Between runs the Frame keeps serving the cached value.
+- Deadlines are absolute on time.monotonic() and grid-aligned per
+  collector, so periods do not drift with collector latency. Collectors
+  due within `coalesce` seconds of each other share one wakeup; deadlines
+  that could not be met are skipped (and counted) instead of bunching up.
+- A collector whose run exceeds its budget has its next deadline pushed
+  out proportionally, capping its duty cycle.
+- With a frame budget, critical collectors always run inline first; any
+  other collector whose predicted cost (running mean + 2 deviations of its
+  past run times) does not fit in what is left of the frame is handed to a
+  background worker. Until it finishes, Frames serve its cached value and
+  list it in Frame.stale once it is overdue.
+- Publishing is a single reference swap of a frozen Frame; readers of
+  latest() never take a lock. wait() uses a Condition only to sleep.
+- A collector that raises keeps its previous value and is logged.
+"""
+
+from __future__ import annotations
+
+import math
+import queue
+import threading
+import time
+from dataclasses import dataclass, field, replace
+from types import MappingProxyType
+from typing import (
+    AbstractSet,
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Mapping,
+    Optional,
+    Set,
+    Union,
+)
+
+from neonhud.core.logging import get_logger
+
+log = get_logger()
+
+CollectFn = Callable[[], Any]
+
+# Period for collectors that only need to run once (e.g. host info)
+ONCE = math.inf
+
+
+@dataclass(frozen=True)
+class Collector:
+    fn: CollectFn
+    period: Optional[float] = None  # seconds; None = sampler interval; ONCE
+    budget: Optional[float] = None  # seconds per run before backing off
+    critical: bool = False  # always refreshed inline, never deferred
+
+
+@dataclass(frozen=True)
+class Frame:
+    seq: int  # 1, 2, 3, ... (0 means "nothing published yet")
+    ts: float  # time.monotonic() at wakeup
+    wall: float  # time.time() at wakeup
+    values: Mapping[str, Any]  # collector name -> latest (possibly cached) value
+    updated: Mapping[str, float] = field(default_factory=dict)  # name -> ts of value
+    stale: AbstractSet[str] = frozenset()  # overdue or never collected
+
+
+class RunningStats:
+    """Exponentially weighted mean/deviation of a collector's run time."""
+
+    __slots__ = ("alpha", "count", "mean", "var", "max")
+
+    def __init__(self, alpha: float = 0.2) -> None:
+        self.alpha = alpha
+        self.count = 0
+        self.mean = 0.0
+        self.var = 0.0
+        self.max = 0.0
+
+    def push(self, x: float) -> None:
+        if self.count == 0:
+            self.mean = x
+        else:
+            d = x - self.mean
+            self.mean += self.alpha * d
+            self.var = (1.0 - self.alpha) * (self.var + self.alpha * d * d)
+        self.count += 1
+        self.max = max(self.max, x)
+
+    def predict(self) -> float:
+        """Pessimistic estimate of the next run time (mean + 2 sigma)."""
+        return self.mean + 2.0 * math.sqrt(self.var)
+
+
+@dataclass(frozen=True)
+class SamplerStats:
+    ticks: int = 0  # published frames
+    skipped: int = 0  # collector deadlines missed because a run overran
+    deferred: int = 0  # runs moved off the frame to the background worker
+    drift: float = 0.0  # seconds the last wakeup started after its deadline
+    max_drift: float = 0.0
+    latency: Mapping[str, float] = field(default_factory=dict)  # last run, seconds
+    mean_latency: Mapping[str, float] = field(default_factory=dict)
+
+    def summary(self) -> str:
+        lat = " ".join(f"{k}={v * 1000.0:.1f}ms" for k, v in self.mean_latency.items())
+        return (
+            f"ticks={self.ticks} skipped={self.skipped} deferred={self.deferred} "
+            f"drift={self.drift * 1000.0:.1f}ms max_drift={self.max_drift * 1000.0:.1f}ms "
+            f"latency: {lat or '-'}"
+        )
+
+
+def parse_period(value: Any) -> Optional[float]:
+    """Config value -> period: number of seconds, or "once"."""
+    if isinstance(value, str) and value.strip().lower() == "once":
+        return ONCE
+    try:
+        period = float(value)
+    except (TypeError, ValueError):
+        return None
+    return period if period > 0.0 else None
+
+
+def apply_cadence(
+    collectors: Mapping[str, Collector], overrides: Mapping[str, Any]
+) -> Dict[str, Collector]:
+    """
+    Override declared periods from config, e.g. a `[cadence]` table:
+        cpu = 0.5
+        procs = 2
+        disk_usage = 30
+        host = "once"
+    Unknown names and invalid values are ignored.
+    """
+    out = dict(collectors)
+    for name, raw in overrides.items():
+        spec = out.get(name)
+        period = parse_period(raw)
+        if spec is None or period is None:
+            continue
+        out[name] = replace(spec, period=period)
+    return out
+
+
+class Sampler:
+    """
+    Usage:
+        with Sampler({"cpu": cpu.sample}, interval=1.0) as s:
+            frame = s.wait(0, timeout=5.0)
+    """
+
+    def __init__(
+        self,
+        collectors: Mapping[str, Union[CollectFn, Collector]],
+        interval: float,
+        name: str = "neonhud-sampler",
+        coalesce: Optional[float] = None,
+        frame_budget: Optional[float] = None,
+    ) -> None:
+        self.interval = max(0.01, float(interval))
+        self.coalesce = (
+            float(coalesce) if coalesce is not None else min(0.05, self.interval / 4)
+        )
+        self.frame_budget = frame_budget if frame_budget and frame_budget > 0 else None
+        self._specs: Dict[str, Collector] = {
+            k: v if isinstance(v, Collector) else Collector(v)
+            for k, v in collectors.items()
+        }
+        self._values: Dict[str, Any] = {}
+        self._updated: Dict[str, float] = {}
+        self._latency: Dict[str, float] = {}
+        self._cost: Dict[str, RunningStats] = {k: RunningStats() for k in self._specs}
+        self._inflight: Set[str] = set()
+        self._frame: Optional[Frame] = None
+        self._stats = SamplerStats()
+        self._lock = threading.RLock()  # collector state + stats + publish
+        self._cond = threading.Condition()
+        self._stop = threading.Event()
+        self._slow: "queue.Queue[Optional[str]]" = queue.Queue()
+        self._thread = threading.Thread(target=self._run, name=name, daemon=True)
+        self._worker = threading.Thread(
+            target=self._run_slow, name=f"{name}-slow", daemon=True
+        )
+
+    def period(self, name: str) -> float:
+        p = self._specs[name].period
+        return self.interval if p is None else p
+
+    # ----- lifecycle ---------------------------------------------------------
+
+    def start(self) -> "Sampler":
+        self._thread.start()
+        if self.frame_budget is not None:
+            self._worker.start()
+        return self
+
+    def stop(self, timeout: float = 2.0) -> None:
+        self._stop.set()
+        self._slow.put(None)
+        with self._cond:
+            self._cond.notify_all()
+        if self._thread.is_alive():
+            self._thread.join(timeout)
+
+    def __enter__(self) -> "Sampler":
+        return self.start()
+
+    def __exit__(self, *exc: object) -> None:
+        self.stop()
+
+    # ----- readers -----------------------------------------------------------
+
+    def latest(self) -> Optional[Frame]:
+        return self._frame
+
+    def stats(self) -> SamplerStats:
+        return self._stats
+
+    def wait(self, after_seq: int, timeout: Optional[float] = None) -> Optional[Frame]:
+        """
+        Block until a frame newer than `after_seq` is published (or timeout).
+        Returns that frame, or None on timeout/stop.
+        """
+        with self._cond:
+            self._cond.wait_for(
+                lambda: self._stop.is_set()
+                or (self._frame is not None and self._frame.seq > after_seq),
+                timeout,
+            )
+        frame = self._frame
+        if frame is None or frame.seq <= after_seq:
+            return None
+        return frame
+
+    # ----- sampling ----------------------------------------------------------
+
+    def _collect(self, name: str) -> float:
+        """Run one collector, cache its value, and return its latency."""
+        t0 = time.monotonic()
+        ok = False
+        value: Any = None
+        try:
+            value = self._specs[name].fn()
+            ok = True
+        except Exception as e:  # keep last good value
+            log.debug("Collector %s failed: %s", name, e)
+        latency = time.monotonic() - t0
+        with self._lock:
+            if ok:
+                self._values[name] = value
+                self._updated[name] = t0
+            self._latency[name] = latency
+            self._cost[name].push(latency)
+        return latency
+
+    def _is_stale(self, name: str, now: float) -> bool:
+        updated = self._updated.get(name)
+        if updated is None:
+            return True
+        period = self.period(name)
+        if period == ONCE:
+            return False
+        return now - updated > 2.0 * period + (self.frame_budget or 0.0)
+
+    def _publish(self, ts: float, wall: float) -> Frame:
+        with self._lock:
+            prev = self._frame
+            now = time.monotonic()
+            frame = Frame(
+                seq=(prev.seq if prev else 0) + 1,
+                ts=ts,
+                wall=wall,
+                values=MappingProxyType(dict(self._values)),
+                updated=MappingProxyType(dict(self._updated)),
+                stale=frozenset(n for n in self._specs if self._is_stale(n, now)),
+            )
+            self._stats = replace(
+                self._stats,
+                ticks=self._stats.ticks + 1,
+                latency=MappingProxyType(dict(self._latency)),
+                mean_latency=MappingProxyType(
+                    {k: c.mean for k, c in self._cost.items() if c.count}
+                ),
+            )
+            with self._cond:
+                self._frame = frame
+                self._cond.notify_all()
+        return frame
+
+    def tick(self, names: Optional[Iterable[str]] = None) -> Frame:
+        """
+        Run the given collectors (default: all) once and publish a Frame.
+        Also usable inline without starting the thread.
+        """
+        ts = time.monotonic()
+        wall = time.time()
+        for name in self._specs if names is None else names:
+            self._collect(name)
+        return self._publish(ts, wall)
+
+    def _run_slow(self) -> None:
+        """Background worker for collectors that did not fit in a frame."""
+        while True:
+            name = self._slow.get()
+            if name is None or self._stop.is_set():
+                return
+            self._collect(name)
+            with self._lock:
+                self._inflight.discard(name)
+            self._publish(time.monotonic(), time.time())
+
+    def _order(self, ready: List[str]) -> List[str]:
+        """Critical collectors first, then cheapest predicted cost first."""
+        return sorted(
+            ready,
+            key=lambda n: (not self._specs[n].critical, self._cost[n].predict()),
+        )
+
+    def _fits(self, name: str, frame_start: float) -> bool:
+        if self.frame_budget is None or self._specs[name].critical:
+            return True
+        cost = self._cost[name]
+        if cost.count == 0:
+            return False  # unknown cost: measure it off the frame first
+        spent = time.monotonic() - frame_start
+        return cost.predict() <= self.frame_budget - spent
+
+    def _run(self) -> None:
+        start = time.monotonic()
+        due: Dict[str, float] = {name: start for name in self._specs}
+
+        while not self._stop.is_set():
+            now = time.monotonic()
+            ready = [n for n, d in due.items() if d <= now + self.coalesce]
+            if ready:
+                drift = max(0.0, now - min(due[n] for n in ready))
+                wall = time.time()
+                skipped = deferred = 0
+                for name in self._order(ready):
+                    began = time.monotonic()
+                    latency = 0.0
+                    if self._fits(name, now):
+                        latency = self._collect(name)
+                    else:
+                        with self._lock:
+                            queued = name not in self._inflight
+                            self._inflight.add(name)
+                        if queued:
+                            self._slow.put(name)
+                        deferred += 1
+                    period = self.period(name)
+                    if period == ONCE:
+                        due[name] = ONCE
+                        continue
+                    # Stay on this collector's grid; count deadlines we missed.
+                    after = time.monotonic()
+                    steps = max(1, math.floor((after - due[name]) / period) + 1)
+                    skipped += steps - 1
+                    due[name] += steps * period
+                    budget = self._specs[name].budget
+                    if budget and latency > budget:
+                        due[name] = max(due[name], began + period * latency / budget)
+                with self._lock:
+                    self._stats = replace(
+                        self._stats,
+                        drift=drift,
+                        max_drift=max(self._stats.max_drift, drift),
+                        skipped=self._stats.skipped + skipped,
+                        deferred=self._stats.deferred + deferred,
+                    )
+                self._publish(now, wall)
+
+            next_due = min(due.values(), default=ONCE)
+            if next_due == ONCE:
+                self._stop.wait()  # everything was one-shot
+                break
+            self._stop.wait(max(0.0, next_due - time.monotonic()))
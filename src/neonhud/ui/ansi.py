@@ -0,0 +1,185 @@
+"""
+Minimal-diff ANSI renderer for slow links (serial consoles, laggy SSH).
+
+AnsiScreen is a drop-in for rich.live.Live in the CLI loop (update() and
+refresh()): the same renderables from dashboard/pro_dash/process_table
+are laid out by Rich into a grid of cells, compared with the previous
+frame, and only changed runs of cells are sent as cursor moves plus
+characters, in one write per frame. Unchanged rows are skipped before
+they are even split into cells.
+
+CountingWriter wraps a text stream and counts the bytes written, so the
+Rich backend can report bytes per frame the same way.
+"""
+
+from __future__ import annotations
+
+from typing import IO, Any, Dict, List, Optional, Tuple
+
+from rich.cells import cell_len
+from rich.console import COLOR_SYSTEMS, Console, RenderableType
+from rich.segment import Segment
+from rich.style import Style
+
+# A gap of unchanged cells shorter than this is re-sent rather than jumped
+# over: a cursor move costs ~8 bytes
+_GAP = 6
+
+_ENTER = "\x1b[?1049h\x1b[?25l\x1b[2J"
+_LEAVE = "\x1b[0m\x1b[?25h\x1b[?1049l"
+_RESET = "\x1b[0m"
+
+Cell = Tuple[str, str]  # (character, SGR prefix); "" marks a wide-char tail
+
+
+class CountingWriter:
+    """Text stream proxy that counts UTF-8 bytes written."""
+
+    def __init__(self, stream: IO[str]) -> None:
+        self._stream = stream
+        self.bytes = 0
+
+    def write(self, s: str) -> int:
+        self.bytes += len(s.encode("utf-8", "replace"))
+        return self._stream.write(s)
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._stream, name)
+
+
+class AnsiScreen:
+    """
+    Usage:
+        with AnsiScreen(console) as screen:
+            screen.update(renderable)
+    """
+
+    def __init__(self, console: Console) -> None:
+        self.console = console
+        system = console.color_system
+        self._color_system = COLOR_SYSTEMS.get(system) if system else None
+        self._sgr: Dict[Optional[Style], str] = {None: ""}
+        self._renderable: Optional[RenderableType] = None
+        self._size: Optional[Tuple[int, int]] = None
+        self._lines: List[List[Segment]] = []
+        self._cells: List[List[Cell]] = []
+        self.frames = 0
+        self.bytes = 0
+        self.last_bytes = 0
+
+    # ----- Live-compatible surface -------------------------------------------
+
+    def __enter__(self) -> "AnsiScreen":
+        self._write(_ENTER)
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self._write(_LEAVE)
+
+    def update(self, renderable: RenderableType, refresh: bool = True) -> None:
+        self._renderable = renderable
+        if refresh:
+            self.refresh()
+
+    def refresh(self) -> None:
+        if self._renderable is None:
+            return
+        out = self.diff(self._renderable)
+        self.frames += 1
+        self.last_bytes = self._write(out)
+
+    # ----- diffing -----------------------------------------------------------
+
+    def _style_sgr(self, style: Optional[Style]) -> str:
+        sgr = self._sgr.get(style)
+        if sgr is None:
+            assert style is not None
+            if self._color_system is None:
+                sgr = ""
+            else:
+                sgr = style.render("\x00", color_system=self._color_system)
+                sgr = sgr.split("\x00", 1)[0]
+            self._sgr[style] = sgr
+        return sgr
+
+    def _to_cells(self, line: List[Segment], width: int) -> List[Cell]:
+        cells: List[Cell] = []
+        for seg in line:
+            if seg.control:
+                continue
+            sgr = self._style_sgr(seg.style)
+            for ch in seg.text:
+                w = cell_len(ch)
+                if w == 0:
+                    if cells:
+                        cells[-1] = (cells[-1][0] + ch, cells[-1][1])
+                    continue
+                cells.append((ch, sgr))
+                if w == 2:
+                    cells.append(("", sgr))
+        if len(cells) < width:
+            cells.extend([(" ", "")] * (width - len(cells)))
+        return cells[:width]
+
+    def diff(self, renderable: RenderableType) -> str:
+        """Escape sequences turning the previous frame into this one."""
+        width, height = self.console.size
+        options = self.console.options.update_dimensions(width, height)
+        lines = self.console.render_lines(renderable, options, pad=True)
+
+        parts: List[str] = []
+        if self._size != (width, height):
+            # Resized (or first frame): nothing on screen can be trusted
+            self._size = (width, height)
+            self._lines = []
+            self._cells = []
+            parts.append(_RESET + "\x1b[2J")
+
+        current = None  # SGR in effect; None forces the first one out
+        new_cells: List[List[Cell]] = []
+        for row, line in enumerate(lines):
+            if row < len(self._lines) and self._lines[row] == line:
+                new_cells.append(self._cells[row])
+                continue
+            cells = self._to_cells(line, width)
+            new_cells.append(cells)
+            old = self._cells[row] if row < len(self._cells) else None
+            col = 0
+            while col < width:
+                if old is not None and old[col] == cells[col]:
+                    col += 1
+                    continue
+                # Extend the run across short unchanged gaps
+                end = col + 1
+                same = 0
+                while end < width and same < _GAP:
+                    if old is not None and old[end] == cells[end]:
+                        same += 1
+                    else:
+                        same = 0
+                    end += 1
+                end -= same
+                if col > 0 and cells[col][0] == "":
+                    col -= 1  # never start inside a wide character
+                parts.append(f"\x1b[{row + 1};{col + 1}H")
+                for ch, sgr in cells[col:end]:
+                    if sgr != current:
+                        parts.append(_RESET + sgr)
+                        current = sgr
+                    parts.append(ch)
+                col = end
+        self._lines = lines
+        self._cells = new_cells
+        if current:
+            parts.append(_RESET)
+        return "".join(parts)
+
+    def _write(self, data: str) -> int:
+        if not data:
+            return 0
+        f = self.console.file
+        f.write(data)
+        f.flush()
+        n = len(data.encode("utf-8", "replace"))
+        self.bytes += n
+        return n
@@ -0,0 +1,252 @@
+"""
+Braille line charts for the history panels.
+
+Every cell is a Unicode Braille glyph (U+2800 plus 8 dot bits), a 2x4 dot
+grid, so a chart has twice the horizontal and four times the vertical
+resolution of the block sparklines: one sample per dot column, newest on
+the right.
+
+Rasterization is bit-packed. Each cell is one byte of a column-major
+canvas (left dot column in the low nibble, right one in the high nibble),
+so a dot column is a run of `height` bytes. Those runs are looked up from
+a per-height table keyed by the segment drawn (previous level, level) and
+joined, the left and right columns of a series merge as two big ints,
+series are merged and assigned colors with a handful of whole-canvas int
+operations, and the rows are strided slices of the canvas translated to
+UTF-8 glyph bytes. Quantizing and lookup go through map() over the
+history buffer's memory, so nothing is built per sample in Python.
+
+Usage:
+  BrailleChart([(cpu_history, "green"), (mem_history, "magenta")], height=8)
+"""
+
+from __future__ import annotations
+
+import math
+import re
+from bisect import bisect_right
+from functools import lru_cache
+from itertools import repeat
+from operator import add, mul
+from typing import List, Optional, Sequence, Tuple, Union
+
+from rich.console import Console, ConsoleOptions, RenderResult
+from rich.measure import Measurement
+from rich.segment import Segment
+from rich.style import Style, StyleType
+
+from neonhud.utils.history import HistoryBuffer, Window
+from neonhud.utils.spark import thresholds
+
+Source = Union[HistoryBuffer, Window, Sequence[float]]
+
+# Braille dot bit for each (column, row) of a cell, rows top→bottom
+_LEFT_DOTS = (0x01, 0x02, 0x04, 0x40)
+_RIGHT_DOTS = (0x08, 0x10, 0x20, 0x80)
+
+
+def _utf8_tables() -> Tuple[bytes, bytes]:
+    # Canvas byte (left rows in bits 0-3, right rows in bits 4-7) → the
+    # 2nd and 3rd UTF-8 bytes of its glyph, U+2800 + dots = E2 (A0|d>>6)
+    # (80|d&63)
+    mid = bytearray(256)
+    low = bytearray(256)
+    for b in range(256):
+        dots = 0
+        for row in range(4):
+            if b & (1 << row):
+                dots |= _LEFT_DOTS[row]
+            if b & (16 << row):
+                dots |= _RIGHT_DOTS[row]
+        mid[b] = 0xA0 | dots >> 6
+        low[b] = 0x80 | dots & 0x3F
+    return bytes(mid), bytes(low)
+
+
+_UTF8_MID, _UTF8_LOW = _utf8_tables()
+_RUNS = re.compile(rb"(.)\1*", re.S)
+
+
+class _Columns(dict):
+    """
+    Dot-column bytes, one byte per cell row with the lit dots in the low
+    nibble (high nibble if `right`), built on first use. Line charts key
+    a column by prev_level * levels + level (the segment drawn into it),
+    fill charts by level alone; -1 is a blank column. Levels count from
+    the bottom dot row.
+    """
+
+    def __init__(self, height: int, fill: bool, right: bool) -> None:
+        super().__init__()
+        self.height = height
+        self.levels = 4 * height
+        self.fill = fill
+        self.shift = 4 if right else 0
+
+    def __missing__(self, key: int) -> bytes:
+        top = self.levels - 1
+        if key < 0:
+            rows = range(0)
+        elif self.fill:
+            rows = range(top - key, top + 1)
+        else:
+            p, y = divmod(key, self.levels)
+            # From just past the previous point to this one, so adjacent
+            # columns touch without doubling up
+            rp, ry = top - p, top - y
+            rows = range(ry, rp) if ry < rp else range(min(rp + 1, ry), ry + 1)
+        # Dot row r (0 = top) is bit r % 4 of byte r // 4
+        mask = sum(1 << (r // 4 * 8 + r % 4) for r in rows) << self.shift
+        col = mask.to_bytes(self.height, "little")
+        self[key] = col
+        return col
+
+
+@lru_cache(maxsize=16)
+def _columns_for(height: int, fill: bool) -> Tuple[_Columns, _Columns]:
+    return _Columns(height, fill, False), _Columns(height, fill, True)
+
+
+def _tail(src: Source, n: int) -> Sequence[float]:
+    """The newest `n` samples of `src` (fewer if it holds fewer)."""
+    if isinstance(src, HistoryBuffer):
+        older, newer = src.view()
+        if len(newer) >= n or not len(older):
+            return newer[-n:] if n else newer[:0]
+        out = list(older[-(n - len(newer)) :])
+        out.extend(newer)
+        return out
+    values = src.values if isinstance(src, Window) else src
+    return values[-n:] if n else values[:0]
+
+
+def _peak(src: Source, visible: Sequence[float]) -> float:
+    if isinstance(src, (HistoryBuffer, Window)):
+        return float(src.max)
+    return max((v for v in visible if v == v), default=0.0)
+
+
+class BrailleChart:
+    """
+    Rich renderable drawing one or more series as Braille lines.
+
+    series: (source, style) pairs; later series are drawn over earlier
+        ones where they share a cell. A source is a HistoryBuffer (read
+        in place), a Window, or any sequence of floats.
+    height: rows of cells, or None to fill the height Rich offers (e.g. a
+        Layout region); width defaults to the available width.
+    peak: value at the top edge, e.g. 100 for percentages; defaults to the
+        largest running max of the sources.
+    fill: shade the area under each line instead of drawing only the line.
+    """
+
+    def __init__(
+        self,
+        series: Sequence[Tuple[Source, StyleType]],
+        height: Optional[int] = 8,
+        width: Optional[int] = None,
+        peak: Optional[float] = None,
+        fill: bool = False,
+    ) -> None:
+        self.series = list(series)
+        self.height = height
+        self.width = width
+        self.peak = peak
+        self.fill = fill
+
+    # ----- rasterization -----------------------------------------------------
+
+    def _keys(self, values: Sequence[float], peak: float, levels: int) -> List[int]:
+        """_Columns key per sample (one dot column each)."""
+        ys = list(map(bisect_right, repeat(thresholds(peak, levels)), values))
+        gaps: Optional[List[bool]] = None
+        if any(map(math.isnan, values)):
+            # NaN marks missing data: its column stays blank and no line
+            # is drawn into or out of it
+            gaps = [v != v for v in values]
+        if self.fill:
+            keys = ys
+        else:
+            prev = ys[:1] + ys[:-1]
+            if gaps:
+                after_gap = [False] + gaps[:-1]
+                prev = [y if g else p for y, p, g in zip(ys, prev, after_gap)]
+            keys = list(map(add, map(mul, prev, repeat(levels)), ys))
+        if gaps:
+            keys = [-1 if g else k for k, g in zip(keys, gaps)]
+        return keys
+
+    def rasterize(
+        self, width: int, height: Optional[int] = None
+    ) -> Tuple[List[str], List[bytes]]:
+        """
+        Glyph rows (top→bottom) plus, per row, one byte per cell naming
+        the series drawn there (1-based; 0 = empty).
+        """
+        height = max(1, height or self.height or 8)
+        width = max(1, width)
+        columns = 2 * width
+        size = width * height
+        tails = [_tail(src, columns) for src, _ in self.series]
+        peak = self.peak
+        if peak is None:
+            peak = max(
+                (_peak(src, tail) for (src, _), tail in zip(self.series, tails)),
+                default=0.0,
+            )
+        if not peak > 0.0:
+            peak = 1.0
+
+        lcols, rcols = _columns_for(height, self.fill)
+        dots = 0
+        owner = 0
+        ones = int.from_bytes(b"\x01" * size, "little")
+        for k, values in enumerate(tails, start=1):
+            if not len(values):
+                continue
+            keys = [-1] * (columns - len(values)) + self._keys(values, peak, 4 * height)
+            left = b"".join(map(lcols.__getitem__, keys[0::2]))
+            right = b"".join(map(rcols.__getitem__, keys[1::2]))
+            bits = int.from_bytes(left, "little") | int.from_bytes(right, "little")
+            dots |= bits
+            # Bit 0 of each byte set where this series has any dot
+            bits |= bits >> 4
+            bits |= bits >> 2
+            bits |= bits >> 1
+            bits &= ones
+            owner = owner & ~(bits * 0xFF) | bits * k
+
+        canvas = dots.to_bytes(size, "little")
+        colors = owner.to_bytes(size, "little")
+        # Column-major → row-major, then one glyph per byte in three
+        # interleaved UTF-8 byte planes
+        flat = b"".join([canvas[r::height] for r in range(height)])
+        utf8 = bytearray(b"\xe2" * (3 * size))
+        utf8[1::3] = flat.translate(_UTF8_MID)
+        utf8[2::3] = flat.translate(_UTF8_LOW)
+        text = utf8.decode("utf-8").replace("\u2800", " ")
+        rows = [text[i : i + width] for i in range(0, size, width)]
+        return rows, [colors[r::height] for r in range(height)]
+
+    # ----- Rich protocol -----------------------------------------------------
+
+    def __rich_measure__(
+        self, console: Console, options: ConsoleOptions
+    ) -> Measurement:
+        if self.width is not None:
+            return Measurement(self.width, self.width)
+        return Measurement(1, options.max_width)
+
+    def __rich_console__(
+        self, console: Console, options: ConsoleOptions
+    ) -> RenderResult:
+        width = min(self.width or options.max_width, options.max_width)
+        styles: List[Optional[Style]] = [None]
+        styles.extend(console.get_style(style) for _, style in self.series)
+        rows, colors = self.rasterize(width, self.height or options.height)
+        newline = Segment.line()
+        for text, owners in zip(rows, colors):
+            for run in _RUNS.finditer(owners):
+                start, end = run.span()
+                yield Segment(text[start:end], styles[owners[start]])
+            yield newline
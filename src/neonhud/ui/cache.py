@@ -0,0 +1,38 @@
+"""
+Per-panel render cache for the live views.
+
+A panel is rebuilt only when its key changes; the key is whatever its
+inputs are identified by, normally the sampler's `updated` timestamp for
+the collector behind it plus the theme and stale flag. Panels fed by slow
+collectors (process scan, filesystem usage) are then reused verbatim
+between their refreshes instead of rebuilt every frame.
+"""
+
+from __future__ import annotations
+
+from typing import Callable, Dict, Hashable, Tuple
+
+from rich.console import RenderableType
+
+
+class PanelCache:
+    def __init__(self) -> None:
+        self._items: Dict[str, Tuple[Hashable, RenderableType]] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def get(
+        self, name: str, key: Hashable, build: Callable[[], RenderableType]
+    ) -> RenderableType:
+        """The cached renderable for `name` if built with `key`, else build()."""
+        item = self._items.get(name)
+        if item is not None and item[0] == key:
+            self.hits += 1
+            return item[1]
+        self.misses += 1
+        panel = build()
+        self._items[name] = (key, panel)
+        return panel
+
+    def clear(self) -> None:
+        self._items.clear()
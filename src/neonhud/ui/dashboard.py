@@ -4,12 +4,15 @@ Rich-powered live dashboard for NeonHud.
 Layout:
 - Top row: CPU + Memory overview (panels.build_overview)
 - Bottom rows: Disk I/O and Network I/O with live rates
+
+Collection and rendering are split: collectors() returns the sampling
+functions (run by services.sampler on its own thread), and
+build_dashboard(values=...) renders one published set of values.
 """
 
 from __future__ import annotations
 
-from typing import Deque, Optional
-from collections import deque
+from typing import Any, Callable, Dict, Mapping, Optional, Tuple
 
 from rich.columns import Columns
 from rich.console import Console, RenderableType
@@ -17,7 +20,7 @@ from rich.panel import Panel
 from rich.table import Table
 from rich.text import Text
 
-from neonhud.collectors import cpu, mem
+from neonhud.collectors import cpu, mem, topology
 from neonhud.collectors.disk import (
     DiskCounters,
     DiskRates,
@@ -31,9 +34,13 @@ from neonhud.collectors.net import (
     rates_from as net_rates_from,
 )
 from neonhud.core import config as core_config
+from neonhud.services.replay import ReplaySource
+from neonhud.services.sampler import Collector
 from neonhud.ui import panels
+from neonhud.ui.cache import PanelCache
 from neonhud.ui.theme import get_theme, Theme
-from neonhud.utils.spark import sparkline
+from neonhud.utils.history import HistoryBuffer, Window
+from neonhud.utils.spark import SparkCache
 
 # -------------------- History length (configurable) ----------------------------
 
@@ -49,7 +56,7 @@ def _resolve_history_len() -> int:
             return n
 
     # 2) Config
-    cfg = core_config.load_config()
+    cfg = core_config.get_config()
     try:
         val = cfg.get("history_len", 60)
         n = int(val)
@@ -64,10 +71,10 @@ def _resolve_history_len() -> int:
 
 _HISTORY_LEN = _resolve_history_len()
 
-_disk_read_hist: Deque[float] = deque(maxlen=_HISTORY_LEN)
-_disk_write_hist: Deque[float] = deque(maxlen=_HISTORY_LEN)
-_net_rx_hist: Deque[float] = deque(maxlen=_HISTORY_LEN)
-_net_tx_hist: Deque[float] = deque(maxlen=_HISTORY_LEN)
+_disk_read_hist = HistoryBuffer(maxlen=_HISTORY_LEN)
+_disk_write_hist = HistoryBuffer(maxlen=_HISTORY_LEN)
+_net_rx_hist = HistoryBuffer(maxlen=_HISTORY_LEN)
+_net_tx_hist = HistoryBuffer(maxlen=_HISTORY_LEN)
 
 _prev_disk: Optional[DiskCounters] = None
 _prev_net: Optional[NetCounters] = None
@@ -88,16 +95,27 @@ def _format_bps(v: float) -> str:
 
 def _panel_title(text: str, theme: Theme) -> Text:
     # Styled title to match the rest of the UI
-    return Text(f"⟡ {text} ⟡", style=theme.primary)
+    return Text(f"⟡ {text} ⟡", style=theme.styles.primary)
 
 
-# -------------------- Panels ---------------------------------------------------
+# Sparklines wider than this are min/max-downsampled (long history_len)
+SPARK_WIDTH = 60
+_sparks = SparkCache()
+
+
+def _spark(name: str, w: Window) -> str:
+    # Normalize against the buffer's running max; unchanged scale shifts
+    # in only the new samples' glyphs
+    return _sparks.render(name, w, width=SPARK_WIDTH)
+
+
+# -------------------- Collectors ----------------------------------------------
 
 
-def _disk_panel(theme: Theme) -> Panel:
+def sample_disk() -> Dict[str, Any]:
     """
-    Build Disk I/O panel: current read/write + sparklines.
-    Updates history buffers as a side effect.
+    Sample disk counters, update the history buffers, and return the current
+    rates plus history Windows (copies with running peak).
     """
     global _prev_disk
     curr: DiskCounters = disk_sample_counters()
@@ -110,34 +128,24 @@ def _disk_panel(theme: Theme) -> Panel:
         rates = disk_rates_from(_prev_disk, curr)
 
     _prev_disk = curr
+    return _disk_values(float(rates["read_bps"]), float(rates["write_bps"]))
 
-    _disk_read_hist.append(float(rates["read_bps"]))
-    _disk_write_hist.append(float(rates["write_bps"]))
-
-    read_line = sparkline(list(_disk_read_hist)) if _disk_read_hist else ""
-    write_line = sparkline(list(_disk_write_hist)) if _disk_write_hist else ""
-
-    table = Table(show_header=False, expand=True)
-    table.add_row(
-        Text("Read:", style=theme.primary),
-        Text(_format_bps(float(rates["read_bps"])), style=theme.accent),
-        Text(read_line, style=theme.accent),
-    )
-    table.add_row(
-        Text("Write:", style=theme.primary),
-        Text(_format_bps(float(rates["write_bps"])), style=theme.accent),
-        Text(write_line, style=theme.accent),
-    )
 
-    return Panel(
-        table, title=_panel_title("Disk I/O", theme), border_style=theme.primary
-    )
+def _disk_values(read_bps: float, write_bps: float) -> Dict[str, Any]:
+    _disk_read_hist.push(read_bps)
+    _disk_write_hist.push(write_bps)
+    return {
+        "read_bps": read_bps,
+        "write_bps": write_bps,
+        "hist_r": _disk_read_hist.window(),
+        "hist_w": _disk_write_hist.window(),
+    }
 
 
-def _net_panel(theme: Theme) -> Panel:
+def sample_net() -> Dict[str, Any]:
     """
-    Build Network I/O panel: current rx/tx + sparklines.
-    Updates history buffers as a side effect.
+    Sample network counters, update the history buffers, and return the
+    current rates plus history Windows (copies with running peak).
     """
     global _prev_net
     curr: NetCounters = net_sample_counters()
@@ -149,47 +157,146 @@ def _net_panel(theme: Theme) -> Panel:
         rates = net_rates_from(_prev_net, curr)
 
     _prev_net = curr
+    return _net_values(float(rates["rx_bps"]), float(rates["tx_bps"]))
+
+
+def _net_values(rx_bps: float, tx_bps: float) -> Dict[str, Any]:
+    _net_rx_hist.push(rx_bps)
+    _net_tx_hist.push(tx_bps)
+    return {
+        "rx_bps": rx_bps,
+        "tx_bps": tx_bps,
+        "hist_rx": _net_rx_hist.window(),
+        "hist_tx": _net_tx_hist.window(),
+    }
+
+
+def collectors(source: Optional[ReplaySource] = None) -> Dict[str, Collector]:
+    """
+    Named collectors whose results build_dashboard() renders. All are cheap
+    and critical, so they run inline at the sampler's base interval unless
+    config overrides it. With a replay `source`, values come from a
+    recording instead of the system.
+    """
+    if source is not None:
+        return {
+            "cpu": Collector(source.cpu, critical=True),
+            "mem": Collector(source.mem, critical=True),
+            "disk": Collector(
+                lambda: _disk_values(*source.disk_rates()), critical=True
+            ),
+            "net": Collector(lambda: _net_values(*source.net_rates()), critical=True),
+        }
+    return {
+        "cpu": Collector(cpu.sample, critical=True),
+        "mem": Collector(mem.sample, critical=True),
+        "disk": Collector(sample_disk, critical=True),
+        "net": Collector(sample_net, critical=True),
+    }
+
 
-    _net_rx_hist.append(float(rates["rx_bps"]))
-    _net_tx_hist.append(float(rates["tx_bps"]))
+# -------------------- Panels ---------------------------------------------------
+
+
+def _disk_panel(theme: Theme, data: Optional[Mapping[str, Any]] = None) -> Panel:
+    """
+    Build Disk I/O panel: current read/write + sparklines.
+    Samples inline (updating history) when no data is given.
+    """
+    d = data if data is not None else sample_disk()
+
+    read_line = _spark("disk_read", d["hist_r"])
+    write_line = _spark("disk_write", d["hist_w"])
+
+    table = Table(show_header=False, expand=True)
+    table.add_row(
+        Text("Read:", style=theme.styles.primary),
+        Text(_format_bps(float(d["read_bps"])), style=theme.styles.accent),
+        Text(read_line, style=theme.styles.accent),
+    )
+    table.add_row(
+        Text("Write:", style=theme.styles.primary),
+        Text(_format_bps(float(d["write_bps"])), style=theme.styles.accent),
+        Text(write_line, style=theme.styles.accent),
+    )
+
+    return Panel(
+        table, title=_panel_title("Disk I/O", theme), border_style=theme.styles.primary
+    )
+
+
+def _net_panel(theme: Theme, data: Optional[Mapping[str, Any]] = None) -> Panel:
+    """
+    Build Network I/O panel: current rx/tx + sparklines.
+    Samples inline (updating history) when no data is given.
+    """
+    d = data if data is not None else sample_net()
 
-    rx_line = sparkline(list(_net_rx_hist)) if _net_rx_hist else ""
-    tx_line = sparkline(list(_net_tx_hist)) if _net_tx_hist else ""
+    rx_line = _spark("net_rx", d["hist_rx"])
+    tx_line = _spark("net_tx", d["hist_tx"])
 
     table = Table(show_header=False, expand=True)
     table.add_row(
-        Text("Recv:", style=theme.primary),
-        Text(_format_bps(float(rates["rx_bps"])), style=theme.accent),
-        Text(rx_line, style=theme.accent),
+        Text("Recv:", style=theme.styles.primary),
+        Text(_format_bps(float(d["rx_bps"])), style=theme.styles.accent),
+        Text(rx_line, style=theme.styles.accent),
     )
     table.add_row(
-        Text("Send:", style=theme.primary),
-        Text(_format_bps(float(rates["tx_bps"])), style=theme.accent),
-        Text(tx_line, style=theme.accent),
+        Text("Send:", style=theme.styles.primary),
+        Text(_format_bps(float(d["tx_bps"])), style=theme.styles.accent),
+        Text(tx_line, style=theme.styles.accent),
     )
 
     return Panel(
-        table, title=_panel_title("Network I/O", theme), border_style=theme.primary
+        table,
+        title=_panel_title("Network I/O", theme),
+        border_style=theme.styles.primary,
     )
 
 
 # -------------------- Public API ----------------------------------------------
 
 
-def build_dashboard(theme: Theme | None = None) -> RenderableType:
+def build_dashboard(
+    theme: Theme | None = None,
+    values: Mapping[str, Any] | None = None,
+    updated: Mapping[str, float] | None = None,
+    cache: PanelCache | None = None,
+) -> RenderableType:
     """
-    Collect live stats and return a Rich renderable layout.
-    Call this repeatedly in the CLI's Live loop to animate.
+    Return a Rich renderable layout for one set of collector values
+    (keys as in collectors()). Without `values`, collects inline.
+    With `updated` (Frame.updated) and a `cache`, panels whose collectors
+    produced nothing new are reused (see pro_dash.build_top).
     """
     th = theme or get_theme("classic")
-
-    # Top row: CPU + Memory overview
-    cpu_stats = cpu.sample()
-    mem_stats = mem.sample()
-    top = panels.build_overview(cpu_stats, mem_stats, theme=th)
+    v = values if values is not None else {k: c.fn() for k, c in collectors().items()}
+
+    def panel(
+        names: Tuple[str, ...], build: Callable[[], RenderableType]
+    ) -> RenderableType:
+        if cache is None or updated is None:
+            return build()
+        key = (tuple(updated.get(n) for n in names), th)
+        return cache.get("+".join(names), key, build)
+
+    # Top row: CPU + Memory overview, cores grouped by node/socket
+    ncpu = len(v["cpu"].get("per_cpu") or v["cpu"].get("per_core") or [])
+    groups = topology.cpu_groups(ncpu=ncpu) or None
+    top = panel(
+        ("cpu", "mem"),
+        lambda: panels.build_overview(v["cpu"], v["mem"], theme=th, groups=groups),
+    )
 
     # Bottom row: Disk I/O + Net I/O
-    bottom = Columns([_disk_panel(th), _net_panel(th)], equal=True, expand=True)
+    bottom = Columns(
+        [
+            panel(("disk",), lambda: _disk_panel(th, v["disk"])),
+            panel(("net",), lambda: _net_panel(th, v["net"])),
+        ],
+        equal=True,
+        expand=True,
+    )
 
     return Columns([top, bottom], expand=True)
 
@@ -0,0 +1,121 @@
+"""
+Per-core CPU heatmap for many-core hosts.
+
+One glyph per logical CPU: its height is the load (the sparkline ramp)
+and its color the load band, so 192 threads fit in two or three rows of
+a panel instead of 192 bar lines. Cores wrap to the width Rich offers;
+with topology groups (socket or NUMA node → CPU indices) each group
+starts on its own row behind a short label.
+
+Rows are emitted as one Segment per run of same-band cells: glyphs come
+from a single quantization pass over all cores, bands from one bisect
+pass packed into bytes, and each row is sliced out of both.
+"""
+
+from __future__ import annotations
+
+import re
+from bisect import bisect_right
+from itertools import repeat
+from typing import List, Optional, Sequence, Tuple
+
+from rich.console import Console, ConsoleOptions, RenderResult
+from rich.measure import Measurement
+from rich.segment import Segment
+from rich.style import Style
+
+from neonhud.ui.theme import Theme
+from neonhud.utils.spark import quantize
+
+# Load bands (percent): idle, normal, busy, hot
+BANDS = (25.0, 50.0, 80.0)
+
+# A CPU panel gives up per-core bars past this many cores, or when the
+# bars would take more than half the terminal height
+BAR_MAX_CORES = 64
+
+_RUNS = re.compile(rb"(.)\1*", re.S)
+
+Groups = Sequence[Tuple[str, Sequence[int]]]
+
+
+def use_heatmap(ncores: int, lines: int) -> bool:
+    """
+    Whether `ncores` per-core bars would overflow a CPU panel on a screen
+    of `lines` rows.
+    """
+    # Half the screen, less the panel border and the total/load lines
+    return ncores > min(BAR_MAX_CORES, max(4, lines // 2 - 4))
+
+
+class CoreHeatmap:
+    """
+    Rich renderable for per-core load (percent, in per_cpu order; values
+    outside 0-100 are drawn at the nearest end).
+
+    groups: optional (label, indices) pairs, e.g. [("N0", [0, 1, ...])];
+        cores not in any group are not drawn.
+    """
+
+    def __init__(
+        self,
+        per_cpu: Sequence[float],
+        theme: Theme,
+        groups: Optional[Groups] = None,
+    ) -> None:
+        self.per_cpu = per_cpu
+        self.theme = theme
+        self.groups = groups
+
+    def _styles(self) -> Tuple[Style, ...]:
+        st = self.theme.styles
+        return (st.accent + Style(dim=True), st.accent, st.warning, st.hot)
+
+    def rows(self, width: int) -> List[Tuple[str, str, bytes]]:
+        """(label, glyphs, band per glyph) for each row of `width` cells."""
+        values = self.per_cpu
+        groups: Groups = self.groups or [("", range(len(values)))]
+        label_w = max((len(label) for label, _ in groups), default=0)
+        if label_w:
+            label_w += 1
+        cols = max(1, width - label_w)
+
+        out: List[Tuple[str, str, bytes]] = []
+        for label, idx in groups:
+            if self.groups:
+                vals = [values[i] for i in idx if 0 <= i < len(values)]
+            else:
+                vals = list(values)
+            if not vals:
+                continue
+            glyphs = quantize(vals, 100.0)
+            bands = bytes(map(bisect_right, repeat(BANDS), vals))
+            for start in range(0, len(vals), cols):
+                tag = label if start == 0 else ""
+                out.append(
+                    (
+                        tag.ljust(label_w),
+                        glyphs[start : start + cols],
+                        bands[start : start + cols],
+                    )
+                )
+        return out
+
+    def __rich_measure__(
+        self, console: Console, options: ConsoleOptions
+    ) -> Measurement:
+        return Measurement(1, options.max_width)
+
+    def __rich_console__(
+        self, console: Console, options: ConsoleOptions
+    ) -> RenderResult:
+        styles = self._styles()
+        label_style = self.theme.styles.primary
+        newline = Segment.line()
+        for label, glyphs, bands in self.rows(options.max_width):
+            if label:
+                yield Segment(label, label_style)
+            for run in _RUNS.finditer(bands):
+                start, end = run.span()
+                yield Segment(glyphs[start:end], styles[bands[start]])
+            yield newline
@@ -4,13 +4,17 @@ Dashboard panels for NeonHud (CPU + Memory + I/O) with cyberpunk polish.
 
 from __future__ import annotations
 
-from typing import Any, List, Mapping, Sequence, cast
+from typing import Any, List, Mapping, Optional, Sequence, Tuple, cast
 
 from rich.panel import Panel
 from rich.columns import Columns
-from rich.console import Console, RenderableType, Group
+from rich.console import Console, ConsoleOptions, Group, RenderableType, RenderResult
+from rich.measure import Measurement
+from rich.table import Table
 from rich.text import Text
 
+from neonhud.core import config as core_config
+from neonhud.ui.heatmap import CoreHeatmap, Groups, use_heatmap
 from neonhud.utils.bar import make_bar
 from neonhud.utils.format import format_percent, format_bytes
 from neonhud.ui.theme import get_theme, Theme
@@ -22,7 +26,7 @@ from neonhud.utils.spark import sparkline
 
 def _title(text: str, theme: Theme) -> Text:
     # neon-styled bracketed title
-    return Text(f"⟡ {text} ⟡", style=theme.primary)
+    return Text(f"⟡ {text} ⟡", style=theme.styles.primary)
 
 
 def _fmt_bps(v: float) -> str:
@@ -38,18 +42,80 @@ def _fmt_bps(v: float) -> str:
 # ---------------- CPU ----------------
 
 
-def build_cpu_panel(cpu: Mapping[str, Any], theme: Theme | None = None) -> Panel:
+class _CoreDetail:
+    """
+    Per-core part of the CPU panel: bar lines or a CoreHeatmap. In "auto"
+    mode the choice is made at render time, from the height of the console
+    doing the drawing.
+    """
+
+    def __init__(
+        self,
+        per_cpu: Sequence[float],
+        theme: Theme,
+        mode: str,
+        groups: Optional[Groups],
+    ) -> None:
+        self.per_cpu = per_cpu
+        self.theme = theme
+        self.mode = mode
+        self.groups = groups
+
+    def _view(self, options: ConsoleOptions) -> RenderableType:
+        mode = self.mode
+        if mode not in ("bars", "heatmap"):
+            many = use_heatmap(len(self.per_cpu), options.size.height)
+            mode = "heatmap" if many else "bars"
+        if mode == "heatmap":
+            return CoreHeatmap(self.per_cpu, self.theme, self.groups)
+        style = self.theme.styles.accent
+        return Group(
+            *(
+                Text(
+                    f"Core {idx}: {make_bar(float(pct), width=12)} "
+                    f"{format_percent(pct)}",
+                    style=style,
+                )
+                for idx, pct in enumerate(self.per_cpu)
+            )
+        )
+
+    def __rich_measure__(
+        self, console: Console, options: ConsoleOptions
+    ) -> Measurement:
+        return Measurement.get(console, options, self._view(options))
+
+    def __rich_console__(
+        self, console: Console, options: ConsoleOptions
+    ) -> RenderResult:
+        yield self._view(options)
+
+
+def build_cpu_panel(
+    cpu: Mapping[str, Any],
+    theme: Theme | None = None,
+    mode: Optional[str] = None,
+    groups: Optional[Groups] = None,
+) -> Panel:
+    """
+    Total bar, optional load sparkline, then per-core detail: one bar line
+    per core, or a heatmap (one glyph per core, grouped by `groups`) when
+    the bars would not fit. `mode` ("auto", "bars" or "heatmap") defaults
+    to the config's `cpu_view`.
+    """
     th = theme or get_theme("classic")
     total = float(cpu.get("percent_total", 0.0))
     bar = make_bar(total, width=24)
 
-    lines: List[Text] = [Text(f"{bar}  {format_percent(total)}", style=th.primary)]
+    lines: List[Text] = [
+        Text(f"{bar}  {format_percent(total)}", style=th.styles.primary)
+    ]
 
     # Optional mini-sparkline of total CPU (provided by dashboard)
     hist_total = cpu.get("hist_total")
     if isinstance(hist_total, list) and hist_total:
-        s = sparkline([float(x) for x in hist_total][-40:])
-        lines.append(Text(f"load {s}", style=th.accent))
+        s = sparkline(hist_total, width=40)
+        lines.append(Text(f"load {s}", style=th.styles.accent))
 
     # Accept either per_core (compat/test) or per_cpu (collector)
     per_list = cpu.get("per_core")
@@ -59,11 +125,13 @@ def build_cpu_panel(cpu: Mapping[str, Any], theme: Theme | None = None) -> Panel
     per_seq: Sequence[float] = (
         cast(Sequence[float], per_list) if isinstance(per_list, list) else []
     )
-    for idx, pct in enumerate(per_seq):
-        cbar = make_bar(float(pct), width=12)
-        lines.append(Text(f"Core {idx}: {cbar} {format_percent(pct)}", style=th.accent))
+    body: List[RenderableType] = list(lines)
+    if per_seq:
+        if mode is None:
+            mode = str(core_config.get_config().get("cpu_view", "auto")).lower()
+        body.append(_CoreDetail(per_seq, th, mode, groups))
 
-    return Panel(Group(*lines), title=_title("CPU", th), border_style=th.accent)
+    return Panel(Group(*body), title=_title("CPU", th), border_style=th.styles.accent)
 
 
 # --------------- Memory ----------------
@@ -78,25 +146,91 @@ def build_memory_panel(mem: Mapping[str, Any], theme: Theme | None = None) -> Pa
     total = int(mem.get("total", 0))
 
     lines: List[Text] = [
-        Text(f"{bar}  {format_percent(percent)}", style=th.primary),
-        Text(f"Used: {format_bytes(used)} / {format_bytes(total)}", style=th.accent),
+        Text(f"{bar}  {format_percent(percent)}", style=th.styles.primary),
+        Text(
+            f"Used: {format_bytes(used)} / {format_bytes(total)}",
+            style=th.styles.accent,
+        ),
     ]
 
     # Optional mini-sparkline of memory % (provided by dashboard)
     hist_pct = mem.get("hist_percent")
     if isinstance(hist_pct, list) and hist_pct:
-        s = sparkline([float(x) for x in hist_pct][-40:])
-        lines.append(Text(f"trend {s}", style=th.accent))
+        s = sparkline(hist_pct, width=40)
+        lines.append(Text(f"trend {s}", style=th.styles.accent))
+
+    return Panel(
+        Group(*lines), title=_title("Memory", th), border_style=th.styles.accent
+    )
+
 
-    return Panel(Group(*lines), title=_title("Memory", th), border_style=th.accent)
+# --------------- NUMA nodes ----------------
+
+
+def build_numa_panel(topo: Mapping[str, Any], theme: Theme | None = None) -> Panel:
+    """
+    topo: collectors.topology.sample() — one row per NUMA node (CPU load
+    and memory), then per-socket load when sockets and nodes differ.
+    """
+    th = theme or get_theme("classic")
+    table = Table(expand=True, header_style=th.styles.primary, box=None)
+    table.add_column("NODE")
+    table.add_column("CPUS", justify="right")
+    table.add_column("CPU")
+    table.add_column("MEMORY", justify="right")
+    table.add_column("MEM")
+
+    nodes = cast(Sequence[Mapping[str, Any]], topo.get("nodes", []))
+    for n in nodes:
+        cpu_pct = float(n.get("cpu_percent", 0.0))
+        mem_pct = float(n.get("mem_percent", 0.0))
+        table.add_row(
+            f"N{n.get('node', 0)}",
+            str(n.get("cpus", 0)),
+            Text(
+                f"{make_bar(cpu_pct, width=12)} {format_percent(cpu_pct)}",
+                style=th.styles.hot if cpu_pct >= 80.0 else th.styles.accent,
+            ),
+            f"{format_bytes(int(n.get('mem_used', 0)))} / "
+            f"{format_bytes(int(n.get('mem_total', 0)))}",
+            Text(
+                f"{make_bar(mem_pct, width=12)} {format_percent(mem_pct)}",
+                style=th.styles.accent,
+            ),
+        )
+
+    sockets = cast(Sequence[Mapping[str, Any]], topo.get("sockets", []))
+    if len(sockets) > 1 and len(sockets) != len(nodes):
+        for sk in sockets:
+            pct = float(sk.get("cpu_percent", 0.0))
+            table.add_row(
+                f"S{sk.get('socket', 0)}",
+                str(sk.get("cpus", 0)),
+                Text(
+                    f"{make_bar(pct, width=12)} {format_percent(pct)}",
+                    style=th.styles.accent,
+                ),
+                "",
+                "",
+            )
+
+    return Panel(table, title=_title("NUMA", th), border_style=th.styles.accent)
 
 
 # --------------- Disk per-device ----------------
 
 
+def _disk_busy(r: Mapping[str, Any]) -> Tuple[float, float]:
+    # Sort key: utilization first (when known), then the larger byte rate
+    return float(r.get("util", 0.0)), max(
+        float(r.get("read_bps", 0.0)), float(r.get("write_bps", 0.0))
+    )
+
+
 def build_disks_panel(
     dev_rates: Mapping[str, Mapping[str, Any]],
     theme: Theme | None = None,
+    limit: Optional[int] = None,
 ) -> Panel:
     """
     dev_rates: {
@@ -105,18 +239,18 @@ def build_disks_panel(
         "write_bps": float,
         "hist_r": list[float],
         "hist_w": list[float],
+        # optional, from collectors.diskstats (as_dict()):
+        "read_iops", "write_iops", "read_await", "write_await",
+        "queue", "util": float,
       }
     }
+    Devices are listed busiest first; `limit` keeps only the top N.
     """
     th = theme or get_theme("classic")
     lines: List[Text] = []
-    order = sorted(
-        dev_rates.items(),
-        key=lambda kv: max(
-            float(kv[1].get("read_bps", 0.0)), float(kv[1].get("write_bps", 0.0))
-        ),
-        reverse=True,
-    )
+    order = sorted(dev_rates.items(), key=lambda kv: _disk_busy(kv[1]), reverse=True)
+    if limit is not None and limit > 0:
+        order = order[:limit]
     for name, r in order:
         hist_r = cast(
             List[float], list(map(float, cast(Sequence[float], r.get("hist_r", []))))
@@ -124,16 +258,26 @@ def build_disks_panel(
         hist_w = cast(
             List[float], list(map(float, cast(Sequence[float], r.get("hist_w", []))))
         )
-        sr = sparkline(hist_r[-20:] or [0.0])
-        sw = sparkline(hist_w[-20:] or [0.0])
+        sr = sparkline(hist_r or [0.0], width=20)
+        sw = sparkline(hist_w or [0.0], width=20)
         line = (
             f"{name:<8} R {_fmt_bps(float(r.get('read_bps', 0.0)))} {sr}   "
             f"W {_fmt_bps(float(r.get('write_bps', 0.0)))} {sw}"
         )
-        lines.append(Text(line, style=th.primary))
-    body = Group(*lines) if lines else Text("No disk activity", style=th.accent)
+        if "util" in r:
+            iops = float(r.get("read_iops", 0.0)) + float(r.get("write_iops", 0.0))
+            wait = max(
+                float(r.get("read_await", 0.0)), float(r.get("write_await", 0.0))
+            )
+            line += (
+                f"   {iops:7.1f} IOPS  await {wait:6.1f} ms  "
+                f"q {float(r.get('queue', 0.0)):4.1f}  "
+                f"util {format_percent(float(r['util']))}"
+            )
+        lines.append(Text(line, style=th.styles.primary))
+    body = Group(*lines) if lines else Text("No disk activity", style=th.styles.accent)
     return Panel(
-        body, title=_title("Disk I/O (per device)", th), border_style=th.primary
+        body, title=_title("Disk I/O (per device)", th), border_style=th.styles.primary
     )
 
 
@@ -170,16 +314,20 @@ def build_nics_panel(
         hist_tx = cast(
             List[float], list(map(float, cast(Sequence[float], r.get("hist_tx", []))))
         )
-        srx = sparkline(hist_rx[-20:] or [0.0])
-        stx = sparkline(hist_tx[-20:] or [0.0])
+        srx = sparkline(hist_rx or [0.0], width=20)
+        stx = sparkline(hist_tx or [0.0], width=20)
         line = (
             f"{name:<8} RX {_fmt_bps(float(r.get('recv_bps', 0.0)))} {srx}   "
             f"TX {_fmt_bps(float(r.get('send_bps', 0.0)))} {stx}"
         )
-        lines.append(Text(line, style=th.primary))
-    body = Group(*lines) if lines else Text("No network activity", style=th.accent)
+        lines.append(Text(line, style=th.styles.primary))
+    body = (
+        Group(*lines) if lines else Text("No network activity", style=th.styles.accent)
+    )
     return Panel(
-        body, title=_title("Network I/O (per interface)", th), border_style=th.primary
+        body,
+        title=_title("Network I/O (per interface)", th),
+        border_style=th.styles.primary,
     )
 
 
@@ -187,11 +335,15 @@ def build_nics_panel(
 
 
 def build_overview(
-    cpu: Mapping[str, Any], mem: Mapping[str, Any], theme: Theme | None = None
+    cpu: Mapping[str, Any],
+    mem: Mapping[str, Any],
+    theme: Theme | None = None,
+    groups: Optional[Groups] = None,
 ) -> RenderableType:
+    """CPU + memory side by side; `groups` as for build_cpu_panel."""
     th = theme or get_theme("classic")
     return Columns(
-        [build_cpu_panel(cpu, th), build_memory_panel(mem, th)],
+        [build_cpu_panel(cpu, th, groups=groups), build_memory_panel(mem, th)],
         equal=True,
         expand=True,
     )
@@ -5,12 +5,25 @@ Tests call _cpu_history_panel and _mem_swap_history_panel and expect that
 str(...) contains labels like "CPU" / "Memory" / "Swap". We provide tiny
 test-facing shims that return Text with those words, and separate *_ui
 builders that the live dashboard uses.
+
+Each panel has a _sample_* collector (run by services.sampler off the UI
+thread) and a builder that renders the collector's value; build_top(values=)
+renders one published set of values.
 """
 
 from __future__ import annotations
 
-from collections import deque
-from typing import Any, Deque, Iterable
+import shutil
+import time
+from typing import (
+    AbstractSet,
+    Any,
+    Callable,
+    Dict,
+    List,
+    Mapping,
+    Optional,
+)
 
 from rich.columns import Columns
 from rich.console import Group, RenderableType
@@ -22,10 +35,19 @@ from neonhud.collectors import cpu as cpu_col
 from neonhud.collectors import mem as mem_col
 from neonhud.collectors import procs as procs_col
 from neonhud.collectors import net as net_col
+from neonhud.collectors import fs as fs_col
+from neonhud.collectors import topology as topo_col
+from neonhud.core import config as core_config
+from neonhud.services.replay import ReplaySource
+from neonhud.services.sampler import Collector
+from neonhud.ui.braille import BrailleChart
+from neonhud.ui.cache import PanelCache
 from neonhud.ui.theme import Theme, get_theme
-from neonhud.ui import process_table
+from neonhud.ui import panels, process_table
 from neonhud.utils.bar import make_bar
 from neonhud.utils.format import format_percent, format_bytes
+from neonhud.utils.history import HistoryBuffer, Window
+from neonhud.utils.rollup import RollupHistory, RollupWindow
 from neonhud.utils.spark import sparkline
 
 # -------------------- small helpers --------------------
@@ -45,18 +67,70 @@ def safe_int(v: Any) -> int:
         return 0
 
 
-def _spark(history: Iterable[float], th: Theme) -> Text:
-    return Text(sparkline(list(history)), style=th.accent)
+# Rows of Braille cells per history chart (4 dot rows each)
+CHART_HEIGHT = 3
+
+
+def _chart(history: Window, th: Theme, peak: Optional[float] = None) -> BrailleChart:
+    """Recent history as a Braille line, newest sample on the right."""
+    return BrailleChart([(history, th.styles.accent)], height=CHART_HEIGHT, peak=peak)
+
+
+def _trend(w: RollupWindow, th: Theme, name: str = "") -> Text:
+    """Long-range line: avg per column over HIST_SPAN, gaps left blank."""
+    line = Text(f"{name}{_span_label(HIST_SPAN)} ", style=th.styles.primary)
+    line.append(sparkline(w.avg, peak=w.peak), style=th.styles.accent)
+    return line
+
+
+def _panel_title(label: str, th: Theme, stale: bool = False) -> Text:
+    """Panel title; stale panels (serving a cached value) get a marker."""
+    title = Text(label, style=th.styles.primary)
+    if stale:
+        title.append(" ⧗ stale", style=th.styles.warning)
+    return title
 
 
 # -------------------- history buffers --------------------
 
 HIST_LEN = 60
-_hist_cpu_total: Deque[float] = deque(maxlen=HIST_LEN)
-_hist_mem: Deque[float] = deque(maxlen=HIST_LEN)
-_hist_swap: Deque[float] = deque(maxlen=HIST_LEN)
-_hist_rx: Deque[float] = deque(maxlen=HIST_LEN)
-_hist_tx: Deque[float] = deque(maxlen=HIST_LEN)
+_hist_cpu_total = HistoryBuffer(maxlen=HIST_LEN)
+_hist_mem = HistoryBuffer(maxlen=HIST_LEN)
+_hist_swap = HistoryBuffer(maxlen=HIST_LEN)
+_hist_rx = HistoryBuffer(maxlen=HIST_LEN)
+_hist_tx = HistoryBuffer(maxlen=HIST_LEN)
+
+
+def _resolve_history_span() -> float:
+    """Seconds shown by the long-range trend lines (config `history_span`)."""
+    try:
+        span = float(core_config.get_config().get("history_span", 3600))
+    except (TypeError, ValueError):
+        return 3600.0
+    return span if span >= 60.0 else 3600.0
+
+
+def _span_label(seconds: float) -> str:
+    if seconds >= 3600 and seconds % 3600 == 0:
+        return f"{int(seconds // 3600)}h"
+    return f"{int(seconds // 60)}m"
+
+
+# Rolled-up histories: hours of context at a fixed memory footprint
+HIST_SPAN = _resolve_history_span()
+_roll_cpu_total = RollupHistory(decimals=1)
+_roll_mem = RollupHistory(decimals=1)
+_roll_swap = RollupHistory(decimals=1)
+_roll_rx = RollupHistory(decimals=0)
+_roll_tx = RollupHistory(decimals=0)
+
+
+def _trend_width() -> int:
+    # Runs on the sampler thread; resampling there keeps render cheap.
+    # Panel border/padding (4) plus the "RX 1h " style label.
+    cols = shutil.get_terminal_size((100, 24)).columns
+    return max(10, cols - 8 - len(_span_label(HIST_SPAN)))
+
 
 _prev_net: net_col.NetCounters | None = None  # type: ignore[name-defined]
 
@@ -64,42 +138,115 @@ _prev_net: net_col.NetCounters | None = None  # type: ignore[name-defined]
 # -------------------- CPU --------------------
 
 
-def _cpu_history_panel_ui(theme: Theme | None = None) -> Panel:
-    th = theme or get_theme("classic")
-    cpu = cpu_col.sample()
+def _sample_cpu(
+    cpu: Optional[Mapping[str, Any]] = None, ts: Optional[float] = None
+) -> Dict[str, Any]:
+    """
+    `cpu` is shaped like cpu_col.sample() (default: sampled now); `ts` is the
+    sample time on the rollup clock (default: time.monotonic()).
+    """
+    if cpu is None:
+        cpu = cpu_col.sample()
+    now = time.monotonic() if ts is None else ts
     total = safe_float(cpu.get("percent_total"))
-    _hist_cpu_total.append(total)
+    _hist_cpu_total.push(total)
+    _roll_cpu_total.push(total, now)
+    return {
+        "total": total,
+        "hist": _hist_cpu_total.window(),
+        "trend": _roll_cpu_total.window(HIST_SPAN, _trend_width(), now),
+    }
+
+
+def _cpu_history_panel_ui(
+    theme: Theme | None = None,
+    data: Optional[Mapping[str, Any]] = None,
+    stale: bool = False,
+) -> Panel:
+    th = theme or get_theme("classic")
+    d = data if data is not None else _sample_cpu()
+    total = safe_float(d["total"])
 
     bar = make_bar(total, width=28)
     body = Group(
-        Text(f"{bar}  {format_percent(total)}", style=th.primary),
-        _spark(_hist_cpu_total, th),
+        Text(f"{bar}  {format_percent(total)}", style=th.styles.primary),
+        _chart(d["hist"], th, peak=100.0),
+        _trend(d["trend"], th),
+    )
+    return Panel(
+        body, border_style=th.styles.accent, title=_panel_title("CPU", th, stale)
     )
-    return Panel(body, border_style=th.accent, title=Text("CPU", style=th.primary))
 
 
 # Test-facing shim: ensure "CPU" appears in str(panel)
 def _cpu_history_panel(theme: Theme | None = None):
     th = theme or get_theme("classic")
-    return Text("CPU", style=th.primary)
+    return Text("CPU", style=th.styles.primary)
 
 
-# -------------------- Memory / Swap --------------------
+# -------------------- NUMA --------------------
 
 
-def _mem_swap_history_panel_ui(theme: Theme | None = None) -> Panel:
+def _numa_panel(
+    theme: Theme | None = None,
+    data: Optional[Mapping[str, Any]] = None,
+    stale: bool = False,
+) -> RenderableType:
     th = theme or get_theme("classic")
-    mem = mem_col.sample()
+    d = data if data is not None else topo_col.sample()
+    panel = panels.build_numa_panel(d, th)
+    panel.title = _panel_title("NUMA", th, stale)
+    return panel
+
+
+# -------------------- Memory / Swap --------------------
+
+
+def _sample_mem(
+    mem: Optional[Mapping[str, Any]] = None, ts: Optional[float] = None
+) -> Dict[str, Any]:
+    if mem is None:
+        mem = mem_col.sample()
+    now = time.monotonic() if ts is None else ts
 
-    percent = safe_float(mem.get("percent"))
-    used = safe_int(mem.get("used"))
-    total = safe_int(mem.get("total"))
     swap_used = safe_int(mem.get("swap_used"))
     swap_total = safe_int(mem.get("swap_total"))
     swap_percent = (swap_used / swap_total * 100.0) if swap_total > 0 else 0.0
+    percent = safe_float(mem.get("percent"))
 
-    _hist_mem.append(percent)
-    _hist_swap.append(swap_percent)
+    _hist_mem.push(percent)
+    _hist_swap.push(swap_percent)
+    _roll_mem.push(percent, now)
+    _roll_swap.push(swap_percent, now)
+    width = _trend_width()
+    return {
+        "percent": percent,
+        "used": safe_int(mem.get("used")),
+        "total": safe_int(mem.get("total")),
+        "swap_used": swap_used,
+        "swap_total": swap_total,
+        "swap_percent": swap_percent,
+        "hist_mem": _hist_mem.window(),
+        "hist_swap": _hist_swap.window(),
+        "trend_mem": _roll_mem.window(HIST_SPAN, width, now),
+        "trend_swap": _roll_swap.window(HIST_SPAN, width, now),
+    }
+
+
+def _mem_swap_history_panel_ui(
+    theme: Theme | None = None,
+    data: Optional[Mapping[str, Any]] = None,
+    stale: bool = False,
+) -> Panel:
+    th = theme or get_theme("classic")
+    d = data if data is not None else _sample_mem()
+
+    percent = safe_float(d["percent"])
+    used = safe_int(d["used"])
+    total = safe_int(d["total"])
+    swap_used = safe_int(d["swap_used"])
+    swap_total = safe_int(d["swap_total"])
+    swap_percent = safe_float(d["swap_percent"])
 
     mem_bar = make_bar(percent, width=28)
     swap_bar = make_bar(swap_percent, width=28)
@@ -108,33 +255,35 @@ def _mem_swap_history_panel_ui(theme: Theme | None = None) -> Panel:
         Text(
             f"{mem_bar}  {format_percent(percent)}  "
             f"{format_bytes(used)} / {format_bytes(total)}",
-            style=th.primary,
+            style=th.styles.primary,
         ),
-        _spark(_hist_mem, th),
+        _chart(d["hist_mem"], th, peak=100.0),
+        _trend(d["trend_mem"], th),
         Text(
             f"{swap_bar}  {format_percent(swap_percent)}  "
             f"{format_bytes(swap_used)} / {format_bytes(swap_total)}",
-            style=th.primary,
+            style=th.styles.primary,
         ),
-        _spark(_hist_swap, th),
+        _chart(d["hist_swap"], th, peak=100.0),
+        _trend(d["trend_swap"], th),
     )
     return Panel(
-        body, border_style=th.accent, title=Text("Memory / Swap", style=th.primary)
+        body,
+        border_style=th.styles.accent,
+        title=_panel_title("Memory / Swap", th, stale),
     )
 
 
 # Test-facing shim: ensure both words appear
 def _mem_swap_history_panel(theme: Theme | None = None):
     th = theme or get_theme("classic")
-    return Text("Memory Swap", style=th.primary)
+    return Text("Memory Swap", style=th.styles.primary)
 
 
 # -------------------- Network --------------------
 
 
-def _network_history_panel(theme: Theme | None = None) -> Panel:
-    th = theme or get_theme("classic")
-
+def _sample_net() -> Dict[str, Any]:
     global _prev_net
     curr = net_col.sample_counters()
 
@@ -144,110 +293,222 @@ def _network_history_panel(theme: Theme | None = None) -> Panel:
         rates = net_col.rates_from(_prev_net, curr)
 
     _prev_net = curr
+    return _net_values(safe_float(rates.get("rx_bps")), safe_float(rates.get("tx_bps")))
+
+
+def _net_values(
+    rx_bps: float, tx_bps: float, ts: Optional[float] = None
+) -> Dict[str, Any]:
+    now = time.monotonic() if ts is None else ts
+    _hist_rx.push(rx_bps)
+    _hist_tx.push(tx_bps)
+    _roll_rx.push(rx_bps, now)
+    _roll_tx.push(tx_bps, now)
+    width = _trend_width()
+    return {
+        "rx_bps": rx_bps,
+        "tx_bps": tx_bps,
+        "hist_rx": _hist_rx.window(),
+        "hist_tx": _hist_tx.window(),
+        "trend_rx": _roll_rx.window(HIST_SPAN, width, now),
+        "trend_tx": _roll_tx.window(HIST_SPAN, width, now),
+    }
+
+
+def _network_history_panel(
+    theme: Theme | None = None,
+    data: Optional[Mapping[str, Any]] = None,
+    stale: bool = False,
+) -> Panel:
+    th = theme or get_theme("classic")
+    d = data if data is not None else _sample_net()
+    rx_bps = safe_float(d["rx_bps"])
+    tx_bps = safe_float(d["tx_bps"])
 
-    rx_bps = safe_float(rates.get("rx_bps"))
-    tx_bps = safe_float(rates.get("tx_bps"))
-    _hist_rx.append(rx_bps)
-    _hist_tx.append(tx_bps)
-
-    table = Table(show_lines=False, expand=True, header_style=th.primary)
-    table.add_column("DIR", header_style=th.primary)
-    table.add_column("B/s", justify="right", header_style=th.primary)
+    table = Table(show_lines=False, expand=True, header_style=th.styles.primary)
+    table.add_column("DIR", header_style=th.styles.primary)
+    table.add_column("B/s", justify="right", header_style=th.styles.primary)
     table.add_row("RX", f"{rx_bps:,.0f}")
     table.add_row("TX", f"{tx_bps:,.0f}")
 
     body = Group(
         Columns(
             [
-                Panel(table, border_style=th.accent),
+                Panel(table, border_style=th.styles.accent),
                 Panel(
                     Group(
-                        Text("RX", style=th.primary),
-                        _spark(_hist_rx, th),
-                        Text("TX", style=th.primary),
-                        _spark(_hist_tx, th),
+                        Text("RX", style=th.styles.primary),
+                        _chart(d["hist_rx"], th),
+                        Text("TX", style=th.styles.primary),
+                        _chart(d["hist_tx"], th),
                     ),
-                    border_style=th.accent,
+                    border_style=th.styles.accent,
                 ),
             ],
             equal=True,
             expand=True,
-        )
+        ),
+        _trend(d["trend_rx"], th, "RX "),
+        _trend(d["trend_tx"], th, "TX "),
     )
 
-    return Panel(body, border_style=th.accent, title=Text("Network", style=th.primary))
+    return Panel(
+        body, border_style=th.styles.accent, title=_panel_title("Network", th, stale)
+    )
 
 
 # -------------------- Processes --------------------
 
 
-def _processes_panel(theme: Theme | None = None) -> Panel:
+def _sample_procs() -> List[procs_col.ProcessRow]:
+    return procs_col.sample(limit=15, sort_by="cpu")
+
+
+def _processes_panel(
+    theme: Theme | None = None,
+    rows: Optional[List[procs_col.ProcessRow]] = None,
+    stale: bool = False,
+) -> Panel:
     th = theme or get_theme("classic")
-    rows = procs_col.sample(limit=15, sort_by="cpu")
+    if rows is None:
+        rows = _sample_procs()
     tbl = process_table.build_table(rows, theme=th)
-    return Panel(tbl, border_style=th.accent, title=Text("Processes", style=th.primary))
+    return Panel(
+        tbl, border_style=th.styles.accent, title=_panel_title("Processes", th, stale)
+    )
+
 
+# -------------------- Disk usage --------------------
 
-# -------------------- Disk usage (simple) --------------------
 
-try:
-    import psutil as _psutil
-except Exception:  # pragma: no cover
-    _psutil = None  # type: ignore[assignment]
+def _sample_disk_usage() -> List[fs_col.FsUsage]:
+    # Never blocks for long: statvfs runs in fs_col's pool with a timeout
+    return fs_col.sample()
 
 
-def _disk_usage_panel(theme: Theme | None = None) -> Panel:
+def _disk_usage_panel(
+    theme: Theme | None = None,
+    rows: Optional[List[fs_col.FsUsage]] = None,
+    stale: bool = False,
+) -> Panel:
     th = theme or get_theme("classic")
-    table = Table(show_lines=False, expand=True, header_style=th.primary)
-    table.add_column("MOUNT", header_style=th.primary)
-    table.add_column("FS", header_style=th.primary)
-    table.add_column("USED", justify="right", header_style=th.primary)
-    table.add_column("TOTAL", justify="right", header_style=th.primary)
-    table.add_column("USE%", justify="right", header_style=th.primary)
-
-    if _psutil is not None:
-        try:
-            for part in _psutil.disk_partitions(all=False):
-                mount = part.mountpoint
-                fstype = part.fstype or "?"
-                try:
-                    du = _psutil.disk_usage(mount)
-                    used = du.used
-                    total = du.total
-                    pct = (used / total * 100.0) if total > 0 else 0.0
-                except Exception:
-                    used = total = 0
-                    pct = 0.0
-                table.add_row(
-                    mount,
-                    fstype,
-                    format_bytes(int(used)),
-                    format_bytes(int(total)),
-                    f"{pct:4.1f}%",
-                )
-        except Exception:
-            pass  # keep empty table if psutil not available/allowed
-
-    return Panel(table, border_style=th.accent, title=Text("Disk", style=th.primary))
+    table = Table(show_lines=False, expand=True, header_style=th.styles.primary)
+    table.add_column("MOUNT", header_style=th.styles.primary)
+    table.add_column("FS", header_style=th.styles.primary)
+    table.add_column("USED", justify="right", header_style=th.styles.primary)
+    table.add_column("TOTAL", justify="right", header_style=th.styles.primary)
+    table.add_column("USE%", justify="right", header_style=th.styles.primary)
+
+    if rows is None:
+        rows = _sample_disk_usage()
+    for row in rows:
+        if row.status != "ok" and row.total == 0:
+            use = Text(row.status, style=th.styles.warning)
+        elif row.status != "ok":
+            use = Text(f"{row.percent:4.1f}% ({row.status})", style=th.styles.warning)
+        else:
+            use = Text(f"{row.percent:4.1f}%")
+        table.add_row(
+            row.mount,
+            row.fstype,
+            format_bytes(row.used),
+            format_bytes(row.total),
+            use,
+        )
+
+    return Panel(
+        table, border_style=th.styles.accent, title=_panel_title("Disk", th, stale)
+    )
 
 
 # -------------------- Top-level layout --------------------
 
 
-def build_top(theme: Theme | None = None) -> RenderableType:
+def collectors(source: Optional[ReplaySource] = None) -> Dict[str, Collector]:
+    """
+    Named collectors whose results build_top() renders, with their default
+    cadence: CPU/mem/net are cheap and critical (always refreshed on time),
+    the process scan backs off when it costs more than its budget, and
+    filesystem usage is checked every 5s (the collector itself caches
+    statvfs results for 30s and re-reads the mount table only on change).
+
+    With a replay `source`, CPU/mem/net come from a recording (trend lines
+    follow recording time) and the unrecorded panels stay empty.
     """
-    Assemble a simple five-row, full-width layout:
+    if source is not None:
+        return {
+            "cpu": Collector(
+                lambda: _sample_cpu(source.cpu(), source.clock()), critical=True
+            ),
+            "mem": Collector(
+                lambda: _sample_mem(source.mem(), source.clock()), critical=True
+            ),
+            "net": Collector(
+                lambda: _net_values(*source.net_rates(), source.clock()),
+                critical=True,
+            ),
+        }
+    out = {
+        "cpu": Collector(_sample_cpu, critical=True),
+        "mem": Collector(_sample_mem, critical=True),
+        "net": Collector(_sample_net, critical=True),
+        "procs": Collector(_sample_procs, budget=0.25),
+        "disk_usage": Collector(_sample_disk_usage, period=5.0),
+    }
+    if topo_col.cpu_groups():
+        # Only where there is more than one node or socket to compare
+        out["numa"] = Collector(topo_col.sample, critical=True)
+    return out
+
+
+def build_top(
+    theme: Theme | None = None,
+    values: Mapping[str, Any] | None = None,
+    stale: AbstractSet[str] = frozenset(),
+    updated: Mapping[str, float] | None = None,
+    cache: PanelCache | None = None,
+) -> RenderableType:
+    """
+    Assemble a simple full-width layout of five (or six) rows:
       [ CPU History ]
+      [ NUMA nodes ]  (multi-node/socket hosts only)
       [ Memory & Swap History ]
       [ Network History ]
       [ Processes ]
       [ Disk usage ]
+
+    `values` holds one published set of collector results (keys as in
+    collectors()); without it, collects inline. Deferred collectors may not
+    have a value yet; names in `stale` get a staleness marker.
+
+    With `updated` (Frame.updated) and a `cache`, a panel whose collector
+    has not produced a new value since the last call is reused as is.
     """
     th = theme or get_theme("classic")
+    v = values if values is not None else {k: c.fn() for k, c in collectors().items()}
+
+    def panel(name: str, build: Callable[[], RenderableType]) -> RenderableType:
+        if cache is None or updated is None or name not in updated:
+            return build()
+        return cache.get(name, (updated[name], name in stale, th), build)
+
+    rows: List[RenderableType] = [
+        panel("cpu", lambda: _cpu_history_panel_ui(th, v["cpu"], "cpu" in stale))
+    ]
+    if "numa" in v:
+        rows.append(panel("numa", lambda: _numa_panel(th, v["numa"], "numa" in stale)))
     return Group(
-        _cpu_history_panel_ui(th),
-        _mem_swap_history_panel_ui(th),
-        _network_history_panel(th),
-        _processes_panel(th),
-        _disk_usage_panel(th),
+        *rows,
+        panel("mem", lambda: _mem_swap_history_panel_ui(th, v["mem"], "mem" in stale)),
+        panel("net", lambda: _network_history_panel(th, v["net"], "net" in stale)),
+        panel(
+            "procs",
+            lambda: _processes_panel(th, v.get("procs", []), "procs" in stale),
+        ),
+        panel(
+            "disk_usage",
+            lambda: _disk_usage_panel(
+                th, v.get("disk_usage", []), "disk_usage" in stale
+            ),
+        ),
     )
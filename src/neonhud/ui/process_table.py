@@ -40,6 +40,7 @@ def build_table(
       pid:int, name:str, cmdline:str, cpu_percent:float, rss_bytes:int
     """
     th = theme or get_theme("classic")
+    st = th.styles  # compiled once per theme
 
     table = Table(show_lines=False, expand=True, header_style=th.primary)
     table.add_column("PID", justify="right", no_wrap=True, header_style=th.primary)
@@ -58,7 +59,7 @@ def build_table(
         rss = int(r.get("rss_bytes", 0))
 
         # highlight hot CPU rows
-        style = th.warning if cpu_pct >= 80.0 else th.accent
+        style = st.hot if cpu_pct >= 80.0 else st.accent
 
         table.add_row(
             Text(str(pid), style=style),
@@ -1,4 +1,26 @@
+"""
+Theme registry for NeonHud.
+
+A Theme names its colors as Rich style strings; `theme.styles` compiles
+them once per theme into rich.style.Style objects (plus derived styles
+such as hot process rows), which renderers pass to Text/Panel directly so
+nothing is parsed per frame.
+"""
+
+from __future__ import annotations
+
 from dataclasses import dataclass
+from functools import cached_property
+from typing import Dict, NamedTuple, Optional
+
+from rich.style import Style
+
+
+class ThemeStyles(NamedTuple):
+    primary: Style  # titles, headers, main values
+    accent: Style  # secondary values, borders, sparklines
+    warning: Style  # stale markers, unresponsive mounts
+    hot: Style  # rows over a threshold (e.g. process CPU >= 80%)
 
 
 @dataclass(frozen=True)
@@ -9,6 +31,17 @@ class Theme:
     warning: str
     background: str
 
+    @cached_property
+    def styles(self) -> ThemeStyles:
+        """Compiled once per Theme instance (frozen, so never stale)."""
+        warning = Style.parse(self.warning)
+        return ThemeStyles(
+            primary=Style.parse(self.primary),
+            accent=Style.parse(self.accent),
+            warning=warning,
+            hot=warning + Style(bold=True),
+        )
+
 
 # Default themes
 CLASSIC = Theme(
@@ -28,12 +61,25 @@ CYBERPUNK = Theme(
 )
 
 # Registry
-THEMES = {
+THEMES: Dict[str, Theme] = {
     "classic": CLASSIC,
     "cyberpunk": CYBERPUNK,
 }
 
 
-def get_theme(name: str) -> Theme:
-    """Fetch a theme by name, defaulting to classic."""
+def register_theme(theme: Theme) -> Theme:
+    """Add (or replace) a named theme; returns it for chaining."""
+    THEMES[theme.name.lower()] = theme
+    return theme
+
+
+def get_theme(name: Optional[str] = None) -> Theme:
+    """
+    Fetch a theme by name, defaulting to classic. Without a name the
+    config's "theme" is used (cached config view, no file I/O per call).
+    """
+    if name is None:
+        from neonhud.core import config
+
+        name = str(config.get_config().get("theme", "classic"))
     return THEMES.get(name.lower(), CLASSIC)
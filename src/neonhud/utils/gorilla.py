@@ -0,0 +1,313 @@
+"""
+Gorilla-style time-series compression (Facebook TSDB, VLDB 2015).
+
+- Timestamps (integer milliseconds) are stored as delta-of-deltas with a
+  variable-length prefix code; a steady sampling interval costs one bit
+  per point.
+- Values (float64) are XORed with the previous value; an unchanged value
+  costs one bit, a small change only its meaningful bits.
+- Optionally values are first scaled to integers at a fixed number of
+  decimals (our collectors round CPU/mem percentages to 0.1). Integral
+  floats have few significant mantissa bits, so noisy percentages compress
+  several times better than their raw float64 bit patterns.
+
+Points are grouped into independently decodable blocks, so a reader can
+bisect block start times and decode just the block it needs.
+
+Usage:
+  s = GorillaSeries(block_size=256, capacity=3600)
+  s.append(ts, value)
+  for ts, v in s.items_newest_first(): ...
+"""
+
+from __future__ import annotations
+
+import bisect
+from array import array
+from collections import deque
+from typing import Deque, Iterator, List, NamedTuple, Optional, Sequence, Tuple
+
+# Delta-of-delta buckets: (prefix, prefix bits, value bits)
+_DOD_BUCKETS = ((0b10, 2, 7), (0b110, 3, 9), (0b1110, 4, 12))
+
+
+class BitWriter:
+    def __init__(self) -> None:
+        self._buf = bytearray()
+        self._acc = 0
+        self._n = 0  # bits held in _acc
+
+    def write(self, value: int, nbits: int) -> None:
+        self._acc = (self._acc << nbits) | (value & ((1 << nbits) - 1))
+        self._n += nbits
+        while self._n >= 8:
+            self._n -= 8
+            self._buf.append((self._acc >> self._n) & 0xFF)
+        self._acc &= (1 << self._n) - 1
+
+    def getvalue(self) -> bytes:
+        if self._n:
+            return bytes(self._buf) + bytes([(self._acc << (8 - self._n)) & 0xFF])
+        return bytes(self._buf)
+
+
+class BitReader:
+    def __init__(self, data: bytes) -> None:
+        self._data = data
+        self._pos = 0
+
+    def read(self, nbits: int) -> int:
+        start = self._pos >> 3
+        end = (self._pos + nbits + 7) >> 3
+        chunk = int.from_bytes(self._data[start:end], "big")
+        shift = end * 8 - self._pos - nbits
+        self._pos += nbits
+        return (chunk >> shift) & ((1 << nbits) - 1)
+
+    def bit(self) -> int:
+        b = (self._data[self._pos >> 3] >> (7 - (self._pos & 7))) & 1
+        self._pos += 1
+        return b
+
+
+# ----- timestamps --------------------------------------------------------------
+
+
+def encode_timestamps(ts_ms: Sequence[int]) -> bytes:
+    w = BitWriter()
+    prev = prev_delta = 0
+    for i, t in enumerate(ts_ms):
+        if i == 0:
+            w.write(t, 64)
+            prev = t
+            continue
+        delta = t - prev
+        dod = delta - prev_delta
+        prev, prev_delta = t, delta
+        if dod == 0:
+            w.write(0, 1)
+            continue
+        for prefix, pbits, vbits in _DOD_BUCKETS:
+            if -(1 << (vbits - 1)) <= dod < (1 << (vbits - 1)):
+                w.write(prefix, pbits)
+                w.write(dod, vbits)
+                break
+        else:
+            w.write(0b1111, 4)
+            w.write(dod, 64)
+    return w.getvalue()
+
+
+def _signed(v: int, bits: int) -> int:
+    return v - (1 << bits) if v >> (bits - 1) else v
+
+
+def decode_timestamps(data: bytes, count: int) -> List[int]:
+    r = BitReader(data)
+    out: List[int] = []
+    prev = delta = 0
+    for i in range(count):
+        if i == 0:
+            prev = _signed(r.read(64), 64)
+            out.append(prev)
+            continue
+        if r.bit() == 0:
+            dod = 0
+        elif r.bit() == 0:
+            dod = _signed(r.read(7), 7)
+        elif r.bit() == 0:
+            dod = _signed(r.read(9), 9)
+        elif r.bit() == 0:
+            dod = _signed(r.read(12), 12)
+        else:
+            dod = _signed(r.read(64), 64)
+        delta += dod
+        prev += delta
+        out.append(prev)
+    return out
+
+
+# ----- values ------------------------------------------------------------------
+
+
+def _float_bits(values: Sequence[float]) -> array:
+    bits = array("Q")
+    bits.frombytes(array("d", values).tobytes())
+    return bits
+
+
+def _scaled(values: Sequence[float], decimals: Optional[int]) -> Sequence[float]:
+    if decimals is None:
+        return values
+    k = 10.0**decimals
+    return [round(v * k) if v == v and abs(v) != float("inf") else v for v in values]
+
+
+def encode_values(values: Sequence[float], decimals: Optional[int] = None) -> bytes:
+    """XOR-encode values; with `decimals`, values are rounded to that many."""
+    w = BitWriter()
+    prev = 0
+    lead = trail = -1  # current meaningful-bit window; -1 = none yet
+    for i, v in enumerate(_float_bits(_scaled(values, decimals))):
+        if i == 0:
+            w.write(v, 64)
+            prev = v
+            continue
+        x = v ^ prev
+        prev = v
+        if x == 0:
+            w.write(0, 1)
+            continue
+        lz = min(31, 64 - x.bit_length())
+        tz = (x & -x).bit_length() - 1
+        if lead >= 0 and lz >= lead and tz >= trail:
+            # Fits the previous window: '10' + meaningful bits
+            w.write(0b10, 2)
+            w.write(x >> trail, 64 - lead - trail)
+        else:
+            lead, trail = lz, tz
+            sig = 64 - lz - tz
+            w.write(0b11, 2)
+            w.write(lz, 5)
+            w.write(sig & 63, 6)  # 64 is stored as 0
+            w.write(x >> tz, sig)
+    return w.getvalue()
+
+
+def decode_values(
+    data: bytes, count: int, decimals: Optional[int] = None
+) -> List[float]:
+    r = BitReader(data)
+    bits = array("Q")
+    prev = lead = trail = 0
+    for i in range(count):
+        if i == 0:
+            prev = r.read(64)
+        elif r.bit() == 1:
+            if r.bit() == 1:
+                lead = r.read(5)
+                sig = r.read(6) or 64
+                trail = 64 - lead - sig
+            prev ^= r.read(64 - lead - trail) << trail
+        bits.append(prev)
+    out = array("d")
+    out.frombytes(bits.tobytes())
+    if decimals is None:
+        return out.tolist()
+    k = 10.0**decimals
+    return [v / k for v in out]
+
+
+# ----- blocks ------------------------------------------------------------------
+
+
+class Block(NamedTuple):
+    npoints: int
+    first_ms: int
+    last_ms: int
+    ts: bytes  # encode_timestamps()
+    values: bytes  # encode_values()
+    decimals: Optional[int] = None
+
+    @property
+    def nbytes(self) -> int:
+        return len(self.ts) + len(self.values)
+
+    def decode(self) -> Tuple[List[int], List[float]]:
+        return (
+            decode_timestamps(self.ts, self.npoints),
+            decode_values(self.values, self.npoints, self.decimals),
+        )
+
+
+def encode_block(
+    ts_ms: Sequence[int], values: Sequence[float], decimals: Optional[int] = None
+) -> Block:
+    return Block(
+        len(ts_ms),
+        ts_ms[0],
+        ts_ms[-1],
+        encode_timestamps(ts_ms),
+        encode_values(values, decimals),
+        decimals,
+    )
+
+
+def to_ms(ts: float) -> int:
+    return int(round(ts * 1000.0))
+
+
+class GorillaSeries:
+    """
+    Append-only compressed series. Points accumulate raw in an open block
+    and are encoded once it holds `block_size` points; with a `capacity`
+    the oldest sealed blocks are dropped so at least that many recent
+    points are kept. Timestamps are seconds, stored at millisecond
+    resolution; `decimals` sets the value precision kept (None = exact).
+    """
+
+    def __init__(
+        self,
+        block_size: int = 256,
+        capacity: Optional[int] = None,
+        decimals: Optional[int] = None,
+    ) -> None:
+        self.block_size = max(2, int(block_size))
+        self.capacity = capacity
+        self.decimals = decimals
+        self._blocks: Deque[Block] = deque()
+        self._sealed = 0  # points in _blocks
+        self._ts = array("q")
+        self._vals = array("d")
+
+    def append(self, ts: float, value: float) -> None:
+        self._ts.append(to_ms(ts))
+        self._vals.append(float(value))
+        if len(self._ts) >= self.block_size:
+            self._blocks.append(encode_block(self._ts, self._vals, self.decimals))
+            self._sealed += len(self._ts)
+            self._ts = array("q")
+            self._vals = array("d")
+            if self.capacity is not None:
+                while (
+                    self._blocks
+                    and self._sealed - self._blocks[0].npoints >= self.capacity
+                ):
+                    self._sealed -= self._blocks.popleft().npoints
+
+    def __len__(self) -> int:
+        return self._sealed + len(self._ts)
+
+    @property
+    def nbytes(self) -> int:
+        """Encoded bytes plus 16 per point still in the open block."""
+        return sum(b.nbytes for b in self._blocks) + 16 * len(self._ts)
+
+    def oldest(self) -> Optional[float]:
+        if self._blocks:
+            return self._blocks[0].first_ms / 1000.0
+        return self._ts[0] / 1000.0 if self._ts else None
+
+    def items_newest_first(self) -> Iterator[Tuple[float, float]]:
+        for i in range(len(self._ts) - 1, -1, -1):
+            yield self._ts[i] / 1000.0, self._vals[i]
+        for block in reversed(self._blocks):
+            ts, vals = block.decode()
+            for i in range(len(ts) - 1, -1, -1):
+                yield ts[i] / 1000.0, vals[i]
+
+    def range(self, t0: float, t1: float) -> List[Tuple[float, float]]:
+        """Points with t0 <= ts <= t1, decoding only overlapping blocks."""
+        lo, hi = to_ms(t0), to_ms(t1)
+        blocks = list(self._blocks)
+        start = bisect.bisect_left([b.last_ms for b in blocks], lo)
+        out: List[Tuple[float, float]] = []
+        for block in blocks[start:]:
+            if block.first_ms > hi:
+                break
+            ts, vals = block.decode()
+            out.extend((t / 1000.0, v) for t, v in zip(ts, vals) if lo <= t <= hi)
+        out.extend(
+            (t / 1000.0, v) for t, v in zip(self._ts, self._vals) if lo <= t <= hi
+        )
+        return out
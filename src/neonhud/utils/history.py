@@ -1,28 +1,129 @@
 """
 Fixed-length ring buffer for metric histories.
+
+Samples live in one preallocated array('d') (8 bytes per point). Running
+min/max/sum/mean are maintained on push: sum incrementally, min/max with
+monotonic deques of sample indices, so each is O(1) amortized and a
+sparkline can be normalized without rescanning the window.
 """
 
 from __future__ import annotations
+from array import array
 from collections import deque
-from typing import Deque, List
+from typing import Deque, Iterator, List, NamedTuple, Tuple
+
+
+class Window(NamedTuple):
+    """Immutable copy of a HistoryBuffer plus its statistics at copy time."""
+
+    values: array  # oldest→newest
+    min: float
+    max: float
+    mean: float
+    pushes: int = 0  # total pushes so far (identifies the newest sample)
 
 
 class HistoryBuffer:
     def __init__(self, maxlen: int = 120) -> None:
-        self.maxlen = maxlen
-        self._dq: Deque[float] = deque(maxlen=maxlen)
+        self.maxlen = max(1, int(maxlen))
+        self._buf = array("d", bytes(8 * self.maxlen))
+        self._count = 0  # total pushes; newest sample index is _count - 1
+        self._sum = 0.0
+        # Indices of candidate extremes, values monotonic from the left
+        self._maxq: Deque[int] = deque()
+        self._minq: Deque[int] = deque()
+
+    def _at(self, idx: int) -> float:
+        return self._buf[idx % self.maxlen]
 
     def push(self, value: float) -> None:
-        self._dq.append(float(value))
+        v = float(value)
+        idx = self._count
+        slot = idx % self.maxlen
+        if idx >= self.maxlen:
+            # Evict the oldest sample (it lives in the slot we overwrite)
+            old_idx = idx - self.maxlen
+            self._sum -= self._buf[slot]
+            if self._maxq and self._maxq[0] == old_idx:
+                self._maxq.popleft()
+            if self._minq and self._minq[0] == old_idx:
+                self._minq.popleft()
+        self._buf[slot] = v
+        self._count = idx + 1
+
+        if slot == 0 and idx:
+            # Re-sum once per wrap so float error cannot accumulate
+            self._sum = sum(self._buf) + 0.0
+        else:
+            self._sum += v
+
+        while self._maxq and self._at(self._maxq[-1]) <= v:
+            self._maxq.pop()
+        self._maxq.append(idx)
+        while self._minq and self._at(self._minq[-1]) >= v:
+            self._minq.pop()
+        self._minq.append(idx)
+
+    # ----- running statistics ------------------------------------------------
+
+    @property
+    def max(self) -> float:
+        return self._at(self._maxq[0]) if self._maxq else 0.0
+
+    @property
+    def min(self) -> float:
+        return self._at(self._minq[0]) if self._minq else 0.0
+
+    @property
+    def sum(self) -> float:
+        return self._sum
+
+    @property
+    def mean(self) -> float:
+        n = len(self)
+        return self._sum / n if n else 0.0
+
+    # ----- access ------------------------------------------------------------
+
+    def view(self) -> Tuple[memoryview, memoryview]:
+        """
+        Zero-copy (older, newer) slices; their concatenation is the window
+        oldest→newest. Only valid until the next push().
+        """
+        mv = memoryview(self._buf)
+        n = len(self)
+        if self._count <= self.maxlen:
+            return mv[0:0], mv[:n]
+        head = self._count % self.maxlen
+        return mv[head:], mv[:head]
+
+    def snapshot(self) -> array:
+        """Compact copy of the window (oldest→newest), safe to hand off."""
+        older, newer = self.view()
+        out = array("d", older)
+        out.extend(newer)
+        return out
+
+    def window(self) -> Window:
+        """Snapshot with stats, for publishing to another thread."""
+        return Window(self.snapshot(), self.min, self.max, self.mean, self._count)
 
     def values(self) -> List[float]:
-        return list(self._dq)
+        return self.snapshot().tolist()
 
     def latest(self) -> float:
-        return self._dq[-1] if self._dq else 0.0
+        return self._at(self._count - 1) if self._count else 0.0
+
+    def clear(self) -> None:
+        self._count = 0
+        self._sum = 0.0
+        self._maxq.clear()
+        self._minq.clear()
 
     def __len__(self) -> int:
-        return len(self._dq)
+        return min(self._count, self.maxlen)
 
-    def __iter__(self):
-        return iter(self._dq)
+    def __iter__(self) -> Iterator[float]:
+        older, newer = self.view()
+        yield from older
+        yield from newer
@@ -11,17 +11,11 @@ from rich.panel import Panel
 from neonhud.core import config as core_config
 from neonhud.utils.history import HistoryBuffer
 
-
 # Shared history buffers
-CPU_HISTORY = HistoryBuffer(
-    maxlen=int(core_config.load_config().get("history_len", 120))
-)
-MEM_HISTORY = HistoryBuffer(
-    maxlen=int(core_config.load_config().get("history_len", 120))
-)
-NET_HISTORY = HistoryBuffer(
-    maxlen=int(core_config.load_config().get("history_len", 120))
-)
+_HISTORY_LEN = int(core_config.get_config().get("history_len", 120))
+CPU_HISTORY = HistoryBuffer(maxlen=_HISTORY_LEN)
+MEM_HISTORY = HistoryBuffer(maxlen=_HISTORY_LEN)
+NET_HISTORY = HistoryBuffer(maxlen=_HISTORY_LEN)
 
 
 def _placeholder(title: str) -> Panel:
@@ -0,0 +1,227 @@
+"""
+Multi-resolution (RRD-style) history for long retention.
+
+A RollupHistory keeps the last `raw_len` samples at full resolution plus
+fixed-size tiers of min/avg/max buckets (by default 10s, 1m and 10m).
+Every push updates the open bucket of each tier in O(1); a bucket is
+appended to its tier's ring when a sample lands in a later bucket. Memory
+is bounded by the ring sizes no matter how long the process runs.
+
+Raw samples are kept Gorilla-compressed (utils.gorilla), so an hour of
+full-resolution data costs a few bytes per point; `decimals` sets the raw
+precision (e.g. 1 for percentages the collectors already round to 0.1).
+
+window(span, width) answers "the last hour at terminal width" from the
+coarsest tier that still resolves one column, so it reads at most a few
+hundred buckets instead of raw samples.
+
+Usage:
+  h = RollupHistory()
+  h.push(42.0)
+  w = h.window(3600.0, 80)  # RollupWindow, NaN where there is no data
+"""
+
+from __future__ import annotations
+
+import math
+import time
+from array import array
+from typing import Iterator, List, NamedTuple, Optional, Sequence, Tuple
+
+from neonhud.utils.gorilla import GorillaSeries
+
+NAN = math.nan
+
+# (bucket seconds, buckets kept): 1h of 10s, 6h of 1m, 48h of 10m
+DEFAULT_TIERS: Tuple[Tuple[float, int], ...] = ((10.0, 360), (60.0, 360), (600.0, 288))
+
+
+class RollupWindow(NamedTuple):
+    """`width` columns oldest→newest; NaN marks columns with no samples."""
+
+    step: float  # seconds per column
+    lo: array
+    avg: array
+    hi: array
+    peak: float  # max of avg over non-empty columns (0.0 if none)
+
+
+class _Ring:
+    """Fixed-size array('d') ring; index 0 is the newest item."""
+
+    __slots__ = ("cap", "_buf", "_count")
+
+    def __init__(self, cap: int) -> None:
+        self.cap = max(1, int(cap))
+        self._buf = array("d", bytes(8 * self.cap))
+        self._count = 0
+
+    def append(self, v: float) -> None:
+        self._buf[self._count % self.cap] = v
+        self._count += 1
+
+    def __len__(self) -> int:
+        return min(self._count, self.cap)
+
+    def full(self) -> bool:
+        return self._count >= self.cap
+
+    def newest(self, i: int) -> float:
+        return self._buf[(self._count - 1 - i) % self.cap]
+
+
+class _Tier:
+    """Closed min/avg/max buckets of one size, plus the bucket being filled."""
+
+    def __init__(self, step: float, cap: int) -> None:
+        self.step = float(step)
+        self.lo = _Ring(cap)
+        self.avg = _Ring(cap)
+        self.hi = _Ring(cap)
+        self.open_start: Optional[float] = None
+        self._n = 0
+        self._sum = 0.0
+        self._lo = math.inf
+        self._hi = -math.inf
+
+    def _append(self, lo: float, avg: float, hi: float) -> None:
+        self.lo.append(lo)
+        self.avg.append(avg)
+        self.hi.append(hi)
+
+    def push(self, ts: float, v: float) -> None:
+        start = math.floor(ts / self.step) * self.step
+        if self.open_start is None:
+            self.open_start = start
+        elif start > self.open_start:
+            self._append(self._lo, self._sum / self._n, self._hi)
+            # Empty buckets keep the rings time-aligned (bounded by capacity)
+            gap = int(round((start - self.open_start) / self.step)) - 1
+            for _ in range(min(gap, self.lo.cap)):
+                self._append(NAN, NAN, NAN)
+            self.open_start = start
+            self._n = 0
+            self._sum = 0.0
+            self._lo = math.inf
+            self._hi = -math.inf
+        # A sample from an earlier bucket (clock step) folds into the open one
+        self._n += 1
+        self._sum += v
+        self._lo = min(self._lo, v)
+        self._hi = max(self._hi, v)
+
+    def covers(self, since: float) -> bool:
+        if self.open_start is None:
+            return False
+        if not self.lo.full():
+            return True  # holds everything since the first sample
+        return self.open_start - len(self.lo) * self.step <= since
+
+    def items(self) -> Iterator[Tuple[float, float, float, float]]:
+        """(bucket start, lo, avg, hi), newest first, open bucket included."""
+        if self.open_start is None:
+            return
+        if self._n:
+            yield self.open_start, self._lo, self._sum / self._n, self._hi
+        for i in range(len(self.lo)):
+            yield (
+                self.open_start - (i + 1) * self.step,
+                self.lo.newest(i),
+                self.avg.newest(i),
+                self.hi.newest(i),
+            )
+
+
+class RollupHistory:
+    def __init__(
+        self,
+        raw_len: int = 3600,
+        tiers: Sequence[Tuple[float, int]] = DEFAULT_TIERS,
+        decimals: Optional[int] = None,
+    ) -> None:
+        self._raw_len = max(1, int(raw_len))
+        self._raw = GorillaSeries(
+            block_size=min(128, self._raw_len),
+            capacity=self._raw_len,
+            decimals=decimals,
+        )
+        self._tiers: List[_Tier] = [_Tier(s, n) for s, n in sorted(tiers)]
+
+    def push(self, value: float, ts: Optional[float] = None) -> None:
+        """Add one sample (ts defaults to time.monotonic())."""
+        t = time.monotonic() if ts is None else float(ts)
+        v = float(value)
+        self._raw.append(t, v)
+        for tier in self._tiers:
+            tier.push(t, v)
+
+    def __len__(self) -> int:
+        return min(len(self._raw), self._raw_len)
+
+    @property
+    def nbytes(self) -> int:
+        """Approximate raw-sample storage (tiers are fixed size)."""
+        return self._raw.nbytes
+
+    def _raw_covers(self, since: float) -> bool:
+        oldest = self._raw.oldest()
+        return len(self._raw) < self._raw_len or (
+            oldest is not None and oldest <= since
+        )
+
+    def _raw_items(self) -> Iterator[Tuple[float, float, float, float]]:
+        for ts, v in self._raw.items_newest_first():
+            yield ts, v, v, v
+
+    def _source(
+        self, since: float, col: float
+    ) -> Tuple[float, Iterator[Tuple[float, float, float, float]]]:
+        """Coarsest source that resolves one column, widened until it covers."""
+        candidates: List[Tuple[float, bool]] = [(0.0, self._raw_covers(since))]
+        candidates += [(t.step, t.covers(since)) for t in self._tiers]
+        pick = 0
+        for i, (step, _) in enumerate(candidates):
+            if step <= col:
+                pick = i
+        while pick < len(candidates) - 1 and not candidates[pick][1]:
+            pick += 1
+        if pick == 0:
+            return 0.0, self._raw_items()
+        tier = self._tiers[pick - 1]
+        return tier.step, tier.items()
+
+    def window(
+        self, span: float, width: int, now: Optional[float] = None
+    ) -> RollupWindow:
+        """
+        The last `span` seconds resampled to `width` columns of min/avg/max
+        (avg is the mean of the source buckets in a column).
+        """
+        width = max(1, int(width))
+        end = time.monotonic() if now is None else float(now)
+        since = end - span
+        col = span / width
+
+        lo = array("d", [NAN]) * width
+        hi = array("d", lo)
+        total = array("d", bytes(8 * width))
+        count = [0] * width
+
+        step, items = self._source(since, col)
+        for ts, b_lo, b_avg, b_hi in items:
+            if ts + step <= since:
+                break  # newest first: everything further is older
+            if b_avg != b_avg:
+                continue  # empty bucket
+            c = min(width - 1, max(0, int((ts - since) / col)))
+            if count[c] == 0:
+                lo[c], hi[c] = b_lo, b_hi
+            else:
+                lo[c] = min(lo[c], b_lo)
+                hi[c] = max(hi[c], b_hi)
+            total[c] += b_avg
+            count[c] += 1
+
+        avg = array("d", (t / n if n else NAN for t, n in zip(total, count)))
+        peak = max((a for a in avg if a == a), default=0.0)
+        return RollupWindow(col, lo, avg, hi, peak)
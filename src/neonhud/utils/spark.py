@@ -1,13 +1,31 @@
 """
 Sparkline utility for compact history graphs.
 
+Quantization runs in C: each value is bisected into precomputed level
+thresholds and the level indices are mapped straight to glyphs, so a
+whole window is converted without a per-point Python loop. Series longer
+than the target width are downsampled with min/max-preserving buckets
+(each column keeps the extreme of its bucket that differs most from the
+previous column), so spikes and dips survive instead of being cut off.
+
+SparkCache keeps the last rendered string per series and, when only new
+samples arrived and the scale is unchanged, shifts in just their glyphs.
+
 Usage:
   sparkline([10, 20, 15], max_width=20)
+  sparkline(history.values, peak=history.max, width=40)
 """
 
 from __future__ import annotations
 
-from typing import Iterable, List
+import math
+from array import array
+from bisect import bisect_right
+from functools import lru_cache
+from itertools import repeat
+from typing import Dict, Iterable, List, NamedTuple, Optional, Sequence, Tuple
+
+from neonhud.utils.history import Window
 
 # Default charset: 8-level ramp (low→high)
 DEFAULT_CHARS = "▁▂▃▄▅▆▇█"
@@ -17,31 +35,132 @@ def clamp(v: float, lo: float, hi: float) -> float:
     return lo if v < lo else hi if v > hi else v
 
 
+@lru_cache(maxsize=256)
+def thresholds(peak: float, levels: int) -> Tuple[float, ...]:
+    # Level i covers values rounding to i/(levels-1) of peak
+    step = peak / (levels - 1)
+    return tuple((i + 0.5) * step for i in range(levels - 1))
+
+
+def quantize(buf: Sequence[float], peak: float, charset: str = DEFAULT_CHARS) -> str:
+    """One glyph per value of `buf` scaled to `peak` (> 0); NaN is a space."""
+    bounds = thresholds(peak, len(charset))
+    out = "".join(map(charset.__getitem__, map(bisect_right, repeat(bounds), buf)))
+    if any(map(math.isnan, buf)):
+        out = "".join(" " if v != v else c for v, c in zip(buf, out))
+    return out
+
+
+def downsample(values: Sequence[float], width: int) -> List[float]:
+    """
+    Reduce `values` to `width` points, one per equal bucket. Each bucket
+    contributes its max or min, whichever is farther from the previously
+    chosen point (the max for the first bucket). All-NaN buckets stay NaN.
+    """
+    n = len(values)
+    if width <= 0 or n <= width:
+        return list(values)
+    has_nan = any(map(math.isnan, values))
+    out: List[float] = []
+    prev: Optional[float] = None
+    for i in range(width):
+        chunk = values[i * n // width : (i + 1) * n // width]
+        if has_nan:
+            chunk = [x for x in chunk if x == x]
+            if not chunk:
+                out.append(math.nan)
+                continue
+        lo = min(chunk)
+        hi = max(chunk)
+        pick = hi if prev is None or hi - prev >= prev - lo else lo
+        out.append(pick)
+        prev = pick
+    return out
+
+
 def sparkline(
-    values: Iterable[float], charset: str = DEFAULT_CHARS, max_width: int | None = None
+    values: Iterable[float],
+    charset: str = DEFAULT_CHARS,
+    max_width: int | None = None,
+    peak: float | None = None,
+    width: int | None = None,
 ) -> str:
     """
     Convert a sequence of non-negative values into a unicode sparkline.
 
     - If all values are 0 or empty, returns '' (or a run of the lowest glyph if you prefer).
     - max_width truncates the sequence to the last N points.
+    - width fits the whole sequence into N columns (see downsample()).
+    - NaN marks a gap (no data) and renders as a space.
 
     Normalization: each value is scaled against the max of the slice to map into the charset.
+    Pass `peak` (e.g. HistoryBuffer.max) to skip that scan; it is ignored when
+    max_width trims the sequence, since the trimmed slice may have a lower max.
     """
-    buf: List[float] = [float(x) if x is not None else 0.0 for x in values]
+    if isinstance(values, (array, memoryview)):
+        buf: Sequence[float] = values  # already floats, no None
+    else:
+        buf = [float(x) if x is not None else 0.0 for x in values]
     if not buf:
         return ""
     if max_width is not None and max_width > 0 and len(buf) > max_width:
         buf = buf[-max_width:]
+        peak = None
+    if width is not None and len(buf) > width > 0:
+        buf = downsample(buf, width)
 
-    m = max(buf)
+    if peak is not None:
+        m = float(peak)
+    elif any(map(math.isnan, buf)):
+        m = max((x for x in buf if x == x), default=0.0)
+    else:
+        m = max(buf)
     if m <= 0.0:
         return ""  # no signal
+    return quantize(buf, m, charset)
+
+
+class _Rendered(NamedTuple):
+    pushes: int  # Window.pushes when rendered
+    peak: float
+    width: Optional[int]
+    text: str
+
+
+class SparkCache:
+    """
+    Rendered sparklines per series name. A series re-rendered with the
+    same peak and only k new samples since the last call costs k glyphs;
+    an unchanged series costs nothing. Downsampled series (longer than
+    `width`) are rendered in full, since their buckets move every push.
+    """
+
+    def __init__(self, charset: str = DEFAULT_CHARS) -> None:
+        self.charset = charset
+        self._items: Dict[str, _Rendered] = {}
+
+    def render(self, name: str, w: Window, width: Optional[int] = None) -> str:
+        values = w.values
+        n = len(values)
+        prev = self._items.get(name)
+        fits = width is None or n <= width
+        if (
+            w.pushes > 0  # 0: not from a HistoryBuffer, nothing to track
+            and prev is not None
+            and prev.peak == w.max
+            and prev.width == width
+        ):
+            new = w.pushes - prev.pushes
+            if new == 0 and (not fits or len(prev.text) in (0, n)):
+                return prev.text
+            if fits and 0 < new <= n and prev.text and len(prev.text) + new >= n:
+                tail = quantize(values[n - new :], w.max, self.charset)
+                text = (prev.text + tail)[-n:]
+                self._items[name] = _Rendered(w.pushes, w.max, width, text)
+                return text
+        text = sparkline(values, self.charset, peak=w.max, width=width)
+        self._items[name] = _Rendered(w.pushes, w.max, width, text)
+        return text
 
-    n_levels = len(charset)
-    out_chars: List[str] = []
-    for v in buf:
-        # Scale to [0, n_levels-1]
-        idx = int(round(clamp(v / m, 0.0, 1.0) * (n_levels - 1)))
-        out_chars.append(charset[idx])
-    return "".join(out_chars)
+    def clear(self) -> None:
+        self._items.clear()
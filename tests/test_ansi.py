@@ -0,0 +1,67 @@
+import io
+import re
+
+from rich.console import Console
+from rich.text import Text
+
+from neonhud.ui import process_table
+from neonhud.ui.ansi import AnsiScreen, CountingWriter
+
+_SEQ = re.compile(r"\x1b\[(\d+);(\d+)H|\x1b\[[0-9;?]*[A-Za-z]")
+
+
+def _apply(grid, data):
+    """Tiny terminal: cursor moves and printable characters only."""
+    row = col = 0
+    pos = 0
+    for m in _SEQ.finditer(data):
+        for ch in data[pos : m.start()]:
+            grid[row][col] = ch
+            col += 1
+        if m.group(1):
+            row, col = int(m.group(1)) - 1, int(m.group(2)) - 1
+        pos = m.end()
+    for ch in data[pos:]:
+        grid[row][col] = ch
+        col += 1
+
+
+def _rows(cpu):
+    return [
+        {"pid": i, "name": f"p{i}", "cmdline": "x", "cpu_percent": c, "rss_bytes": 1}
+        for i, c in enumerate(cpu)
+    ]
+
+
+def test_ansi_screen_sends_only_changes_and_converges():
+    buf = io.StringIO()
+    console = Console(file=buf, force_terminal=True, width=60, height=10)
+    screen = AnsiScreen(console)
+    grid = [[" "] * 60 for _ in range(10)]
+
+    screen.update(process_table.build_table(_rows([1.0, 2.0, 3.0])))
+    _apply(grid, buf.getvalue())
+    first = screen.last_bytes
+
+    mark = len(buf.getvalue())
+    screen.update(process_table.build_table(_rows([1.0, 99.0, 3.0])))
+    _apply(grid, buf.getvalue()[mark:])
+    assert 0 < screen.last_bytes < first / 4
+
+    expected = Console(file=io.StringIO(), width=60, height=10, record=True)
+    expected.print(process_table.build_table(_rows([1.0, 99.0, 3.0])))
+    lines = expected.export_text().splitlines()
+    for r, line in enumerate(lines):
+        assert "".join(grid[r]).rstrip() == line.rstrip()
+
+    # Nothing changed -> nothing written
+    mark = len(buf.getvalue())
+    screen.update(process_table.build_table(_rows([1.0, 99.0, 3.0])))
+    assert buf.getvalue()[mark:] == "" and screen.last_bytes == 0
+
+
+def test_counting_writer_counts_utf8_bytes():
+    out = CountingWriter(io.StringIO())
+    console = Console(file=out, width=20)  # type: ignore[arg-type]
+    console.print(Text("▁▂▃"))
+    assert out.bytes == len("▁▂▃\n".encode())
@@ -0,0 +1,45 @@
+import math
+
+from rich.console import Console
+
+from neonhud.ui.braille import BrailleChart
+from neonhud.utils.history import HistoryBuffer
+
+
+def test_rasterize_dots_and_resolution():
+    # 4 samples on 2 cells: bottom, top, top, bottom of a 1-row chart
+    rows, owners = BrailleChart([([0.0, 1.0, 1.0, 0.0], "green")], height=1).rasterize(
+        2
+    )
+    assert len(rows) == 1 and len(rows[0]) == 2
+    assert all("⠀" < ch <= "⣿" for ch in rows[0])
+    assert owners == [b"\x01\x01"]
+
+    # Right-aligned: a short series leaves the left columns blank
+    rows, owners = BrailleChart([([1.0], "green")], height=2).rasterize(4)
+    assert rows[1][:3] == "   " and owners[0][:3] == b"\x00\x00\x00"
+
+
+def test_series_overlay_and_gaps():
+    chart = BrailleChart(
+        [([1.0] * 8, "green"), ([1.0, 1.0, math.nan, math.nan], "red")],
+        height=1,
+        peak=1.0,
+    )
+    rows, owners = chart.rasterize(4)
+    # The later series wins shared cells; its NaN gap shows the first one
+    assert owners[0] == b"\x01\x01\x02\x01"
+    assert rows[0].strip() != ""
+
+
+def test_reads_history_buffer_in_place():
+    buf = HistoryBuffer(maxlen=16)
+    for i in range(21):  # wrapped ring
+        buf.push(float(i % 5))
+    from_buffer = BrailleChart([(buf, "green")], height=3).rasterize(8)
+    from_values = BrailleChart([(buf.values(), "green")], height=3, peak=buf.max)
+    assert from_buffer == from_values.rasterize(8)
+
+    console = Console(width=8, record=True)
+    console.print(BrailleChart([(buf, "green")], height=3))
+    assert len(console.export_text().splitlines()) == 3
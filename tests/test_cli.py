@@ -4,3 +4,24 @@ from importlib import import_module
 def test_cli_imports():
     mod = import_module("neonhud.cli")
     assert hasattr(mod, "main")
+
+
+def test_live_settings_follow_config_edits(tmp_path, monkeypatch):
+    import argparse
+
+    from neonhud import cli
+
+    path = tmp_path / "config.toml"
+    path.write_text("refresh_interval = 1.5\n")
+    monkeypatch.setenv("NEONHUD_CONFIG", str(path))
+    monkeypatch.setattr("neonhud.core.config.RECHECK_INTERVAL", 0.0)
+
+    args = argparse.Namespace(interval=None, theme="cyberpunk", limit=None)
+    settings = cli._LiveSettings(args)
+    assert settings.interval == 1.5 and settings.theme_name == "cyberpunk"
+    assert settings.refresh() is False
+
+    path.write_text('refresh_interval = 0.5\ntheme = "classic"\nprocess_limit = 3\n')
+    assert settings.refresh() is True
+    assert settings.interval == 0.5 and settings.limit == 3
+    assert settings.theme_name == "cyberpunk"  # command line wins
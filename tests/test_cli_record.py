@@ -0,0 +1,26 @@
+import subprocess
+import sys
+
+from neonhud.models.recording import iter_frames, read_header
+
+
+def test_cli_record_writes_rows(tmp_path):
+    path = tmp_path / "rec.nhr"
+    cmd = [
+        sys.executable,
+        "-m",
+        "neonhud.cli",
+        "record",
+        str(path),
+        "--interval",
+        "0.1",
+        "--duration",
+        "0.5",
+    ]
+    subprocess.run(cmd, capture_output=True, text=True, check=True, timeout=30)
+
+    with open(path, "rb") as f:
+        hdr = read_header(f)
+    assert hdr.columns[0] == "cpu_total"
+    rows = list(iter_frames(str(path)))
+    assert rows and all(len(r) == 1 + len(hdr.columns) for r in rows)
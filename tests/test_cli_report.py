@@ -13,3 +13,27 @@ def test_cli_report_runs(tmp_path):
     assert "schema" in data
     assert "cpu" in data
     assert "memory" in data
+
+
+def test_cli_report_stream_lines():
+    cmd = [
+        sys.executable,
+        "-m",
+        "neonhud.cli",
+        "report",
+        "--stream",
+        "--interval",
+        "0.05",
+        "--count",
+        "3",
+        "--keyframe",
+        "2",
+    ]
+    proc = subprocess.run(cmd, capture_output=True, text=True, check=True, timeout=30)
+
+    lines = [json.loads(ln) for ln in proc.stdout.splitlines()]
+    assert [ln["seq"] for ln in lines] == [1, 2, 3]
+    assert [ln["key"] for ln in lines] == [True, False, True]
+    assert lines[0]["schema"] == "neonhud.report.v1"
+    assert lines[0]["rates"]["interval"] > 0.0
+    assert "schema" not in lines[1]
@@ -7,3 +7,31 @@ def test_default_config_loads():
     assert "theme" in cfg
     assert "refresh_interval" in cfg
     assert "process_limit" in cfg
+
+
+def test_config_cached_until_file_changes(tmp_path, monkeypatch):
+    import pytest
+
+    path = tmp_path / "config.toml"
+    path.write_text('theme = "cyberpunk"\n[cadence]\nprocs = 2\n')
+    monkeypatch.setenv("NEONHUD_CONFIG", str(path))
+
+    view = config.get_config(max_age=0.0)
+    assert view["theme"] == "cyberpunk"
+    assert view["cadence"]["procs"] == 2
+    assert config.get_config(max_age=0.0) is view  # unchanged file: no re-parse
+    with pytest.raises(TypeError):
+        view["theme"] = "classic"  # type: ignore[index]
+
+    # load_config() hands out an independent mutable copy
+    cfg = config.load_config()
+    cfg["cadence"]["procs"] = 9
+    assert config.get_config(max_age=0.0)["cadence"]["procs"] == 2
+
+    path.write_text('theme = "classic"\nprocess_limit = 5\n')
+    view2 = config.get_config(max_age=0.0)
+    assert view2 is not view
+    assert view2["theme"] == "classic" and view2["process_limit"] == 5
+
+    path.unlink()
+    assert config.get_config(max_age=0.0)["process_limit"] == 15
@@ -17,3 +17,25 @@ def test_cpu_sample_shape():
     # sanity ranges
     assert 0.0 <= total <= 100.0
     assert all(0.0 <= v <= 100.0 for v in per_cpu)
+
+
+def test_cpu_breakdown_is_consistent():
+    sampler = cpu.CpuSampler()
+    sampler.sample()
+    b = sampler.sample_breakdown()
+    assert len(b.busy) == len(b.cpu_ids) + 1
+    for r in range(len(b.busy)):
+        parts = b.user[r] + b.system[r] + b.irq[r] + b.steal[r]
+        assert 0.0 <= b.busy[r] <= 100.0 + 1e-6
+        assert parts <= b.busy[r] + 1e-6
+
+    data = sampler.sample()
+    assert set(data["breakdown"]) == {"user", "system", "iowait", "steal", "irq"}
+
+
+def test_cpu_sampler_falls_back_to_psutil(monkeypatch):
+    monkeypatch.setattr(cpu, "PROC_STAT", "/nonexistent/stat")
+    sampler = cpu.CpuSampler()
+    data = sampler.sample()
+    assert len(data["per_cpu"]) >= 1
+    assert 0.0 <= data["percent_total"] <= 100.0
@@ -14,3 +14,44 @@ def test_cpu_panel_renders_per_core():
     assert "Core 0" in text
     assert "Core 1" in text
     assert "Core 2" in text
+
+
+def test_cpu_panel_heatmap_for_many_cores():
+    from neonhud.ui.heatmap import CoreHeatmap, use_heatmap
+
+    assert not use_heatmap(8, lines=50)
+    assert use_heatmap(192, lines=200)
+    assert use_heatmap(16, lines=24)
+
+    per = [float(i % 101) for i in range(192)]
+    console = Console(record=True, width=80)
+    console.print(panels.build_cpu_panel({"percent_total": 50.0, "per_cpu": per}))
+    text = console.export_text()
+    assert "Core 0" not in text
+    assert len(text.splitlines()) < 10
+
+    # Groups start on their own labelled rows; runs of a band share a segment
+    hm = CoreHeatmap(per[:8], get_theme("classic"), groups=[("N0", [0, 1, 2, 3])])
+    rows = hm.rows(20)
+    assert [r[0] for r in rows] == ["N0 "]
+    assert rows[0][2] == bytes([0, 0, 0, 0])
+
+    forced = panels.build_cpu_panel(
+        {"percent_total": 5.0, "per_core": [1.0, 2.0]}, mode="heatmap"
+    )
+    console = Console(record=True, width=80)
+    console.print(forced)
+    assert "Core 0" not in console.export_text()
+
+
+def test_cpu_panel_auto_view_follows_console_height():
+    cpu = {"percent_total": 5.0, "per_cpu": [1.0] * 16}
+    panel = panels.build_cpu_panel(cpu, mode="auto")
+
+    tall = Console(record=True, width=80, height=100)
+    tall.print(panel)
+    assert "Core 15" in tall.export_text()
+
+    short = Console(record=True, width=80, height=24)
+    short.print(panel)
+    assert "Core 0" not in short.export_text()
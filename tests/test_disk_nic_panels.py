@@ -43,3 +43,29 @@ def test_nics_panel_renders_interfaces():
     txt = c.export_text()
     assert "eth0" in txt or "wlan0" in txt
     assert "RX" in txt and "TX" in txt
+
+
+def test_disks_panel_shows_iostat_fields_busiest_first():
+    fake = {
+        "sda": {"read_bps": 9e6, "write_bps": 0.0, "util": 10.0, "read_iops": 5.0},
+        "sdb": {
+            "read_bps": 1024.0,
+            "write_bps": 0.0,
+            "read_iops": 120.0,
+            "write_iops": 30.0,
+            "read_await": 4.0,
+            "write_await": 9.5,
+            "queue": 2.25,
+            "util": 87.5,
+        },
+        "sdc": {"read_bps": 0.0, "write_bps": 0.0, "util": 0.0},
+    }
+    panel = panels.build_disks_panel(fake, theme=get_theme("classic"), limit=2)
+    c = Console(record=True, width=160)
+    c.print(panel)
+    txt = c.export_text()
+    assert txt.index("sdb") < txt.index("sda")
+    assert "sdc" not in txt
+    assert "150.0 IOPS" in txt and "await    9.5 ms" in txt
+    assert "q  2.2" in txt or "q  2.3" in txt
+    assert "util 87.5%" in txt
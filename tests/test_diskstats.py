@@ -0,0 +1,72 @@
+import pytest
+
+from neonhud.collectors import diskstats
+
+
+def _line(major, minor, name, reads, rsect, rms, writes, wsect, wms, inflight, io, wt):
+    # major minor name reads merged sectors ms writes merged sectors ms
+    # in_flight io_ms weighted_ms
+    return (
+        f"{major:4d} {minor:7d} {name} {reads} 0 {rsect} {rms} "
+        f"{writes} 0 {wsect} {wms} {inflight} {io} {wt} 0 0 0 0\n"
+    )
+
+
+def _fake(tmp_path, monkeypatch):
+    block = tmp_path / "block"
+    for dev in ("sda", "nvme0n1", "loop0", "cciss!c0d0"):
+        (block / dev).mkdir(parents=True)
+    stats = tmp_path / "diskstats"
+    monkeypatch.setattr(diskstats, "PROC_DISKSTATS", str(stats))
+    monkeypatch.setattr(diskstats, "SYS_BLOCK", str(block))
+    return stats
+
+
+def test_partitions_and_unused_devices_are_skipped(tmp_path, monkeypatch):
+    stats = _fake(tmp_path, monkeypatch)
+    stats.write_text(
+        _line(8, 0, "sda", 10, 80, 5, 0, 0, 0, 0, 5, 5)
+        + _line(8, 1, "sda1", 10, 80, 5, 0, 0, 0, 0, 5, 5)
+        + _line(259, 0, "nvme0n1", 0, 0, 0, 4, 32, 2, 1, 2, 2)
+        + _line(259, 1, "nvme0n1p1", 0, 0, 0, 4, 32, 2, 0, 2, 2)
+        + _line(7, 0, "loop0", 0, 0, 0, 0, 0, 0, 0, 0, 0)
+        + _line(104, 0, "cciss/c0d0", 1, 8, 1, 0, 0, 0, 0, 1, 1)
+    )
+    out = diskstats.DiskStatsSampler().sample()
+    assert sorted(out) == ["cciss/c0d0", "nvme0n1", "sda"]
+    assert out["nvme0n1"].in_flight == 1
+
+
+def test_rates_await_queue_and_util(tmp_path, monkeypatch):
+    stats = _fake(tmp_path, monkeypatch)
+    sampler = diskstats.DiskStatsSampler()
+    stats.write_text(_line(8, 0, "sda", 100, 800, 50, 10, 80, 20, 0, 1000, 70))
+    sampler.sample(now=100.0)
+    stats.write_text(
+        _line(8, 0, "sda", 300, 2800, 450, 30, 480, 120, 2, 1500, 3070)
+        + _line(259, 0, "nvme0n1", 0, 0, 0, 1, 8, 1, 0, 1, 1)
+    )
+    out = sampler.sample(now=102.0)
+
+    sda = out["sda"]
+    assert sda.read_iops == pytest.approx(100.0)  # 200 reads / 2 s
+    assert sda.write_iops == pytest.approx(10.0)
+    assert sda.read_bps == pytest.approx(2000 * 512 / 2)
+    assert sda.write_bps == pytest.approx(400 * 512 / 2)
+    assert sda.read_await == pytest.approx(2.0)  # 400 ms / 200 reads
+    assert sda.write_await == pytest.approx(5.0)
+    assert sda.queue == pytest.approx(1.5)  # 3000 ms weighted / 2000 ms
+    assert sda.util == pytest.approx(25.0)  # 500 ms busy of 2000 ms
+    assert sda.in_flight == 2
+    # A device first seen on this tick is measured from zero, not dropped
+    assert out["nvme0n1"].write_iops == pytest.approx(0.5)
+
+    d = diskstats.as_dict(out)
+    assert d["sda"]["util"] == 25.0 and d["sda"]["read_await"] == 2.0
+
+
+def test_falls_back_to_psutil_without_procfs(tmp_path, monkeypatch):
+    monkeypatch.setattr(diskstats, "PROC_DISKSTATS", str(tmp_path / "missing"))
+    out = diskstats.DiskStatsSampler().sample()
+    for st in out.values():
+        assert st.read_iops >= 0.0 and 0.0 <= st.util <= 100.0
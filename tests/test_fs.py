@@ -0,0 +1,79 @@
+import threading
+import time
+
+from neonhud.collectors import fs
+
+MOUNTINFO = (
+    "23 28 0:22 / /proc rw,relatime - proc proc rw\n"
+    "28 1 252:0 / / rw,relatime - ext4 /dev/vda rw\n"
+    "40 28 0:50 / /mnt/my\\040share rw - nfs4 srv:/export rw\n"
+    "41 28 0:51 / /mnt/sshfs rw - fuse.sshfs host: rw\n"
+)
+
+
+def test_parse_mountinfo_filters_and_unescapes():
+    mounts = fs.parse_mountinfo(MOUNTINFO, {"ext4"})
+    assert mounts == [
+        ("/", "ext4"),
+        ("/mnt/my share", "nfs4"),
+        ("/mnt/sshfs", "fuse.sshfs"),
+    ]
+
+
+def test_hung_mount_is_marked_and_does_not_block(monkeypatch):
+    release = threading.Event()
+
+    def fake_statvfs(mount):
+        if mount == "/hung":
+            release.wait(5.0)
+        return (50, 100)
+
+    monkeypatch.setattr(fs, "_statvfs_usage", fake_statvfs)
+    col = fs.FilesystemCollector(timeout=0.1, ttl=30.0)
+    monkeypatch.setattr(col._table, "mounts", lambda: [("/", "ext4"), ("/hung", "nfs")])
+
+    t0 = time.monotonic()
+    rows = {r.mount: r for r in col.sample()}
+    assert time.monotonic() - t0 < 1.0
+    assert rows["/"].status == "ok" and rows["/"].percent == 50.0
+    assert rows["/hung"].status == "unresponsive"
+
+    # Still outstanding: served immediately, not resubmitted
+    t0 = time.monotonic()
+    assert {r.mount: r.status for r in col.sample()}["/hung"] == "unresponsive"
+    assert time.monotonic() - t0 < 0.05
+
+    release.set()
+    time.sleep(0.05)
+    assert {r.mount: r.status for r in col.sample()}["/hung"] == "ok"
+
+
+def test_hung_mounts_do_not_starve_healthy_ones(monkeypatch):
+    release = threading.Event()
+
+    def fake_statvfs(mount):
+        if mount.startswith("/hung"):
+            release.wait(5.0)
+        return (50, 100)
+
+    monkeypatch.setattr(fs, "_statvfs_usage", fake_statvfs)
+    workers = 2
+    col = fs.FilesystemCollector(timeout=0.2, ttl=30.0, workers=workers)
+    hung = [(f"/hung{i}", "nfs") for i in range(workers)]
+    # Every worker is stuck in a hung mount before the healthy one is asked
+    monkeypatch.setattr(col._table, "mounts", lambda: hung)
+    col.sample()
+    monkeypatch.setattr(col._table, "mounts", lambda: hung + [("/", "ext4")])
+    try:
+        rows = {r.mount: r.status for r in col.sample()}
+        assert rows["/"] == "ok"
+        assert all(rows[m] == "unresponsive" for m, _ in hung)
+    finally:
+        release.set()
+
+
+def test_sample_real_mounts():
+    rows = fs.sample()
+    assert isinstance(rows, list)
+    for r in rows:
+        assert 0.0 <= r.percent <= 100.0
@@ -0,0 +1,47 @@
+import math
+import struct
+
+from neonhud.utils.gorilla import (
+    GorillaSeries,
+    decode_timestamps,
+    decode_values,
+    encode_block,
+    encode_timestamps,
+    encode_values,
+)
+
+
+def test_timestamps_round_trip_all_buckets():
+    ts = [0, 1000, 2000, 3000, 3001, 4100, 4000, 20_000, 2**40, 5]
+    assert decode_timestamps(encode_timestamps(ts), len(ts)) == ts
+    steady = list(range(0, 1000 * 1000, 1000))
+    # 64 bits for the first point, then ~1 bit per point
+    assert len(encode_timestamps(steady)) < 8 + 8 + len(steady) // 8 + 2
+
+
+def test_values_round_trip_bit_exact():
+    vals = [0.0, -0.0, 1.5, 1.5, math.inf, -1e-300, math.nan, 12.3, 12.4, 2**60]
+    out = decode_values(encode_values(vals), len(vals))
+    assert [struct.pack("<d", v) for v in out] == [struct.pack("<d", v) for v in vals]
+
+
+def test_block_with_decimals_compresses_typical_series():
+    ts = [1_700_000_000_000 + 1000 * i for i in range(1000)]
+    cpu = [
+        round(20 + 10 * math.sin(i / 40) + (i * 7919 % 13) / 10, 1) for i in range(1000)
+    ]
+    block = encode_block(ts, cpu, decimals=1)
+    dts, dvals = block.decode()
+    assert dts == ts and dvals == cpu
+    assert 16 * len(ts) / block.nbytes >= 8
+
+
+def test_series_capacity_and_range():
+    s = GorillaSeries(block_size=10, capacity=25)
+    for i in range(100):
+        s.append(float(i), float(i % 7))
+    assert 25 <= len(s) < 25 + 10
+    newest = list(s.items_newest_first())
+    assert newest[0] == (99.0, 99 % 7) and len(newest) == len(s)
+    assert s.range(80.0, 82.0) == [(80.0, 80 % 7), (81.0, 81 % 7), (82.0, 82 % 7)]
+    assert s.oldest() == newest[-1][0]
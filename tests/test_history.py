@@ -11,3 +11,31 @@ def test_history_buffer_push_and_len():
     assert vals == [2.0, 3.0, 4.0]
     assert h.latest() == 4.0
     assert len(h) == 3
+
+
+def test_history_buffer_running_stats_match_window():
+    import random
+
+    rng = random.Random(7)
+    h = HistoryBuffer(maxlen=5)
+    window = []
+    for _ in range(40):
+        v = rng.uniform(-10.0, 10.0)
+        h.push(v)
+        window = (window + [v])[-5:]
+        assert h.max == max(window)
+        assert h.min == min(window)
+        assert abs(h.mean - sum(window) / len(window)) < 1e-9
+    assert h.values() == window
+
+
+def test_history_buffer_view_and_window():
+    h = HistoryBuffer(maxlen=4)
+    for v in range(6):
+        h.push(v)
+    older, newer = h.view()
+    assert list(older) + list(newer) == [2.0, 3.0, 4.0, 5.0]
+    w = h.window()
+    h.push(9.0)  # snapshot is a copy
+    assert list(w.values) == [2.0, 3.0, 4.0, 5.0]
+    assert (w.min, w.max) == (2.0, 5.0)
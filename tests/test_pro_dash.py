@@ -20,3 +20,45 @@ def test_mem_swap_history_panel_includes_labels():
     text = str(panel)
     assert "Memory" in text
     assert "Swap" in text
+
+
+def test_build_top_reuses_unchanged_panels():
+    from neonhud.ui.cache import PanelCache
+
+    th = get_theme("classic")
+    values = {k: c.fn() for k, c in pro_dash.collectors().items()}
+    cache = PanelCache()
+    updated = {k: 1.0 for k in values}
+
+    first = pro_dash.build_top(th, values, updated=updated, cache=cache)
+    updated2 = dict(updated, cpu=2.0)  # only the CPU collector ran again
+    second = pro_dash.build_top(th, values, updated=updated2, cache=cache)
+
+    a, b = first.renderables, second.renderables
+    assert a[0] is not b[0]
+    assert all(x is y for x, y in zip(a[1:], b[1:]))
+    assert cache.hits == len(values) - 1  # "numa" only on multi-node hosts
+
+    # A stale flag or theme change rebuilds the panel
+    third = pro_dash.build_top(
+        th, values, stale={"procs"}, updated=updated2, cache=cache
+    )
+    procs = 4 if "numa" in values else 3
+    assert third.renderables[procs] is not b[procs]
+
+
+def test_cpu_history_panel_draws_braille_chart():
+    from rich.console import Console
+
+    from neonhud.utils.history import HistoryBuffer
+
+    th = get_theme("classic")
+    hist = HistoryBuffer(maxlen=60)
+    for v in (0.0, 50.0, 100.0, 25.0):
+        hist.push(v)
+    trend = pro_dash._roll_cpu_total.window(60.0, 10, 0.0)
+    data = {"total": 25.0, "hist": hist.window(), "trend": trend}
+    c = Console(record=True, width=60)
+    c.print(pro_dash._cpu_history_panel_ui(th, data))
+    txt = c.export_text()
+    assert any("⠀" < ch <= "⣿" for ch in txt)
@@ -0,0 +1,42 @@
+import os
+
+import pytest
+
+from neonhud.collectors import procfs, procs
+
+pytestmark = pytest.mark.skipif(not procfs.available(), reason="needs Linux /proc")
+
+
+def test_read_stat_and_rss_for_self():
+    st = procfs.read_stat(os.getpid())
+    assert st is not None
+    assert st.cpu_ticks >= 0
+    assert st.start_ticks > 0
+
+    rss = procfs.read_rss(os.getpid())
+    assert rss is not None and rss > 0
+    assert procfs.read_cmdline(os.getpid())
+    assert procfs.read_comm(os.getpid())
+
+
+def test_missing_pid_returns_none():
+    assert procfs.read_stat(2**22 + 1) is None
+    assert procfs.read_rss(2**22 + 1) is None
+    assert procfs.read_comm(2**22 + 1) is None
+    assert procfs.read_cmdline(2**22 + 1) == []
+
+
+def test_procfs_backend_matches_row_shape():
+    rows = procs.sample(limit=5, sort_by="rss", backend="procfs")
+    assert 0 < len(rows) <= 5
+    for row in rows:
+        assert set(row) == {"pid", "name", "cmdline", "cpu_percent", "rss_bytes"}
+        assert 0.0 <= row["cpu_percent"] <= 100.0
+    assert rows == sorted(rows, key=lambda r: r["rss_bytes"], reverse=True)
+
+
+def test_two_phase_selection_keeps_only_limit_rows():
+    everything = procs.sample(limit=0, sort_by="rss", backend="procfs")
+    top = procs.sample(limit=3, sort_by="rss", backend="procfs")
+    assert len(top) == min(3, len(everything))
+    assert len(everything) >= len(top)
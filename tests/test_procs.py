@@ -1,3 +1,5 @@
+import pytest
+
 from neonhud.collectors import procs
 
 
@@ -27,3 +29,63 @@ def test_procs_sample_shape_and_types():
     # Check alternative sort
     rows_rss = procs.sample(limit=5, sort_by="rss")
     assert isinstance(rows_rss, list)
+
+
+def test_process_table_first_sample_and_eviction():
+    import os
+
+    table = procs.ProcessTable(backend="psutil")
+    table.update()
+    assert len(table) > 0
+
+    # First sighting is measured over the process lifetime, not reported as 0.0
+    me = [r for r in table.top(limit=0) if r["pid"] == os.getpid()]
+    assert me and me[0]["cpu_percent"] > 0.0
+
+    # Identity is read once and then served from the cache
+    ident = table.identity(os.getpid())
+    assert ident is not None
+    assert table.identity(os.getpid()) is ident
+
+    # Exited PIDs are evicted on the next update
+    ghost = 2**22 + 1
+    table._entries[ghost] = procs._Entry(ghost, 0.0, None)
+    table.update()
+    assert table.identity(ghost) is None
+
+
+def test_shared_table_is_reused():
+    assert procs.shared_table("psutil") is procs.shared_table("psutil")
+
+
+def test_process_table_update_uses_given_timestamp():
+    import os
+    import time
+
+    table = procs.ProcessTable(backend="psutil")
+    table.update(now=100.0)
+    t0 = time.process_time()
+    while time.process_time() - t0 < 0.05:
+        pass
+    # The caller's clock decides the window: 0.05s of CPU over 1000s is ~0
+    table.update(now=1100.0)
+    me = [r for r in table.top(limit=0) if r["pid"] == os.getpid()]
+    assert me and me[0]["cpu_percent"] < 1.0
+
+
+def test_newly_seen_old_process_is_averaged_over_its_lifetime(monkeypatch):
+    table = procs.ProcessTable(backend="psutil")
+    table._ncpu = 1
+    scans = iter(
+        [
+            [(1, 0.0, 10.0, 0, 7200.0, None)],
+            # pid 2 has run for an hour but was missed by the first scan
+            [(1, 0.0, 11.0, 0, 7202.0, None), (2, 5.0, 36.0, 0, 3600.0, None)],
+        ]
+    )
+    monkeypatch.setattr(table, "_scan", lambda: next(scans))
+    table.update(now=100.0)
+    table.update(now=102.0)
+    cpu = {pid: e.cpu_percent for pid, e in table._entries.items()}
+    assert cpu[1] == pytest.approx(50.0)  # 1s over the 2s interval
+    assert cpu[2] == pytest.approx(1.0)  # 36s over its 3600s lifetime, not 2s
@@ -0,0 +1,78 @@
+import os
+
+import pytest
+
+from neonhud.models.recording import RecordWriter, iter_frames, read_header
+
+
+def test_record_writer_round_trip_and_append(tmp_path):
+    path = str(tmp_path / "m.nhr")
+    cols = ["cpu_total", "mem_percent"]
+    with RecordWriter(path, cols, 1.0, {"host": {"hostname": "x"}}) as w:
+        w.write(100.0, [12.5, 40.0])
+        w.write(101.0, [13.5, 41.0])
+
+    with open(path, "rb") as f:
+        hdr = read_header(f)
+    assert hdr.columns == cols and hdr.interval == 1.0
+    assert hdr.data_offset % 8 == 0 and hdr.frame.size == 16
+    assert hdr.meta["host"] == {"hostname": "x"}
+
+    # A partial frame from a crash is dropped before appending
+    with open(path, "ab") as f:
+        f.write(b"\x01\x02\x03")
+    with RecordWriter(path, cols, 1.0, {}) as w:
+        assert w.frames == 2
+        w.write(102.0, [14.5, 42.0])
+    assert [r[0] for r in iter_frames(path)] == [100.0, 101.0, 102.0]
+    assert list(iter_frames(path))[-1][1:] == (14.5, 42.0)
+
+
+def test_record_writer_rejects_other_columns(tmp_path):
+    path = str(tmp_path / "m.nhr")
+    RecordWriter(path, ["a"], 1.0, {}).close()
+    with pytest.raises(ValueError):
+        RecordWriter(path, ["a", "b"], 1.0, {})
+
+
+def test_record_writer_rejects_other_interval(tmp_path):
+    path = str(tmp_path / "m.nhr")
+    RecordWriter(path, ["a"], 1.0, {}).close()
+    with pytest.raises(ValueError, match="recorded every"):
+        RecordWriter(path, ["a"], 5.0, {})
+
+
+def test_record_writer_refuses_compacted_file(tmp_path):
+    from neonhud.models.recording import compact
+
+    src = str(tmp_path / "m.nhr")
+    dst = str(tmp_path / "m.nhz")
+    with RecordWriter(src, ["a"], 1.0, {}) as w:
+        for i in range(10):
+            w.write(1000.0 + i, [float(i)])
+    compact(src, dst)
+    before = (tmp_path / "m.nhz").read_bytes()
+    with pytest.raises(ValueError, match="compacted"):
+        RecordWriter(dst, ["a"], 1.0, {})
+    assert (tmp_path / "m.nhz").read_bytes() == before
+
+
+def test_compact_round_trip(tmp_path):
+    from neonhud.models.recording import CompressedRecording, compact, open_recording
+
+    src = str(tmp_path / "m.nhr")
+    dst = str(tmp_path / "m.nhz")
+    with RecordWriter(src, ["cpu_total", "net_rx_bps"], 1.0, {}) as w:
+        for i in range(300):
+            w.write(1000.0 + i, [float(i % 50) / 2, float(1000 * (i % 3))])
+    frames, size = compact(
+        src, dst, block_size=64, decimals={"cpu_total": 1, "net_rx_bps": 0}
+    )
+    assert frames == 300 and size < os.path.getsize(src) / 2
+
+    with open_recording(dst) as rec:
+        assert isinstance(rec, CompressedRecording)
+        assert len(rec) == 300 and rec.columns == ["cpu_total", "net_rx_bps"]
+        assert rec.frame(130) == (1130.0, 15.0, 1000.0)
+        assert rec.seek(1200.5) == 200 and rec.seek(0.0) == 0
+        assert rec.values(299)["net_rx_bps"] == 2000.0
@@ -0,0 +1,55 @@
+import pytest
+
+from neonhud.models.recording import Recording, RecordWriter
+from neonhud.services import recorder
+from neonhud.services.replay import ReplaySource, parse_speed, parse_start
+from neonhud.ui import dashboard
+
+
+def _write(path, n, ncpu=2):
+    cols = recorder.columns(ncpu)
+    with RecordWriter(str(path), cols, 1.0, {}) as w:
+        for i in range(n):
+            row = [0.0] * len(cols)
+            row[cols.index("cpu_total")] = float(i % 100)
+            row[cols.index("net_rx_bps")] = 1000.0 * i
+            w.write(1000.0 + i, row)
+
+
+def test_recording_seek_bisects_timestamps(tmp_path):
+    path = tmp_path / "r.nhr"
+    _write(path, 5000)
+    with Recording(str(path)) as rec:
+        assert len(rec) == 5000
+        assert (rec.start, rec.end) == (1000.0, 5999.0)
+        assert rec.seek(1000.0 + 1234.5) == 1234
+        assert rec.seek(0.0) == 0 and rec.seek(1e12) == 4999
+        assert rec.values(42)["cpu_total"] == 42.0
+
+
+def test_parse_speed_and_start(tmp_path):
+    assert parse_speed("1") == 1.0
+    assert parse_speed("10x") == 10.0
+    assert parse_speed("max") is None
+    with pytest.raises(ValueError):
+        parse_speed("-2")
+
+    path = tmp_path / "r.nhr"
+    _write(path, 10)
+    with Recording(str(path)) as rec:
+        assert parse_start("+5", rec) == 1005.0
+        assert parse_start("1003", rec) == 1003.0
+        assert parse_start("1970-01-01T00:16:40Z", rec) == 1000.0
+
+
+def test_replay_source_drives_dashboard_collectors(tmp_path):
+    path = tmp_path / "r.nhr"
+    _write(path, 100)
+    with Recording(str(path)) as rec:
+        source = ReplaySource(rec, speed=10.0, start=1050.0)
+        assert source.interval == pytest.approx(0.1)
+        values = {k: c.fn() for k, c in dashboard.collectors(source).items()}
+        assert values["cpu"]["percent_total"] == 50.0
+        assert len(values["cpu"]["per_cpu"]) == 2
+        assert values["net"]["rx_bps"] == 50000.0
+        assert not source.done
@@ -0,0 +1,33 @@
+import math
+
+from neonhud.utils.rollup import RollupHistory
+
+
+def test_rollup_window_from_tier_has_min_avg_max():
+    h = RollupHistory(raw_len=10, tiers=((10.0, 6), (60.0, 4)))
+    for t in range(60):  # one minute at 1 Hz, values 0..59
+        h.push(float(t), ts=float(t))
+    w = h.window(60.0, 6, now=60.0)
+    assert w.step == 10.0
+    assert list(w.lo) == [0.0, 10.0, 20.0, 30.0, 40.0, 50.0]
+    assert list(w.hi) == [9.0, 19.0, 29.0, 39.0, 49.0, 59.0]
+    assert w.avg[0] == 4.5 and w.peak == 54.5
+
+
+def test_rollup_memory_is_bounded_and_gaps_are_nan():
+    h = RollupHistory(raw_len=5, tiers=((10.0, 4),))
+    for t in range(1000):
+        h.push(1.0, ts=float(t))
+    assert len(h) == 5
+    h.push(2.0, ts=1100.0)  # 100s with no samples
+    w = h.window(40.0, 4, now=1110.0)
+    assert math.isnan(w.avg[0]) and w.avg[-1] == 2.0
+
+
+def test_rollup_short_span_uses_raw_samples():
+    h = RollupHistory(raw_len=100)
+    for t in range(20):
+        h.push(float(t % 2), ts=float(t))
+    w = h.window(10.0, 10, now=19.5)
+    assert w.step == 1.0
+    assert list(w.avg) == [0.0, 1.0] * 5
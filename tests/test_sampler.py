@@ -0,0 +1,138 @@
+import time
+
+from neonhud.services.sampler import (
+    ONCE,
+    Collector,
+    RunningStats,
+    Sampler,
+    apply_cadence,
+)
+
+
+def test_sampler_publishes_frames_in_background():
+    calls = {"n": 0}
+
+    def counter():
+        calls["n"] += 1
+        return calls["n"]
+
+    with Sampler({"count": counter}, interval=0.02) as s:
+        first = s.wait(0, timeout=2.0)
+        assert first is not None and first.seq >= 1
+        second = s.wait(first.seq, timeout=2.0)
+        assert second is not None and second.seq > first.seq
+        assert second.values["count"] > first.values["count"]
+
+    stats = s.stats()
+    assert stats.ticks >= 2
+    assert "count" in stats.latency
+
+
+def test_failing_collector_keeps_last_value():
+    state = {"fail": False}
+
+    def flaky():
+        if state["fail"]:
+            raise RuntimeError("boom")
+        return 42
+
+    s = Sampler({"flaky": flaky}, interval=1.0)
+    assert s.tick().values["flaky"] == 42
+    state["fail"] = True
+    assert s.tick().values["flaky"] == 42
+
+
+def test_slow_collector_counts_skipped_ticks():
+    with Sampler({"slow": lambda: time.sleep(0.05)}, interval=0.01) as s:
+        time.sleep(0.2)
+    assert s.stats().skipped > 0
+
+
+def test_per_collector_cadence_and_once():
+    runs = {"fast": 0, "slow": 0, "host": 0}
+
+    def make(name):
+        def fn():
+            runs[name] += 1
+            return runs[name]
+
+        return fn
+
+    specs = {
+        "fast": Collector(make("fast"), period=0.02),
+        "slow": Collector(make("slow"), period=0.2),
+        "host": Collector(make("host"), period=ONCE),
+    }
+    with Sampler(specs, interval=0.02) as s:
+        time.sleep(0.3)
+        frame = s.latest()
+
+    assert runs["host"] == 1
+    assert 1 <= runs["slow"] <= 3
+    assert runs["fast"] > 3 * runs["slow"]
+    # Cached values are served between runs
+    assert frame is not None and frame.values["host"] == 1
+    assert frame.updated["host"] <= frame.updated["fast"]
+
+
+def test_coalesced_collectors_share_wakeups():
+    runs = {"a": 0, "b": 0}
+
+    def make(name):
+        def fn():
+            runs[name] += 1
+            return runs[name]
+
+        return fn
+
+    with Sampler(
+        {"a": Collector(make("a"), 0.05), "b": Collector(make("b"), 0.05)},
+        interval=1.0,
+    ) as s:
+        s.wait(0, timeout=2.0)
+        time.sleep(0.12)
+    # One published frame per shared wakeup, not one per collector
+    ticks = s.stats().ticks
+    assert ticks >= 1
+    assert runs["a"] == runs["b"]
+    assert runs["a"] + runs["b"] == 2 * ticks
+
+
+def test_apply_cadence_overrides():
+    specs = {"cpu": Collector(lambda: 0), "host": Collector(lambda: 0)}
+    out = apply_cadence(specs, {"cpu": 0.5, "host": "once", "nope": 1, "x": "bad"})
+    assert out["cpu"].period == 0.5
+    assert out["host"].period == ONCE
+    assert set(out) == {"cpu", "host"}
+
+
+def test_frame_budget_defers_slow_collector():
+    runs = {"cpu": 0}
+
+    def cpu():
+        runs["cpu"] += 1
+        return runs["cpu"]
+
+    specs = {
+        "cpu": Collector(cpu, period=0.02, critical=True),
+        "slow": Collector(lambda: time.sleep(0.15) or "done", period=0.02),
+    }
+    with Sampler(specs, interval=0.02, frame_budget=0.01) as s:
+        first = s.wait(0, timeout=1.0)
+        time.sleep(0.3)
+        last = s.latest()
+
+    # The cheap critical collector kept its cadence despite the slow one
+    assert runs["cpu"] >= 8
+    assert first is not None and "slow" in first.stale
+    assert last is not None and last.values.get("slow") == "done"
+    assert s.stats().deferred > 0
+
+
+def test_running_stats_prediction():
+    st = RunningStats()
+    for x in (0.01, 0.012, 0.011, 0.05):
+        st.push(x)
+    assert st.count == 4
+    assert st.max == 0.05
+    assert st.predict() > st.mean > 0.01
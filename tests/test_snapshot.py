@@ -48,3 +48,22 @@ def test_snapshot_shape_and_types():
 
     # Ensure JSON-serializable
     json.dumps(snap)
+
+
+def test_snapshot_window_has_rates():
+    snap = snapshot.build(window=0.05)
+    assert snap["schema"] == "neonhud.report.v1"
+    rates = snap["rates"]
+    assert rates["interval"] >= 0.05
+    for k in ("disk_read_bps", "disk_write_bps", "net_rx_bps", "net_tx_bps"):
+        assert rates[k] >= 0.0
+    assert isinstance(rates["processes"], list)
+    assert all("cpu_percent" in p for p in rates["processes"])
+    json.dumps(snap)
+
+
+def test_snapshot_topology_block():
+    snap = snapshot.build()
+    topo = snap["topology"]
+    assert len(topo["nodes"]) >= 1 and len(topo["sockets"]) >= 1
+    assert sum(n["cpus"] for n in topo["nodes"]) == len(snap["cpu"]["per_cpu"])
@@ -19,3 +19,38 @@ def test_sparkline_monotonic_maps_full_range():
     s = sparkline(vals)
     assert len(s) == len(vals)
     assert s[-1] == DEFAULT_CHARS[-1]  # last should hit top glyph
+
+
+def test_sparkline_precomputed_peak():
+    from array import array
+
+    vals = array("d", [1.0, 2.0, 4.0])
+    assert sparkline(vals, peak=4.0) == sparkline([1, 2, 4])
+    # A higher peak scales everything down; trimming ignores the peak
+    assert sparkline(vals, peak=8.0)[-1] != DEFAULT_CHARS[-1]
+    assert sparkline(vals, max_width=2, peak=8.0)[-1] == DEFAULT_CHARS[-1]
+
+
+def test_sparkline_width_downsamples_and_keeps_spikes():
+    from neonhud.utils.spark import downsample
+
+    vals = [1.0] * 1000
+    vals[517] = 50.0
+    s = sparkline(vals, width=40)
+    assert len(s) == 40
+    assert DEFAULT_CHARS[-1] in s  # the single spike survives
+    assert downsample([3.0, 1.0, 2.0], 10) == [3.0, 1.0, 2.0]
+
+
+def test_spark_cache_shift_matches_full_render():
+    from neonhud.utils.history import HistoryBuffer
+    from neonhud.utils.spark import SparkCache
+
+    buf = HistoryBuffer(maxlen=8)
+    cache = SparkCache()
+    buf.push(10.0)  # fixed peak, so later renders take the shift path
+    for i in range(20):
+        buf.push(float(i % 7))
+        w = buf.window()
+        assert cache.render("cpu", w) == sparkline(w.values, peak=w.max)
+    assert cache.render("cpu", w) is cache.render("cpu", w)
@@ -0,0 +1,42 @@
+import os
+import subprocess
+import sys
+
+# Cold import budget for everything `neonhud report` loads (measured ~40ms
+# on a laptop; the margin absorbs slow CI machines, not new dependencies)
+REPORT_IMPORT_BUDGET_MS = 150.0
+
+
+def _importtime(code: str):
+    env = {k: v for k, v in os.environ.items() if k != "NEONHUD_LOG_RICH"}
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        capture_output=True,
+        text=True,
+        check=True,
+        env=env,
+    )
+    rows = []
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line.split("|")
+        rows.append((name[1:].rstrip(), int(cumulative)))  # nested names indent
+    return rows
+
+
+def test_report_path_skips_rich_and_ui():
+    rows = _importtime("from neonhud import cli; from neonhud.models import snapshot")
+    names = {name.strip() for name, _ in rows}
+    assert "neonhud.cli" in names
+    assert not [n for n in names if n == "rich" or n.startswith("rich.")]
+    assert not [n for n in names if n.startswith("neonhud.ui")]
+
+
+def test_report_import_budget():
+    code = "from neonhud import cli; from neonhud.models import snapshot"
+    best = min(
+        sum(us for name, us in _importtime(code) if name.startswith("neonhud"))
+        for _ in range(3)
+    )
+    assert best / 1000.0 < REPORT_IMPORT_BUDGET_MS
@@ -0,0 +1,24 @@
+from neonhud.models.stream import DeltaEncoder, apply, diff
+
+
+def test_diff_nested_and_removed():
+    prev = {"a": 1, "b": {"x": 1, "y": [1, 2]}, "gone": 3}
+    curr = {"a": 1, "b": {"x": 2, "y": [1, 2]}, "new": 4}
+    assert diff(prev, curr) == {"b": {"x": 2}, "new": 4, "gone": None}
+
+
+def test_encoder_keyframes_and_roundtrip():
+    enc = DeltaEncoder(keyframe_every=3)
+    snaps = [
+        {"ts": i, "cpu": {"total": float(i % 2), "per_cpu": [i % 2]}, "host": "h"}
+        for i in range(7)
+    ]
+    lines = [enc.encode(s) for s in snaps]
+    assert [ln["key"] for ln in lines] == [True, False, False, True, False, False, True]
+    assert [ln["seq"] for ln in lines] == list(range(1, 8))
+    assert "host" not in lines[1]
+
+    state: dict = {}
+    for snap, line in zip(snaps, lines):
+        state = apply(state, line)
+        assert state == snap
@@ -8,3 +8,18 @@ def test_get_theme_known_and_unknown():
 
     default = theme.get_theme("unknown")
     assert default == theme.CLASSIC
+
+
+def test_theme_styles_compiled_once():
+    from rich.style import Style
+
+    th = theme.get_theme("cyberpunk")
+    st = th.styles
+    assert st is th.styles  # cached per theme
+    assert st.primary == Style.parse("bold magenta")
+    assert st.hot.bold and st.hot.color == Style.parse(th.warning).color
+
+    # themes is an alias of the same registry
+    from neonhud.ui import themes
+
+    assert themes.get_theme("cyberpunk") is th
@@ -0,0 +1,51 @@
+from neonhud.collectors import topology
+
+
+def _fake_sysfs(tmp_path, monkeypatch):
+    cpu = tmp_path / "cpu"
+    node = tmp_path / "node"
+    (cpu).mkdir()
+    (cpu / "online").write_text("0-3\n")
+    for c, pkg in enumerate([0, 0, 1, 1]):
+        d = cpu / f"cpu{c}" / "topology"
+        d.mkdir(parents=True)
+        d.joinpath("physical_package_id").write_text(f"{pkg}\n")
+    for n, cpulist in enumerate(["0,2", "1,3"]):
+        d = node / f"node{n}"
+        d.mkdir(parents=True)
+        d.joinpath("cpulist").write_text(cpulist + "\n")
+        d.joinpath("meminfo").write_text(
+            f"Node {n} MemTotal:       1000 kB\n"
+            f"Node {n} MemFree:         400 kB\n"
+            f"Node {n} FilePages:       100 kB\n"
+            f"Node {n} SReclaimable:      0 kB\n"
+        )
+    monkeypatch.setattr(topology, "SYS_CPU", str(cpu))
+    monkeypatch.setattr(topology, "SYS_NODE", str(node))
+    monkeypatch.setattr(topology, "_CACHED", None)
+
+
+def test_parse_cpulist():
+    assert topology.parse_cpulist("0-2,5,7-8\n") == [0, 1, 2, 5, 7, 8]
+    assert topology.parse_cpulist("") == []
+
+
+def test_topology_groups_and_aggregation(tmp_path, monkeypatch):
+    _fake_sysfs(tmp_path, monkeypatch)
+    topo = topology.topology()
+    assert [g.pos for g in topo.nodes] == [(0, 2), (1, 3)]
+    assert [g.cpus for g in topo.sockets] == [(0, 1), (2, 3)]
+    assert topology.cpu_groups() == [("N0", (0, 2)), ("N1", (1, 3))]
+    assert topology.cpu_groups(ncpu=8) == []  # not this host's CPUs
+
+    data = topology.sample([10.0, 20.0, 30.0, 40.0])
+    assert [n["cpu_percent"] for n in data["nodes"]] == [20.0, 30.0]
+    assert [s["cpu_percent"] for s in data["sockets"]] == [15.0, 35.0]
+    node0 = data["nodes"][0]
+    assert node0["mem_total"] == 1000 * 1024
+    assert node0["mem_used"] == 500 * 1024
+    assert node0["mem_percent"] == 50.0
+
+    # Cached: sysfs is not read again for a matching CPU count
+    monkeypatch.setattr(topology, "SYS_CPU", str(tmp_path / "missing"))
+    assert topology.topology(4) is topo